@@ -1,122 +1,363 @@
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, request, Response, stream_with_context, g
+from functools import wraps
+import csv
+import datetime
+import hashlib
+import itertools
+import time
 from flask_cors import CORS
 from dotenv import load_dotenv
 import os
 
-from sheets_connector import SheetsConnector
-from sports import chess, badminton, basketball, table_tennis, carrom, pool, throwball, foosball, volleyball, esports_fifa, esports_valo, box_cricket, football, pickleball, squash, lawn_tennis
-from cultural import group_skit, group_dance, group_musical, roast_comedy, quiz, rotating_art, meme_wars, beg_borrow_steal
+from connectors import create_connector
+from event_registry import EventRegistry
+from event_metadata import EventMetadata
+from fixture_store import FixtureNotFoundError
 from points_calculator import calculate_standings
+from leaderboard import Leaderboard
+from standings_engine import StandingsEngine
+from live_updates import Broadcaster, GLOBAL_CHANNEL, event_channel
+import swiss
+import export
+import match_import
+import scheduler
+import instrumentation
 
 load_dotenv()
 
 app = Flask(__name__)
 CORS(app)
 
-sheets = SheetsConnector()
-
-# Sports event modules mapping
-SPORTS_MODULES = {
-    'chess': chess,
-    'badminton': badminton,
-    'basketball': basketball,
-    'table-tennis': table_tennis,
-    'carrom': carrom,
-    'pool': pool,
-    'throwball': throwball,
-    'foosball': foosball,
-    'volleyball': volleyball,
-    'esports-fifa': esports_fifa,
-    'esports-valo': esports_valo,
-    'box-cricket': box_cricket,
-    'football': football,
-    'pickleball': pickleball,
-    'squash': squash,
-    'lawn-tennis': lawn_tennis,
-}
-
-# Cultural event modules mapping
-CULTURAL_MODULES = {
-    'group-skit': group_skit,
-    'group-dance': group_dance,
-    'group-musical': group_musical,
-    'roast-comedy': roast_comedy,
-    'quiz': quiz,
-    'rotating-art': rotating_art,
-    'meme-wars': meme_wars,
-    'beg-borrow-steal': beg_borrow_steal,
-}
+# Timing spans for Sheets calls and module hooks, reported as Server-Timing and /api/metrics
+SERVER_TIMING = os.getenv('SERVER_TIMING', 'true').lower() == 'true'
+profiler = instrumentation.SamplingProfiler()
+
+sheets = create_connector(instrument=True)
+standings_engine = StandingsEngine()
+broadcaster = Broadcaster()
+
+# Largest bulk match import accepted in one request
+BULK_MATCH_MAX_ROWS = int(os.getenv('BULK_MATCH_MAX_ROWS', 1000))
+
+# Sport and cultural event modules, imported on first use
+events = EventRegistry(wrap_hook=lambda hook, function: instrumentation.timed(f'module.{hook}', function))
+
+def event_medal_weights(event_id):
+    return events.get(event_id).medal_weights
+
+# Rules, form and table structures, serialized and gzipped once
+event_metadata = EventMetadata(events)
+EVENT_METADATA_MAX_AGE = int(os.getenv('EVENT_METADATA_MAX_AGE', 86400))
+
+# Overall/sports/cultural tables, derived from every event sheet
+leaderboard = Leaderboard(events.categories(), weights=event_medal_weights)
+
+# The in-memory backend gets a tab per event, as in the real spreadsheet, and
+# optionally a synthetic tournament (MEMORY_SEED=<random seed>)
+if os.getenv('MEMORY_SEED') and hasattr(sheets, 'seed_tournament'):
+    sheets.seed_tournament(
+        events.event_ids(),
+        divisions=int(os.getenv('MEMORY_SEED_DIVISIONS', 5)),
+        matches_per_event=int(os.getenv('MEMORY_SEED_MATCHES', 20)),
+        fixtures_per_event=int(os.getenv('MEMORY_SEED_FIXTURES', 10)),
+        seed=int(os.getenv('MEMORY_SEED'))
+    )
+elif hasattr(sheets, 'add_event_sheets'):
+    sheets.add_event_sheets(events.event_ids())
+
+def get_leaderboard():
+    """Refresh the leaderboard from all event sheets (one batched read, served from cache within the TTL)"""
+    leaderboard.refresh(sheets.get_all_event_standings(list(leaderboard.categories)))
+    return leaderboard
+
+def leaderboard_revision():
+    return get_leaderboard().revision
+
+def warm_up():
+    """
+    Load what the first requests would otherwise load: every event module and
+    its metadata, the event sheets, Matches and Fixtures (cached and indexed)
+    and the leaderboard. Run in the preloading master (wsgi.py), so forked
+    workers start warm and share these pages copy-on-write.
+    """
+    for event_id in events.event_ids():
+        events.get(event_id)
+    event_metadata.warm()
+    get_leaderboard()
+    sheets.get_match_store()
+    sheets.get_fixture_store()
+    if sheets.write_queue:
+        # Writes replayed from journals go out before workers fork
+        sheets.write_queue.flush()
+
+@app.before_request
+def start_timing():
+    g.request_started = time.perf_counter()
+    instrumentation.start_request()
+    g.profiler = profiler.start()
+
+@app.after_request
+def finish_timing(response):
+    if g.get('profiler'):
+        profiler.stop(g.profiler, f'{request.method}-{request.path}')
+    elapsed = time.perf_counter() - g.request_started
+    spans = instrumentation.finish_request()
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    instrumentation.REQUEST_SECONDS.observe((request.method, route, str(response.status_code)), elapsed)
+    if SERVER_TIMING:
+        response.headers['Server-Timing'] = instrumentation.server_timing(spans, elapsed)
+    return response
+
+def conditional(*ranges):
+    """
+    Serve GET responses with an ETag derived from the revisions of the sheet
+    ranges they are built from, answering 304 to a matching If-None-Match
+    without recomputing or re-serializing the payload
+    
+    Each range is a sheet range or a callable returning a revision string.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                revisions = ','.join(
+                    range_name() if callable(range_name) else sheets.get_revision(range_name)
+                    for range_name in ranges
+                )
+            except Exception as e:
+                return jsonify({'error': str(e)}), 500
+            etag = hashlib.md5(f'{request.full_path}|{revisions}'.encode()).hexdigest()
+            
+            if request.if_none_match.contains(etag):
+                response = app.response_class(status=304)
+                response.set_etag(etag)
+                return response
+            
+            response = app.make_response(view(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+            return response
+        return wrapper
+    return decorator
+
+def static_response(payload):
+    """Serve a pre-rendered StaticPayload, gzipped when the client accepts it"""
+    gzipped = request.accept_encodings['gzip'] > 0
+    etag = f'{payload.etag}-gzip' if gzipped else payload.etag
+    
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(payload.gzipped if gzipped else payload.body, mimetype='application/json')
+        if gzipped:
+            response.headers['Content-Encoding'] = 'gzip'
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.cache_control.public = True
+    response.cache_control.max_age = EVENT_METADATA_MAX_AGE
+    return response
+
+def publish_event_standings(event_id):
+    """Push standings changes for an event to its live subscribers"""
+    channel = event_channel(event_id)
+    handlers = events.get(event_id)
+    if handlers and broadcaster.has_subscribers(channel):
+        standings = standings_engine.get_standings(event_id, handlers, sheets.get_match_store())
+        broadcaster.publish_diff(channel, 'standings', standings, 'division')
+    broadcaster.publish(GLOBAL_CHANNEL, 'event-updated', {'eventId': event_id})
+
+def publish_event_fixtures(event_id):
+    """Push fixture changes for an event to its live subscribers"""
+    channel = event_channel(event_id)
+    if broadcaster.has_subscribers(channel):
+        broadcaster.publish_diff(channel, 'fixtures', sheets.get_event_fixtures(event_id), 'id')
+    broadcaster.publish(GLOBAL_CHANNEL, 'event-updated', {'eventId': event_id})
+
+def publish_medal_standings(event_id):
+    """Push medal table changes for an event and the overall tables"""
+    channel = event_channel(event_id)
+    rows = sheets.get_event_standings(event_id)  # update_event_score wrote through to the cached range
+    if broadcaster.has_subscribers(channel):
+        weights = leaderboard.event_weights(event_id) if event_id in events else None
+        medals = calculate_standings(rows, weights=weights)
+        broadcaster.publish_diff(channel, 'medals', medals, 'division')
+    if broadcaster.has_subscribers(GLOBAL_CHANNEL):
+        if leaderboard.loaded:
+            # Only this event changed; fold it in without re-reading the other sheets
+            leaderboard.refresh({event_id: rows})
+            board = leaderboard
+        else:
+            board = get_leaderboard()
+        for table in ('overall', 'sports', 'cultural'):
+            broadcaster.publish_diff(GLOBAL_CHANNEL, table, board.standings(table), 'division')
+
+def publish_safely(publisher, event_id):
+    """Live updates are best-effort and must never fail the write that triggered them"""
+    try:
+        publisher(event_id)
+    except Exception as e:
+        print(f"Live update for {event_id} failed: {e}")
+
+@app.route('/api/metrics', methods=['GET'])
+def metrics():
+    """Prometheus metrics: per-route latency, span timings and Sheets API call counts"""
+    return Response(instrumentation.render_metrics(), mimetype='text/plain; version=0.0.4')
+
+@app.route('/api/stream', methods=['GET'])
+def stream():
+    """
+    Server-Sent Events stream of live updates
+    
+    Query params:
+        event: Optional event id; adds that event's standings/fixtures/medals channel
+               to the global channel
+    """
+    channels = [GLOBAL_CHANNEL]
+    event_id = request.args.get('event')
+    if event_id:
+        channels.append(event_channel(event_id))
+    
+    return Response(
+        stream_with_context(broadcaster.stream(channels)),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 @app.route('/api/standings', methods=['GET'])
+@conditional(leaderboard_revision)
 def get_standings():
-    """Get overall standings"""
+    """Get overall standings, aggregated from all event sheets"""
     try:
-        raw_data = sheets.get_overall_standings()
-        standings = calculate_standings(raw_data)
+        standings = get_leaderboard().standings('overall', request.args.get('ranking', 'competition'))
         return jsonify(standings)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/standings/sports', methods=['GET'])
+@conditional(leaderboard_revision)
 def get_sports_standings():
-    """Get sports-only standings"""
+    """Get sports-only standings, aggregated from all event sheets"""
     try:
-        raw_data = sheets.get_sports_standings()
-        standings = calculate_standings(raw_data)
+        standings = get_leaderboard().standings('sports', request.args.get('ranking', 'competition'))
         return jsonify(standings)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/standings/cultural', methods=['GET'])
+@conditional(leaderboard_revision)
 def get_cultural_standings():
-    """Get cultural-only standings"""
+    """Get cultural-only standings, aggregated from all event sheets"""
     try:
-        raw_data = sheets.get_cultural_standings()
-        standings = calculate_standings(raw_data)
+        standings = get_leaderboard().standings('cultural', request.args.get('ranking', 'competition'))
         return jsonify(standings)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/dashboard', methods=['GET'])
+@conditional(leaderboard_revision)
+def get_dashboard():
+    """Get overall, sports and cultural standings in a single response"""
+    try:
+        board = get_leaderboard()
+        ranking = request.args.get('ranking', 'competition')
+        return jsonify({
+            'overall': board.standings('overall', ranking),
+            'sports': board.standings('sports', ranking),
+            'cultural': board.standings('cultural', ranking),
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/standings/contributions', methods=['GET'])
+@conditional(leaderboard_revision)
+def get_standings_contributions():
+    """
+    Get the per-event medals and points behind the leaderboards
+    
+    Query params:
+        division: Optional division to restrict to
+    """
+    try:
+        contributions = get_leaderboard().contributions(request.args.get('division'))
+        return jsonify({'contributions': contributions})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/export/<kind>', methods=['GET'])
+def export_data(kind):
+    """
+    Stream matches, fixtures or per-event standings as NDJSON or CSV
+    
+    Query params:
+        format: 'ndjson' (default) or 'csv'
+        event: Event ids, comma-separated or repeated; defaults to every event
+        division: Only rows involving this division
+        from, to: Inclusive date range (YYYY-MM-DD); not applied to standings
+    """
+    try:
+        if kind not in export.FIELDS:
+            return jsonify({'error': f'Unknown export: {kind}; choose from {list(export.FIELDS)}'}), 404
+        format_name = request.args.get('format', 'ndjson')
+        if format_name not in export.FORMATS:
+            return jsonify({'error': f'Unknown format: {format_name}; choose from {list(export.FORMATS)}'}), 400
+        
+        event_ids = [
+            event_id for value in request.args.getlist('event') for event_id in value.split(',') if event_id
+        ] or events.event_ids()
+        unknown = [event_id for event_id in event_ids if event_id not in events]
+        if unknown:
+            return jsonify({'error': f'Unknown events: {unknown}'}), 404
+        
+        dates = {}
+        for param in ('from', 'to'):
+            value = request.args.get(param)
+            if value:
+                try:
+                    dates[param] = datetime.date.fromisoformat(value).isoformat()
+                except ValueError:
+                    return jsonify({'error': f'{param} must be a YYYY-MM-DD date'}), 400
+        filters = export.Filters(request.args.get('division'), dates.get('from'), dates.get('to'))
+        
+        # Load the source up front so failures are reported before streaming starts
+        if kind == 'matches':
+            rows = export.iter_matches(sheets.get_match_store(), event_ids, filters)
+        elif kind == 'fixtures':
+            rows = export.iter_fixtures(sheets.get_fixture_store(), event_ids, filters)
+        else:
+            rows = export.iter_standings(get_leaderboard(), event_ids, filters)
+        
+        extension = 'csv' if format_name == 'csv' else 'ndjson'
+        return Response(
+            stream_with_context(export.render(rows, kind, format_name)),
+            mimetype=export.FORMATS[format_name],
+            headers={'Content-Disposition': f'attachment; filename={kind}.{extension}'}
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/event/<event_id>/standings', methods=['GET'])
+@conditional('Matches!A2:H')
 def get_event_standings(event_id):
     """Get standings for a specific event"""
     try:
-        # Get match data
-        matches = sheets.get_event_matches(event_id)
-        
         # Get calculation logic from sport/cultural module
-        module = SPORTS_MODULES.get(event_id) or CULTURAL_MODULES.get(event_id)
+        handlers = events.get(event_id)
         
-        if not module:
+        if not handlers:
             return jsonify({'error': 'Event not found'}), 404
         
-        # Calculate standings from matches
-        divisions_data = {}
-        for match in matches:
-            team = match['team']
-            if team not in divisions_data:
-                divisions_data[team] = {'matches': []}
-            divisions_data[team]['matches'].append(match)
-        
-        standings = []
-        for division, data in divisions_data.items():
-            stats = module.calculate_division_points(data)
-            standings.append({
-                'division': division,
-                **stats
-            })
-        
-        # Get table structure
-        table_structure = module.get_table_structure() if hasattr(module, 'get_table_structure') else None
+        # Running per-division aggregates, updated with matches added since the last read
+        standings = standings_engine.get_standings(event_id, handlers, sheets.get_match_store())
         
         return jsonify({
             'standings': standings,
-            'table_structure': table_structure
+            'table_structure': handlers.table_structure
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/event/<event_id>/matches', methods=['GET'])
+@conditional('Matches!A2:H')
 def get_event_matches(event_id):
     """Get all matches for a specific event"""
     try:
@@ -126,6 +367,7 @@ def get_event_matches(event_id):
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/event/<event_id>/fixtures', methods=['GET'])
+@conditional(lambda: sheets.get_event_fixtures_revision(request.view_args['event_id']))
 def get_event_fixtures(event_id):
     """Get fixtures for a specific event"""
     try:
@@ -138,13 +380,12 @@ def get_event_fixtures(event_id):
 def get_event_rules(event_id):
     """Get rules for a specific event"""
     try:
-        # Get rules from sport/cultural module
-        module = SPORTS_MODULES.get(event_id) or CULTURAL_MODULES.get(event_id)
-        if not module:
+        # Rules from the sport/cultural module, rendered once
+        payload = event_metadata.rules(event_id)
+        if not payload:
             return jsonify({'error': 'Event not found'}), 404
         
-        rules = module.get_rules()
-        return jsonify({'rules': rules})
+        return static_response(payload)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -152,27 +393,143 @@ def get_event_rules(event_id):
 def get_form_structure(event_id):
     """Get the form structure for a specific event"""
     try:
-        module = SPORTS_MODULES.get(event_id) or CULTURAL_MODULES.get(event_id)
-        if not module:
+        # Module's custom form structure, or the default match form, rendered once
+        payload = event_metadata.form_structure(event_id)
+        if not payload:
             return jsonify({'error': 'Event not found'}), 404
         
-        # Check if module has custom form structure
-        if hasattr(module, 'get_form_structure'):
-            form_structure = module.get_form_structure()
-        else:
-            # Default form structure
-            form_structure = {
-                'type': 'match',
-                'fields': [
-                    {'name': 'team1', 'label': 'Team 1', 'type': 'select', 'required': True},
-                    {'name': 'team2', 'label': 'Team 2', 'type': 'select', 'required': True},
-                    {'name': 'result', 'label': 'Result', 'type': 'select', 'options': ['win', 'loss', 'draw'], 'required': True},
-                    {'name': 'match_points', 'label': 'Match Points', 'type': 'number'},
-                    {'name': 'game_points', 'label': 'Game Points', 'type': 'number'}
-                ]
-            }
+        return static_response(payload)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/events/metadata', methods=['GET'])
+def get_events_metadata():
+    """Get category, rules, form structure and table structure of every event in one response"""
+    try:
+        return static_response(event_metadata.all())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/event/<event_id>/pairings', methods=['POST'])
+def generate_pairings(event_id):
+    """
+    Pair the next Swiss round from recorded results and save it as fixtures
+    
+    Body:
+        date, time, venue: Applied to every fixture of the round
+        divisions: Optional list of divisions; defaults to everyone who has played
+        round: Optional round number; defaults to one after the last recorded round
+    
+    Returns 409 while any fixture of the event is still scheduled (unplayed).
+    The division given the bye is recorded in Matches as winning the round.
+    """
+    try:
+        handlers = events.get(event_id)
+        if not handlers:
+            return jsonify({'error': 'Event not found'}), 404
+        if handlers.pairing_system != 'swiss':
+            return jsonify({'error': 'Event does not use Swiss pairings'}), 400
         
-        return jsonify(form_structure)
+        data = request.json or {}
+        matches = sheets.get_event_matches(event_id)
+        fixtures = sheets.get_event_fixtures(event_id)
+        
+        unplayed = [f['id'] for f in fixtures if f['status'] == 'scheduled']
+        if unplayed:
+            return jsonify({'error': 'The current round has unplayed fixtures', 'fixtures': unplayed}), 409
+        
+        divisions = data.get('divisions') or sorted(
+            {m['team'] for m in matches} | {f['division1'] for f in fixtures}
+            | {f['division2'] for f in fixtures if f['division2'] != swiss.BYE}
+        )
+        if len(divisions) < 2:
+            return jsonify({'error': 'At least two divisions are required'}), 400
+        
+        round_num = data.get('round') or max([m['round'] for m in matches] or [0]) + 1
+        standings = standings_engine.get_standings(event_id, handlers, sheets.get_match_store())
+        scores = {row['division']: row['match_points'] for row in standings}
+        result = swiss.pair_round(swiss.build_players(divisions, matches, fixtures, scores))
+        
+        base = {'eventId': event_id, 'date': data.get('date', ''), 'time': data.get('time', ''), 'venue': data.get('venue', '')}
+        new_fixtures = [
+            {**base, 'division1': pairing['white'], 'division2': pairing['black']}
+            for pairing in result['pairings']
+        ]
+        if result['bye']:
+            new_fixtures.append({**base, 'division1': result['bye'], 'division2': swiss.BYE, 'status': 'bye'})
+        
+        sheets.add_fixtures(new_fixtures)
+        if result['bye']:
+            # The bye scores as a win and records the round number in Matches
+            sheets.add_bye({
+                'eventId': event_id, 'team1': result['bye'], 'team2': swiss.BYE, 'result': 'win',
+                'match_points': handlers.calculate_match_points('win'), 'game_points': 1,
+                'date': base['date'], 'round': round_num
+            })
+            publish_safely(publish_event_standings, event_id)
+        publish_safely(publish_event_fixtures, event_id)
+        
+        return jsonify({'success': True, 'round': round_num, **result})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/event/<event_id>/schedule', methods=['POST'])
+def generate_schedule(event_id):
+    """
+    Generate a full round-robin or knockout draw, schedule it and save it as fixtures
+    
+    Body:
+        format: 'round-robin' (default) or 'knockout' (seeded in `divisions` order)
+        divisions: Optional list of divisions; defaults to the event sheet's divisions
+        dates: Dates to play on, in order
+        start, end: Daily window, e.g. '09:00' and '17:00'
+        slot_minutes: Match length (default 60)
+        venues: Venues the event may use; fixtures of other events there are respected
+        capacity: Concurrent matches per venue (default 1)
+        rest_minutes: Minimum gap between two matches of a division (default 0)
+    """
+    try:
+        if event_id not in events:
+            return jsonify({'error': 'Event not found'}), 404
+        
+        data = request.json or {}
+        divisions = data.get('divisions') or [row[0] for row in sheets.get_event_standings(event_id) if row and row[0]]
+        if len(divisions) < 2:
+            return jsonify({'error': 'At least two divisions are required'}), 400
+        
+        try:
+            matches = scheduler.generate(data.get('format', 'round-robin'), divisions)
+            timetable = scheduler.Timetable(
+                data.get('dates') or [],
+                data.get('start', '09:00'),
+                data.get('end', '17:00'),
+                int(data.get('slot_minutes', 60)),
+                data.get('venues') or [],
+                capacity=int(data.get('capacity', 1)),
+                rest_minutes=int(data.get('rest_minutes', 0)),
+            )
+            timetable.book_fixtures(sheets.get_fixture_store().all_fixtures(), set(divisions))
+            scheduled = scheduler.schedule(matches, timetable)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        
+        fixtures = sheets.add_fixtures([{
+            'eventId': event_id,
+            'division1': match['division1'],
+            'division2': match['division2'],
+            'date': match['date'],
+            'time': match['time'],
+            'venue': match['venue'],
+        } for match in scheduled])
+        publish_safely(publish_event_fixtures, event_id)
+        
+        return jsonify({
+            'success': True,
+            'fixtures': [
+                {**fixture, 'round': match['round'], 'match': match['match']}
+                for fixture, match in zip(fixtures, scheduled)
+            ]
+        })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -180,23 +537,61 @@ def get_form_structure(event_id):
 def add_match():
     """Add a new match result"""
     try:
-        data = request.json
-        event_id = data.get('eventId')
-        
-        # Validate with sport/cultural specific logic
-        module = SPORTS_MODULES.get(event_id) or CULTURAL_MODULES.get(event_id)
-        if module and hasattr(module, 'validate_match'):
-            is_valid, error = module.validate_match(data)
-            if not is_valid:
-                return jsonify({'error': error}), 400
+        # Same checks as bulk imports, including the sport/cultural specific logic
+        matches, errors = match_import.validate_matches([request.json], events)
+        if errors:
+            return jsonify({'error': errors[0]['error']}), 400
+        data = matches[0]
+        event_id = data['eventId']
         
         # Add match to sheets
         result = sheets.add_match(data)
+        publish_safely(publish_event_standings, event_id)
         
         return jsonify({'success': True, 'match': result})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/match/bulk', methods=['POST'])
+def add_matches_bulk():
+    """
+    Import many match results in one request
+    
+    Body is a JSON array of /api/match/add objects, or CSV (Content-Type:
+    text/csv) with a header row naming the same fields; either is read as a
+    stream. `?eventId=` applies to rows that do not name an event. Every
+    row is validated first; if any fails, nothing is written and the
+    per-row errors are returned. Otherwise all rows are saved in one append.
+    """
+    try:
+        if request.mimetype == 'text/csv':
+            rows = match_import.iter_csv_rows(request.stream)
+        else:
+            rows = match_import.iter_json_array(request.stream)
+        defaults = {'eventId': request.args['eventId']} if request.args.get('eventId') else None
+        
+        try:
+            matches, errors = match_import.validate_matches(
+                itertools.islice(rows, BULK_MATCH_MAX_ROWS + 1), events, defaults
+            )
+        except (ValueError, UnicodeDecodeError, csv.Error) as e:
+            return jsonify({'error': f'Could not parse body: {e}'}), 400
+        
+        if len(matches) + len(errors) > BULK_MATCH_MAX_ROWS:
+            return jsonify({'error': f'At most {BULK_MATCH_MAX_ROWS} rows per import'}), 413
+        if errors:
+            return jsonify({'error': f'{len(errors)} invalid rows; nothing was saved', 'errors': errors}), 400
+        if not matches:
+            return jsonify({'error': 'No rows to import'}), 400
+        
+        sheets.add_matches(matches)
+        for event_id in dict.fromkeys(match['eventId'] for match in matches):
+            publish_safely(publish_event_standings, event_id)
+        
+        return jsonify({'success': True, 'imported': len(matches)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/score/update', methods=['POST'])
 def update_score():
     """Update score for an event"""
@@ -209,14 +604,15 @@ def update_score():
         bronze = data.get('bronze', 0)
         
         # Validate with sport/cultural specific logic
-        module = SPORTS_MODULES.get(event_id) or CULTURAL_MODULES.get(event_id)
-        if module:
-            is_valid, error = module.validate_score(division, gold, silver, bronze)
+        handlers = events.get(event_id)
+        if handlers and handlers.validate_score:
+            is_valid, error = handlers.validate_score(division, gold, silver, bronze)
             if not is_valid:
                 return jsonify({'error': error}), 400
         
         # Update in sheets
         sheets.update_event_score(event_id, division, gold, silver, bronze)
+        publish_safely(publish_medal_standings, event_id)
         
         return jsonify({'success': True})
     except Exception as e:
@@ -228,6 +624,7 @@ def add_fixture():
     try:
         data = request.json
         result = sheets.add_fixture(data)
+        publish_safely(publish_event_fixtures, data.get('eventId'))
         return jsonify({'success': True, 'fixture': result})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -238,10 +635,15 @@ def update_fixture():
     try:
         data = request.json
         result = sheets.update_fixture(data)
+        publish_safely(publish_event_fixtures, result['eventId'])
         return jsonify({'success': True, 'fixture': result})
+    except FixtureNotFoundError as e:
+        return jsonify({'error': e.args[0]}), 404
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
+    # Development server (FLASK_DEBUG=true for the reloader and debugger);
+    # production runs `gunicorn -c gunicorn.conf.py wsgi:application`
     port = int(os.getenv('PORT', 5000))
-    app.run(debug=True, host='0.0.0.0', port=port)
+    app.run(host='0.0.0.0', port=port, threaded=True)
@@ -0,0 +1,127 @@
+"""
+Asyncio-based Google Sheets transport with a pooled HTTP client
+"""
+
+import asyncio
+import atexit
+import os
+import threading
+from urllib.parse import quote
+
+import httpx
+from google.auth.transport.requests import Request
+
+from sheets_connector import SheetsConnector
+
+
+class AsyncSheetsConnector(SheetsConnector):
+    """
+    SheetsConnector that talks to the Sheets REST API through httpx.
+
+    One event loop runs in a background thread and owns a single pooled
+    `httpx.AsyncClient`; Flask worker threads hand their Sheets calls to it,
+    so connections are reused across requests and many requests can wait on
+    Google at the same time without each holding its own connection. Reads
+    spanning many ranges are split into batchGet chunks fetched
+    concurrently. Caching, indexing and the write queue are inherited
+    unchanged; only the I/O primitives are replaced.
+    """
+
+    BASE_URL = 'https://sheets.googleapis.com/v4/spreadsheets'
+    MAX_RETRIES = 3
+
+    def _connect(self):
+        self._load_credentials()
+        self.batch_chunk = int(os.getenv('SHEETS_BATCH_CHUNK', 10))
+        self._reconnect()
+        atexit.register(self.close)
+
+    def _reconnect(self):
+        """Start the event loop thread and open the HTTP pool"""
+        max_connections = int(os.getenv('SHEETS_HTTP_MAX_CONNECTIONS', 20))
+
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name='sheets-async', daemon=True)
+        self._loop_thread.start()
+
+        async def create_client():
+            self._token_lock = asyncio.Lock()
+            return httpx.AsyncClient(
+                base_url=f'{self.BASE_URL}/{self.SPREADSHEET_ID}',
+                limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+                timeout=httpx.Timeout(float(os.getenv('SHEETS_HTTP_TIMEOUT', 30)))
+            )
+
+        self._client = self._run(create_client())
+
+    def close(self):
+        """Close the HTTP pool and stop the event loop"""
+        if self._loop.is_running():
+            self._run(self._client.aclose())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _run(self, coro):
+        """Run a coroutine on the connector's loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _auth_headers(self):
+        async with self._token_lock:
+            if not self.credentials.valid:
+                # google-auth refreshes synchronously; keep it off the loop
+                await self._loop.run_in_executor(None, self.credentials.refresh, Request())
+        return {'Authorization': f'Bearer {self.credentials.token}'}
+
+    async def _request(self, method, path, **kwargs):
+        for attempt in range(self.MAX_RETRIES + 1):
+            response = await self._client.request(method, path, headers=await self._auth_headers(), **kwargs)
+            if response.status_code in (429, 503) and attempt < self.MAX_RETRIES:
+                await asyncio.sleep(float(response.headers.get('Retry-After', 2 ** attempt)))
+                continue
+            response.raise_for_status()
+            return response.json()
+
+    async def get_values_async(self, range_name):
+        """Read one range"""
+        result = await self._request('GET', f'/values/{quote(range_name, safe="")}')
+        return result.get('values', [])
+
+    async def batch_get_values_async(self, ranges):
+        """Read several ranges as concurrent batchGet calls of up to SHEETS_BATCH_CHUNK ranges"""
+        chunks = [ranges[i:i + self.batch_chunk] for i in range(0, len(ranges), self.batch_chunk)]
+        results = await asyncio.gather(*(
+            self._request('GET', '/values:batchGet', params=[('ranges', r) for r in chunk])
+            for chunk in chunks
+        ))
+        return [
+            value_range.get('values', [])
+            for result in results
+            for value_range in result.get('valueRanges', [])
+        ]
+
+    async def append_async(self, range_name, rows):
+        """Append rows to a range"""
+        await self._request(
+            'POST',
+            f'/values/{quote(range_name, safe="")}:append',
+            params={'valueInputOption': 'RAW'},
+            json={'values': rows}
+        )
+
+    async def batch_update_async(self, data):
+        """Overwrite several ranges in one call"""
+        await self._request('POST', '/values:batchUpdate', json={
+            'valueInputOption': 'RAW',
+            'data': [{'range': range_name, 'values': values} for range_name, values in data]
+        })
+
+    def _execute_get(self, range_name):
+        return self._run(self.get_values_async(range_name))
+
+    def _execute_batch_get(self, ranges):
+        return self._run(self.batch_get_values_async(ranges))
+
+    def _execute_append(self, range_name, rows):
+        self._run(self.append_async(range_name, rows))
+
+    def _execute_batch_update(self, data):
+        self._run(self.batch_update_async(data))
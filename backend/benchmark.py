@@ -0,0 +1,191 @@
+"""
+Load-testing benchmark for the Flask API
+
+Seeds the in-memory backend with a synthetic tournament and drives the
+main endpoints at a fixed concurrency, reporting throughput and
+p50/p95/p99 latency per endpoint.
+
+Usage:
+    python benchmark.py                                  # in-process, default tournament
+    python benchmark.py --matches 2000 --concurrency 16
+    python benchmark.py --output baseline.json
+    python benchmark.py --baseline baseline.json         # exit 1 if p95 regressed
+    python benchmark.py --url http://localhost:5000      # against a running server
+                                                         # (seed it with MEMORY_SEED)
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sheet_ranges import column_letter
+
+ENDPOINTS = {
+    'standings': ('GET', '/api/standings'),
+    'dashboard': ('GET', '/api/dashboard'),
+    'event-standings': ('GET', '/api/event/{event}/standings'),
+    'matches': ('GET', '/api/event/{event}/matches'),
+    'fixtures': ('GET', '/api/event/{event}/fixtures'),
+    'match-add': ('POST', '/api/match/add'),
+}
+
+
+def percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+def in_process_client(args):
+    """Import the app against a freshly seeded in-memory spreadsheet"""
+    os.environ['SHEETS_BACKEND'] = 'memory'
+    os.environ['MEMORY_SEED'] = str(args.seed)
+    os.environ['MEMORY_SEED_DIVISIONS'] = str(args.divisions)
+    os.environ['MEMORY_SEED_MATCHES'] = str(args.matches)
+    os.environ['MEMORY_SEED_FIXTURES'] = str(args.fixtures)
+    os.environ['MEMORY_LATENCY_MS'] = str(args.latency_ms)
+
+    import app
+    client = app.app.test_client()
+
+    def send(method, path, body):
+        response = client.open(path, method=method, json=body)
+        return response.status_code
+    return send
+
+
+def http_client(args):
+    """Send requests to a running server over a pooled HTTP client"""
+    import httpx
+    client = httpx.Client(base_url=args.url, limits=httpx.Limits(max_connections=args.concurrency))
+
+    def send(method, path, body):
+        return client.request(method, path, json=body).status_code
+    return send
+
+
+def match_body(rng, event_id, divisions):
+    team1, team2 = rng.sample(divisions, 2)
+    return {
+        'eventId': event_id,
+        'team1': team1,
+        'team2': team2,
+        'result': rng.choice(['win', 'loss', 'draw']),
+        'game_points': rng.randint(0, 1),
+        'round': 1,
+    }
+
+
+def run_endpoint(send, name, args, divisions):
+    """
+    Fire args.requests requests at one endpoint with args.concurrency workers
+
+    Returns:
+        Dictionary with requests, errors, throughput and latency percentiles (ms)
+    """
+    method, path = ENDPOINTS[name]
+    path = path.format(event=args.event)
+    rng = random.Random(args.seed)
+    rng_lock = threading.Lock()
+
+    def one(_):
+        body = None
+        if method == 'POST':
+            with rng_lock:
+                body = match_body(rng, args.event, divisions)
+        started = time.perf_counter()
+        status = send(method, path, body)
+        return time.perf_counter() - started, status
+
+    for _ in range(args.warmup):
+        one(None)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(one, range(args.requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency * 1000 for latency, _ in results)
+    return {
+        'requests': len(results),
+        'errors': sum(1 for _, status in results if status >= 400),
+        'throughput': len(results) / elapsed if elapsed else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99),
+    }
+
+
+def print_report(report):
+    print(f"{'endpoint':<16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, result in report['endpoints'].items():
+        print(
+            f"{name:<16}{result['throughput']:>10.1f}{result['p50']:>10.2f}"
+            f"{result['p95']:>10.2f}{result['p99']:>10.2f}{result['errors']:>8}"
+        )
+
+
+def regressions(report, baseline, tolerance):
+    """Endpoints whose p95 is more than `tolerance` (a fraction) above the baseline"""
+    slower = []
+    for name, result in report['endpoints'].items():
+        previous = baseline.get('endpoints', {}).get(name)
+        if previous and result['p95'] > previous['p95'] * (1 + tolerance):
+            slower.append(f"{name}: p95 {previous['p95']:.2f} ms -> {result['p95']:.2f} ms")
+    return slower
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Division Wars API')
+    parser.add_argument('--url', help='Benchmark a running server instead of the app in-process')
+    parser.add_argument('--endpoints', default=','.join(ENDPOINTS), help='Comma-separated endpoints to run')
+    parser.add_argument('--event', default='chess', help='Event used by the event endpoints')
+    parser.add_argument('--divisions', type=int, default=8)
+    parser.add_argument('--matches', type=int, default=1000, help='Matches per event')
+    parser.add_argument('--fixtures', type=int, default=100, help='Fixtures per event')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--latency-ms', type=float, default=0, help='Simulated Sheets latency (in-process only)')
+    parser.add_argument('--requests', type=int, default=500, help='Requests per endpoint')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--warmup', type=int, default=20, help='Unmeasured requests per endpoint')
+    parser.add_argument('--output', help='Write the report as JSON')
+    parser.add_argument('--baseline', help='Compare p95 latencies against a previous JSON report')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='Allowed p95 slowdown vs the baseline')
+    args = parser.parse_args()
+
+    names = [name.strip() for name in args.endpoints.split(',') if name.strip()]
+    unknown = [name for name in names if name not in ENDPOINTS]
+    if unknown:
+        parser.error(f"Unknown endpoints: {unknown}; choose from {list(ENDPOINTS)}")
+
+    send = http_client(args) if args.url else in_process_client(args)
+    divisions = [column_letter(index) for index in range(args.divisions)]
+
+    report = {'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')}, 'endpoints': {}}
+    for name in names:
+        report['endpoints'][name] = run_endpoint(send, name, args, divisions)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            slower = regressions(report, json.load(f), args.tolerance)
+        for line in slower:
+            print(f"REGRESSION {line}")
+        if slower:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
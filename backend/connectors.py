@@ -0,0 +1,42 @@
+"""
+Storage backend selection
+"""
+
+import os
+
+from sheets_connector import SheetsConnector
+
+
+def create_connector(instrument=False):
+    """
+    Create the connector selected by SHEETS_BACKEND
+
+    Args:
+        instrument: Time every connector method and count API calls (see instrumentation.py)
+
+    Returns:
+        'sync' (default): SheetsConnector using googleapiclient
+        'async': AsyncSheetsConnector using a pooled asyncio HTTP client
+        'sqlite': SQLiteMirrorConnector serving reads from a local SQLite mirror
+        'memory': MemoryConnector keeping the spreadsheet in process memory,
+                  also used whenever SPREADSHEET_ID is 'dummy_spreadsheet_id'
+    """
+    backend = os.getenv('SHEETS_BACKEND', 'sync')
+    if os.getenv('SPREADSHEET_ID') == 'dummy_spreadsheet_id':
+        backend = 'memory'
+
+    if backend == 'async':
+        from async_sheets_connector import AsyncSheetsConnector as connector_class
+    elif backend == 'sqlite':
+        from sqlite_connector import SQLiteMirrorConnector as connector_class
+    elif backend == 'memory':
+        from memory_connector import MemoryConnector as connector_class
+    elif backend == 'sync':
+        connector_class = SheetsConnector
+    else:
+        raise ValueError(f"Unknown SHEETS_BACKEND: {backend}")
+
+    if instrument:
+        from instrumentation import instrument_connector_class
+        connector_class = instrument_connector_class(connector_class)
+    return connector_class()
@@ -48,28 +48,6 @@ This section will be updated with complete rules.
 """
 
 
-def calculate_division_points(performance_data):
-    """
-    Calculate points for a division in Group Dance
-    
-    Args:
-        performance_data: Dictionary containing performance metrics
-                          (e.g., {'gold': 1, 'silver': 0, 'matches_won': 5})
-    
-    Returns:
-        Total points for the division
-    """
-    # TODO: Implement Group Dance-specific point calculation logic here
-    # This is where you define how points are awarded for this specific sport
-    
-    points = 0
-    # Example logic:
-    # points += performance_data.get('gold', 0) * 5
-    # points += performance_data.get('matches_won', 0) * 2
-    
-    return points
-
-
 def get_player_requirements():
     """
     Define the player structure/requirements for Group Dance.
@@ -0,0 +1,79 @@
+"""
+Pre-serialized, pre-compressed event metadata (rules, form and table structures)
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+
+
+class StaticPayload:
+    """JSON body rendered once, with its gzip encoding and ETag"""
+
+    def __init__(self, data):
+        self.body = json.dumps(data, sort_keys=True, separators=(',', ':')).encode()
+        self.gzipped = gzip.compress(self.body, compresslevel=9, mtime=0)
+        self.etag = hashlib.md5(self.body).hexdigest()
+
+
+class EventMetadata:
+    """
+    Static per-event responses, rendered at most once per process.
+
+    Rules, form structures and table structures never change at runtime,
+    so each is serialized and gzipped the first time it is needed (or for
+    every event by `warm()` at startup) and served as bytes afterwards.
+
+    Args:
+        events: EventRegistry
+    """
+
+    def __init__(self, events):
+        self.events = events
+        self._payloads = {}  # (event_id, kind) or 'all' -> StaticPayload
+        self._lock = threading.Lock()
+
+    def _render(self, key, build):
+        payload = self._payloads.get(key)
+        if payload is None:
+            with self._lock:
+                payload = self._payloads.get(key)
+                if payload is None:
+                    payload = self._payloads[key] = StaticPayload(build())
+        return payload
+
+    def _describe(self, handlers):
+        return {
+            'category': handlers.category,
+            'rules': handlers.get_rules() if handlers.get_rules else None,
+            'form_structure': handlers.form_structure,
+            'table_structure': handlers.table_structure,
+        }
+
+    def rules(self, event_id):
+        """Payload for /api/event/<id>/rules, or None for an unknown event"""
+        handlers = self.events.get(event_id)
+        if not handlers:
+            return None
+        return self._render((event_id, 'rules'), lambda: {'rules': handlers.get_rules()})
+
+    def form_structure(self, event_id):
+        """Payload for /api/event/<id>/form-structure, or None for an unknown event"""
+        handlers = self.events.get(event_id)
+        if not handlers:
+            return None
+        return self._render((event_id, 'form_structure'), lambda: handlers.form_structure)
+
+    def all(self):
+        """Payload with every event's category, rules, form and table structure"""
+        return self._render('all', lambda: {
+            'events': {event_id: self._describe(self.events.get(event_id)) for event_id in self.events.event_ids()}
+        })
+
+    def warm(self):
+        """Render every payload now instead of on first request"""
+        for event_id in self.events.event_ids():
+            self.rules(event_id)
+            self.form_structure(event_id)
+        self.all()
@@ -0,0 +1,159 @@
+"""
+Registry of event modules, imported on first use
+"""
+
+import importlib
+import pkgutil
+import threading
+from importlib.metadata import entry_points
+
+from scoring import DEFAULT_SCORING, compile_scoring
+
+# Packages scanned for event modules; the package name is the event category
+EVENT_PACKAGES = ('sports', 'cultural')
+
+# Installed plugins register events under 'division_wars.<category>' entry points,
+# e.g. 'archery = my_events.archery' in the 'division_wars.sports' group
+ENTRY_POINT_PREFIX = 'division_wars.'
+
+DEFAULT_FORM_STRUCTURE = {
+    'type': 'match',
+    'fields': [
+        {'name': 'team1', 'label': 'Team 1', 'type': 'select', 'required': True},
+        {'name': 'team2', 'label': 'Team 2', 'type': 'select', 'required': True},
+        {'name': 'result', 'label': 'Result', 'type': 'select', 'options': ['win', 'loss', 'draw'], 'required': True},
+        {'name': 'match_points', 'label': 'Match Points', 'type': 'number'},
+        {'name': 'game_points', 'label': 'Game Points', 'type': 'number'}
+    ]
+}
+
+
+class EventHandlers:
+    """
+    Capabilities of one event module, resolved once when it is imported.
+
+    Optional hooks the module does not define are None, so callers test
+    a field instead of probing the module on every request. The module's
+    SCORING spec (DEFAULT_SCORING when it has none) is compiled here and
+    supplies the scoring hooks, table structure and medal weights, unless
+    the module writes its scoring hooks by hand without a SCORING spec.
+
+    Args:
+        event_id: Event id
+        category: 'sports' or 'cultural'
+        module: Imported event module
+        wrap_hook: Optional callable(hook name, function) -> function applied
+                   to every hook, e.g. to time it
+    """
+
+    HOOKS = ('validate_match', 'validate_score', 'calculate_division_points', 'calculate_match_points', 'apply_match', 'get_rules')
+    SCORING_HOOKS = ('calculate_division_points', 'calculate_match_points', 'apply_match')
+
+    def __init__(self, event_id, category, module, wrap_hook=None):
+        self.event_id = event_id
+        self.category = category
+        self.module = module
+
+        spec = getattr(module, 'SCORING', None)
+        if spec is None and any(hasattr(module, hook) for hook in self.SCORING_HOOKS):
+            self.scoring = None  # scored entirely by hand-written hooks
+        else:
+            self.scoring = compile_scoring(DEFAULT_SCORING if spec is None else spec)
+
+        for hook in self.HOOKS:
+            function = getattr(module, hook, None)
+            if function is None and self.scoring and hook in self.SCORING_HOOKS:
+                function = getattr(self.scoring, hook)
+            if function is not None and wrap_hook:
+                function = wrap_hook(hook, function)
+            setattr(self, hook, function)
+
+        self.pairing_system = getattr(module, 'PAIRING_SYSTEM', None)
+        self.ranking_key = getattr(module, 'RANKING_KEY', None)
+        self.tie_breaks = getattr(module, 'TIE_BREAKS', None)
+        self.medal_weights = self.scoring.medal_weights if self.scoring else None
+
+        get_table_structure = getattr(module, 'get_table_structure', None)
+        if get_table_structure is None and self.scoring:
+            get_table_structure = self.scoring.get_table_structure
+        self.table_structure = get_table_structure() if get_table_structure else None
+        get_form_structure = getattr(module, 'get_form_structure', None)
+        self.form_structure = get_form_structure() if get_form_structure else DEFAULT_FORM_STRUCTURE
+
+
+class EventRegistry:
+    """
+    Event id -> module lookup without importing every module up front.
+
+    Modules are discovered by scanning the event packages (and installed
+    'division_wars.<category>' entry points) for names only; a module is
+    imported the first time its event is requested and its EventHandlers
+    are cached from then on.
+
+    Args:
+        packages: Packages to scan; each package name is a category
+        wrap_hook: Optional callable(hook name, function) -> function applied to module hooks
+    """
+
+    def __init__(self, packages=EVENT_PACKAGES, wrap_hook=None):
+        self.wrap_hook = wrap_hook
+        self._paths = {}     # event_id -> (category, module path)
+        self._handlers = {}  # event_id -> EventHandlers
+        self._lock = threading.Lock()
+
+        for category in packages:
+            package = importlib.import_module(category)
+            for info in pkgutil.iter_modules(package.__path__):
+                if not info.ispkg:
+                    self._paths[info.name.replace('_', '-')] = (category, f'{category}.{info.name}')
+
+        for entry_point in _plugin_entry_points():
+            category = entry_point.group[len(ENTRY_POINT_PREFIX):]
+            self._paths.setdefault(entry_point.name, (category, entry_point.module))
+
+    def __contains__(self, event_id):
+        return event_id in self._paths
+
+    def event_ids(self, category=None):
+        """Known event ids, optionally for one category"""
+        return [event_id for event_id, (event_category, _) in self._paths.items() if category in (None, event_category)]
+
+    def categories(self):
+        """{event_id: category} without importing any module"""
+        return {event_id: category for event_id, (category, _) in self._paths.items()}
+
+    def get(self, event_id):
+        """
+        Get an event's handlers, importing its module on first use
+
+        Args:
+            event_id: Event id (e.g. 'table-tennis')
+
+        Returns:
+            EventHandlers, or None for an unknown event
+        """
+        handlers = self._handlers.get(event_id)
+        if handlers is not None or event_id not in self._paths:
+            return handlers
+
+        with self._lock:
+            handlers = self._handlers.get(event_id)
+            if handlers is None:
+                category, path = self._paths[event_id]
+                handlers = EventHandlers(event_id, category, importlib.import_module(path), self.wrap_hook)
+                self._handlers[event_id] = handlers
+            return handlers
+
+
+def _plugin_entry_points():
+    discovered = entry_points()
+    if hasattr(discovered, 'select'):
+        return [
+            entry_point for group in discovered.groups if group.startswith(ENTRY_POINT_PREFIX)
+            for entry_point in discovered.select(group=group)
+        ]
+    # Python < 3.10 returns {group: [entry points]}
+    return [
+        entry_point for group, group_entry_points in discovered.items() if group.startswith(ENTRY_POINT_PREFIX)
+        for entry_point in group_entry_points
+    ]
@@ -0,0 +1,98 @@
+"""
+Streaming NDJSON/CSV export of matches, fixtures and standings
+"""
+
+import csv
+import io
+import json
+
+FORMATS = {
+    'ndjson': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+
+# Exported columns (CSV header order; NDJSON objects carry the same keys)
+FIELDS = {
+    'matches': ('eventId', 'team', 'opponent', 'result', 'match_points', 'game_points', 'date', 'round'),
+    'fixtures': ('id', 'eventId', 'division1', 'division2', 'date', 'time', 'venue', 'status', 'winner', 'score'),
+    'standings': ('eventId', 'category', 'division', 'gold', 'silver', 'bronze', 'points'),
+}
+
+
+class Filters:
+    """
+    Row filters shared by every export
+
+    Args:
+        division: Keep rows involving this division
+        date_from, date_to: Inclusive ISO date range (YYYY-MM-DD); rows without a date are dropped
+    """
+
+    def __init__(self, division=None, date_from=None, date_to=None):
+        self.division = division
+        self.date_from = date_from
+        self.date_to = date_to
+
+    def date_matches(self, date):
+        if self.date_from is None and self.date_to is None:
+            return True
+        if not date:
+            return False
+        return (self.date_from is None or date >= self.date_from) and (self.date_to is None or date <= self.date_to)
+
+
+def iter_matches(store, event_ids, filters):
+    """Match rows (one per team, as in the Matches sheet), one event at a time"""
+    for event_id in event_ids:
+        for match in store.event_matches(event_id):
+            if filters.division and match['team'] != filters.division:
+                continue
+            if filters.date_matches(match['date']):
+                yield match
+
+
+def iter_fixtures(store, event_ids, filters):
+    """Fixtures, one event at a time"""
+    for event_id in event_ids:
+        for fixture in store.event_fixtures(event_id):
+            if filters.division and filters.division not in (fixture['division1'], fixture['division2']):
+                continue
+            if filters.date_matches(fixture['date']):
+                yield fixture
+
+
+def iter_standings(leaderboard, event_ids, filters):
+    """Per-event medals and points (dates do not apply)"""
+    wanted = set(event_ids)
+    for row in leaderboard.contributions(filters.division):
+        if row['eventId'] in wanted:
+            yield row
+
+
+def ndjson_lines(rows, fields):
+    for row in rows:
+        yield json.dumps({field: row.get(field) for field in fields}) + '\n'
+
+
+def csv_lines(rows, fields):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def line(values):
+        writer.writerow(values)
+        text = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return text
+
+    yield line(fields)
+    for row in rows:
+        yield line(['' if row.get(field) is None else row.get(field) for field in fields])
+
+
+def render(rows, kind, format_name):
+    """Encode rows lazily as NDJSON or CSV, one line per yielded string"""
+    fields = FIELDS[kind]
+    if format_name == 'csv':
+        return csv_lines(rows, fields)
+    return ndjson_lines(rows, fields)
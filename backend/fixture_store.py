@@ -0,0 +1,174 @@
+"""
+In-process index over the Fixtures sheet
+"""
+
+import hashlib
+import itertools
+import threading
+import uuid
+
+# Column order of the Fixtures sheet (A:J)
+FIXTURE_FIELDS = ('eventId', 'division1', 'division2', 'date', 'time', 'venue', 'status', 'winner', 'score', 'id')
+
+# Columns written by a result update (G:J), the id included so legacy rows get it pinned
+RESULT_FIELDS = ('status', 'winner', 'score', 'id')
+RESULT_COLUMNS = 'G{row}:J{row}'
+
+# Fields that never change after scheduling, hashed into ids for rows written without one
+_IDENTITY_FIELDS = ('eventId', 'division1', 'division2', 'date', 'time', 'venue')
+
+
+class FixtureNotFoundError(KeyError):
+    """Raised when a fixture id is not in the Fixtures sheet"""
+
+
+def new_fixture_id(event_id):
+    """Fresh fixture id, e.g. 'chess-3f9a1c2e'"""
+    return f'{event_id}-{uuid.uuid4().hex[:8]}'
+
+
+def _legacy_id(fixture, occurrence):
+    identity = [fixture[field] for field in _IDENTITY_FIELDS] + [str(occurrence)]
+    digest = hashlib.md5('|'.join(identity).encode()).hexdigest()
+    return f"{fixture['eventId']}-{digest[:8]}"
+
+
+def parse_fixture_row(row):
+    """Convert a raw Fixtures sheet row into a fixture dictionary (without a fallback id)"""
+    return {
+        'id': row[9] if len(row) > 9 and row[9] else None,
+        'eventId': row[0] if len(row) > 0 else '',
+        'division1': row[1] if len(row) > 1 else '',
+        'division2': row[2] if len(row) > 2 else '',
+        'date': row[3] if len(row) > 3 else '',
+        'time': row[4] if len(row) > 4 else '',
+        'venue': row[5] if len(row) > 5 else '',
+        'status': row[6] if len(row) > 6 and row[6] else 'scheduled',
+        'winner': row[7] if len(row) > 7 and row[7] else None,
+        'score': row[8] if len(row) > 8 and row[8] else None,
+    }
+
+
+def fixture_row(fixture):
+    """Sheet row (A:J) for a fixture dictionary"""
+    return [fixture.get(field) or '' for field in FIXTURE_FIELDS]
+
+
+class FixtureStore:
+    """
+    Fixtures indexed by id and by event.
+
+    Ids are stored in column J, so they survive rows being inserted or
+    sorted; rows written before the column existed get an id hashed from
+    their event, divisions, date, time and venue. Each id maps to its
+    sheet row, so result updates write one range without scanning.
+
+    `load` rebuilds the index from sheet rows but keeps the version (and
+    rendered view) of every event whose fixtures are unchanged; `add` and
+    `update` touch only the affected event.
+
+    Args:
+        first_row: Sheet row number of the first data row (2 skips the header)
+    """
+
+    def __init__(self, first_row=2):
+        self.first_row = first_row
+        self.next_row = first_row
+        self._source = None
+        self._fixtures = {}    # id -> fixture
+        self._rows = {}        # id -> sheet row number
+        self._by_event = {}    # event_id -> [id, ...] in sheet order
+        self._versions = {}    # event_id -> version, bumped when its fixtures change
+        self._signatures = {}  # event_id -> fixtures as loaded, to detect changes on reload
+        self._views = {}       # event_id -> rendered [fixture, ...]
+        self._version_counter = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def is_loaded_from(self, rows):
+        """Whether the index was built from this exact list of sheet rows"""
+        return self._source is rows
+
+    def load(self, rows):
+        """Rebuild the index from raw Fixtures sheet rows"""
+        fixtures = {}
+        row_numbers = {}
+        by_event = {}
+        for offset, row in enumerate(rows):
+            if len(row) == 0 or not row[0]:
+                continue
+            fixture = parse_fixture_row(row)
+            if fixture['id'] is None or fixture['id'] in fixtures:
+                # Identical legacy rows (or a copied id) are told apart by occurrence
+                occurrence = 0
+                fixture['id'] = _legacy_id(fixture, occurrence)
+                while fixture['id'] in fixtures:
+                    occurrence += 1
+                    fixture['id'] = _legacy_id(fixture, occurrence)
+            fixtures[fixture['id']] = fixture
+            row_numbers[fixture['id']] = self.first_row + offset
+            by_event.setdefault(fixture['eventId'], []).append(fixture['id'])
+
+        signatures = {
+            event_id: tuple((row_numbers[fixture_id], tuple(fixtures[fixture_id].items())) for fixture_id in ids)
+            for event_id, ids in by_event.items()
+        }
+
+        with self._lock:
+            for event_id in set(signatures) | set(self._signatures):
+                if signatures.get(event_id) != self._signatures.get(event_id):
+                    self._changed(event_id)
+            self._fixtures = fixtures
+            self._rows = row_numbers
+            self._by_event = by_event
+            self._signatures = signatures
+            self._source = rows
+            self.next_row = self.first_row + len(rows)
+
+    def _changed(self, event_id):
+        self._versions[event_id] = next(self._version_counter)
+        self._views.pop(event_id, None)
+
+    def add(self, fixtures):
+        """
+        Index fixtures that are being appended to the sheet
+
+        Args:
+            fixtures: Fixture dictionaries with ids, in append order
+        """
+        with self._lock:
+            for fixture in fixtures:
+                fixture_id = fixture['id']
+                self._fixtures[fixture_id] = fixture
+                self._rows[fixture_id] = self.next_row
+                self.next_row += 1
+                self._by_event.setdefault(fixture['eventId'], []).append(fixture_id)
+                self._changed(fixture['eventId'])
+
+    def update(self, fixture):
+        """Replace an indexed fixture (matched by id) with a new dictionary"""
+        with self._lock:
+            self._fixtures[fixture['id']] = fixture
+            self._changed(fixture['eventId'])
+
+    def get(self, fixture_id):
+        """(fixture, sheet row number), or (None, None) for an unknown id"""
+        with self._lock:
+            return self._fixtures.get(fixture_id), self._rows.get(fixture_id)
+
+    def event_version(self, event_id):
+        """Version of an event's fixtures; changes whenever any of them does"""
+        with self._lock:
+            return self._versions.get(event_id, 0)
+
+    def all_fixtures(self):
+        """Every fixture, in no particular order"""
+        with self._lock:
+            return list(self._fixtures.values())
+
+    def event_fixtures(self, event_id):
+        """An event's fixtures in sheet order, rendered once per version"""
+        with self._lock:
+            view = self._views.get(event_id)
+            if view is None:
+                view = self._views[event_id] = [self._fixtures[fixture_id] for fixture_id in self._by_event.get(event_id, [])]
+            return list(view)
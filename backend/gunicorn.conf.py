@@ -0,0 +1,72 @@
+"""
+Gunicorn settings for production
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Defaults:
+- One worker process. Each process indexes sheet rows (event standings rows,
+  fixture rows) and numbers new rows on its own, so two processes writing
+  to one spreadsheet would overwrite each other's rows. Live updates on
+  /api/stream are also published only to the process that made the write.
+- gevent worker: every request, including each open /api/stream connection,
+  is a greenlet rather than a thread, so one process holds thousands of
+  streams and waits on many Sheets calls at once. benchmark.py showed
+  cache misses are dominated by Sheets latency, so overlapping them is what
+  adds throughput; cached reads are CPU-bound and one core serves them.
+  The sync backend borrows a separate httplib2 connection for each
+  concurrent Sheets call (SheetsConnector._execute), so greenlets never
+  interleave requests on one socket.
+- With SHEETS_BACKEND=async the connector already overlaps Sheets calls on
+  its own event loop thread, which gevent's patching would take over, so
+  that backend runs on gthread workers instead.
+
+Environment:
+    PORT: Listen port (default 5000)
+    WEB_CONCURRENCY: Worker processes (default 1; see above before raising it)
+    WEB_WORKER_CLASS: gevent (default) or gthread
+    WEB_CONNECTIONS: Concurrent connections per gevent worker (default 2000)
+    WEB_THREADS: Threads per gthread worker; each open /api/stream connection holds one
+    WEB_PRELOAD: Import and warm the app once in the master (default true)
+    WEB_TIMEOUT / WEB_GRACEFUL_TIMEOUT: Seconds before a silent worker is
+        killed / in-flight requests get to finish on shutdown or reload
+    WEB_MAX_REQUESTS: Recycle workers after this many requests (0 = never)
+"""
+
+import os
+
+
+def default_worker_class():
+    return 'gthread' if os.getenv('SHEETS_BACKEND') == 'async' else 'gevent'
+
+
+bind = f"0.0.0.0:{os.getenv('PORT', 5000)}"
+worker_class = os.getenv('WEB_WORKER_CLASS', default_worker_class())
+workers = int(os.getenv('WEB_CONCURRENCY', 1))
+worker_connections = int(os.getenv('WEB_CONNECTIONS', 2000))
+threads = int(os.getenv('WEB_THREADS', 8))
+preload_app = os.getenv('WEB_PRELOAD', 'true').lower() == 'true'
+timeout = int(os.getenv('WEB_TIMEOUT', 60))
+graceful_timeout = int(os.getenv('WEB_GRACEFUL_TIMEOUT', 30))
+keepalive = 5
+max_requests = int(os.getenv('WEB_MAX_REQUESTS', 0))
+max_requests_jitter = max_requests // 10
+errorlog = '-'
+
+if worker_class == 'gevent':
+    # Patch before the preloaded app imports ssl, socket and threading in the master
+    from gevent import monkey
+    monkey.patch_all()
+
+
+def post_fork(server, worker):
+    # The preloaded app's client, threads and journal belong to the master
+    if server.cfg.preload_app:
+        import wsgi
+        wsgi.after_fork()
+
+
+def worker_exit(server, worker):
+    # Send this worker's queued writes before it exits (the master's stay with the master)
+    from app import sheets
+    if sheets.write_queue:
+        sheets.write_queue.flush()
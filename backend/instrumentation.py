@@ -0,0 +1,230 @@
+"""
+Request timing spans, Server-Timing headers, Prometheus metrics and sampled profiling
+"""
+
+import contextvars
+import cProfile
+import functools
+import os
+import random
+import threading
+import time
+
+# Histogram buckets, in seconds
+BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_current_spans = contextvars.ContextVar('spans', default=None)
+
+
+class Histogram:
+    """Cumulative-bucket histogram keyed by a tuple of label values"""
+
+    def __init__(self, name, help_text, label_names, buckets=BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        self._series = {}  # labels -> [bucket counts..., count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, labels, value):
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = sorted(self._series.items())
+        for labels, series in items:
+            label_text = ','.join(f'{name}="{value}"' for name, value in zip(self.label_names, labels))
+            prefix = f'{label_text},' if label_text else ''
+            for bound, count in zip(self.buckets, series):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {count}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[-2]}')
+            lines.append(f'{self.name}_count{{{label_text}}} {series[-2]}')
+            lines.append(f'{self.name}_sum{{{label_text}}} {series[-1]}')
+        return lines
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values"""
+
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels, amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self):
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} counter']
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            label_text = ','.join(f'{name}="{value}"' for name, value in zip(self.label_names, labels))
+            lines.append(f'{self.name}{{{label_text}}} {value}')
+        return lines
+
+
+REQUEST_SECONDS = Histogram('http_request_duration_seconds', 'Request latency by route', ('method', 'route', 'status'))
+SPAN_SECONDS = Histogram('span_duration_seconds', 'Time spent in Sheets connector methods and event module hooks', ('span',))
+SHEETS_REQUESTS = Counter('sheets_api_requests_total', 'Spreadsheet API calls by quota bucket', ('quota', 'call'))
+SHEETS_ERRORS = Counter('sheets_api_errors_total', 'Failed spreadsheet API calls', ('quota', 'call'))
+METRICS = (REQUEST_SECONDS, SPAN_SECONDS, SHEETS_REQUESTS, SHEETS_ERRORS)
+
+
+def render_metrics():
+    """All metrics in the Prometheus text exposition format"""
+    lines = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+# Spans
+
+def start_request():
+    """Begin collecting spans for the current request"""
+    _current_spans.set({})
+
+
+def finish_request():
+    """
+    Stop collecting spans for the current request
+
+    Returns:
+        {span name: [total seconds, calls]}
+    """
+    spans = _current_spans.get() or {}
+    _current_spans.set(None)
+    return spans
+
+
+def record_span(name, seconds):
+    SPAN_SECONDS.observe((name,), seconds)
+    spans = _current_spans.get()
+    if spans is not None:
+        total = spans.get(name)
+        if total is None:
+            spans[name] = [seconds, 1]
+        else:
+            total[0] += seconds
+            total[1] += 1
+
+
+def timed(name, function):
+    """Wrap a callable so every call is recorded as a span"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            record_span(name, time.perf_counter() - started)
+    return wrapper
+
+
+def server_timing(spans, total_seconds):
+    """Server-Timing header value, one entry per span name plus the total"""
+    entries = [
+        f'{name};dur={seconds * 1000:.2f};desc="{calls}x"'
+        for name, (seconds, calls) in sorted(spans.items(), key=lambda item: -item[1][0])
+    ]
+    entries.append(f'total;dur={total_seconds * 1000:.2f}')
+    return ', '.join(entries)
+
+
+def instrument_connector_class(cls):
+    """
+    Subclass a connector class with every public method and API primitive timed
+
+    The methods a connector lists in `api_calls` also count against the
+    simulated quota buckets (sheets_api_requests_total). Subclassing
+    rather than wrapping an instance means the write queue, which
+    captures the primitives at construction, is instrumented too.
+    """
+    api_calls = getattr(cls, 'api_calls', {})
+    overrides = {}
+    for name in dir(cls):
+        attribute = getattr(cls, name)
+        if not callable(attribute) or isinstance(attribute, type):
+            continue
+        if name in api_calls:
+            quota, call = api_calls[name]
+            overrides[name] = _counted(quota, call, attribute)
+        elif not name.startswith('_'):
+            overrides[name] = timed(f'sheets.{name}', attribute)
+    return type(cls.__name__, (cls,), overrides)
+
+
+def _counted(quota, call, function):
+    span = f'sheets.api.{call}'
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        SHEETS_REQUESTS.inc((quota, call))
+        started = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            SHEETS_ERRORS.inc((quota, call))
+            raise
+        finally:
+            record_span(span, time.perf_counter() - started)
+    return wrapper
+
+
+# Sampling profiler
+
+class SamplingProfiler:
+    """
+    Profile a random share of requests with cProfile.
+
+    Only one request is profiled at a time; profiles are written to
+    `directory` as <timestamp>-<route>.prof for `python -m pstats` or
+    snakeviz.
+
+    Args:
+        sample_rate: Share of requests to profile (0 disables profiling)
+        directory: Where .prof files are written
+    """
+
+    def __init__(self, sample_rate=None, directory=None):
+        self.sample_rate = float(sample_rate if sample_rate is not None else os.getenv('PROFILE_SAMPLE_RATE', 0))
+        self.directory = directory or os.getenv('PROFILE_DIR', 'profiles')
+        self._busy = threading.Lock()
+
+    def start(self):
+        """Returns a running profiler if this request is sampled, otherwise None"""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        if not self._busy.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler is active in this interpreter
+            self._busy.release()
+            return None
+        return profiler
+
+    def stop(self, profiler, label):
+        profiler.disable()
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            safe_label = ''.join(char if char.isalnum() else '_' for char in label).strip('_') or 'root'
+            profiler.dump_stats(os.path.join(self.directory, f'{time.strftime("%Y%m%d-%H%M%S")}-{safe_label}.prof'))
+        finally:
+            self._busy.release()
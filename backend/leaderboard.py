@@ -0,0 +1,199 @@
+"""
+Overall, sports and cultural leaderboards derived from the per-event medal sheets
+"""
+
+import itertools
+import threading
+from uuid import uuid4
+
+import numpy as np
+
+from points_calculator import MEDAL_WEIGHTS, load_medal_table, build_standings, calculate_weighted_points
+
+CATEGORIES = ('sports', 'cultural')
+
+
+class Leaderboard:
+    """
+    Materialized medal totals across every event sheet.
+
+    The first refresh loads all events into one (events, divisions, 3)
+    array and reduces it per category. Afterwards only events whose rows
+    changed are re-read into the totals (old contribution out, new one
+    in), and the ranked tables are rendered once per revision.
+
+    Args:
+        categories: {event_id: 'sports' | 'cultural'}
+        weights: Optional callable(event_id) -> (gold, silver, bronze) or None,
+                 overriding the category weights for an event; called once
+                 per event, when its medals are first loaded
+    """
+
+    def __init__(self, categories, weights=None):
+        self.categories = dict(categories)
+        self._weights_for = weights
+        self._weights = {}
+        self.divisions = []
+        self._division_index = {}
+        self._medals = {}     # event_id -> (divisions, 3) medal counts
+        self._snapshots = {}  # event_id -> rows last applied
+        self._totals = {category: np.zeros((0, 3), dtype=np.int64) for category in CATEGORIES}
+        self._points = {category: np.zeros(0, dtype=np.int64) for category in CATEGORIES}
+        self._tables = {}     # (table, ranking) -> rendered standings for the current revision
+        self._loaded = False
+        self._epoch = uuid4().hex[:8]
+        self._revision_counter = itertools.count(1)
+        self._revision = 0
+        self._lock = threading.Lock()
+
+    def event_weights(self, event_id):
+        """(gold, silver, bronze) weights an event's medals are scored with"""
+        weights = self._weights.get(event_id)
+        if weights is None:
+            custom = self._weights_for(event_id) if self._weights_for else None
+            weights = np.asarray(MEDAL_WEIGHTS[self.categories[event_id]] if custom is None else custom)
+            self._weights[event_id] = weights
+        return weights
+
+    @property
+    def loaded(self):
+        """Whether every event has been loaded, so refresh may be given just the changed ones"""
+        return self._loaded
+
+    @property
+    def revision(self):
+        """Opaque revision string, changes whenever any event's medals change"""
+        return f'{self._epoch}:{self._revision}'
+
+    def refresh(self, raw_by_event):
+        """
+        Bring the totals up to date with the event sheets
+
+        Args:
+            raw_by_event: {event_id: rows} as returned by get_all_event_standings
+
+        Returns:
+            List of event ids whose medals changed
+        """
+        with self._lock:
+            changed = [
+                event_id for event_id, rows in raw_by_event.items()
+                if event_id in self.categories and self._snapshots.get(event_id) != rows
+            ]
+            if not self._loaded:
+                self._load(raw_by_event)
+            else:
+                for event_id in changed:
+                    self._update_event(event_id, raw_by_event[event_id])
+            if changed or not self._loaded:
+                self._loaded = True
+                self._tables.clear()
+                self._revision = next(self._revision_counter)
+            return changed
+
+    def _register(self, divisions):
+        """Index any new divisions, growing the totals to match"""
+        for division in divisions:
+            if division not in self._division_index:
+                self._division_index[division] = len(self.divisions)
+                self.divisions.append(division)
+        for category in CATEGORIES:
+            self._totals[category] = self._aligned(self._totals[category])
+            self._points[category] = np.pad(self._points[category], (0, len(self.divisions) - len(self._points[category])))
+
+    def _aligned(self, medals):
+        """Pad a (divisions, 3) array to the current division count"""
+        if medals is None:
+            return np.zeros((len(self.divisions), 3), dtype=np.int64)
+        return np.pad(medals, ((0, len(self.divisions) - len(medals)), (0, 0)))
+
+    def _event_medals(self, raw_data):
+        divisions, medals = load_medal_table(raw_data)
+        self._register(divisions)
+        aligned = self._aligned(None)
+        np.add.at(aligned, [self._division_index[division] for division in divisions], medals)
+        return aligned
+
+    def _load(self, raw_by_event):
+        event_ids = [event_id for event_id in raw_by_event if event_id in self.categories]
+        tables = [load_medal_table(raw_by_event[event_id]) for event_id in event_ids]
+        self._register(division for divisions, _ in tables for division in divisions)
+
+        medals = np.zeros((len(event_ids), len(self.divisions), 3), dtype=np.int64)
+        for position, (divisions, event_medals) in enumerate(tables):
+            np.add.at(medals[position], [self._division_index[division] for division in divisions], event_medals)
+
+        points = calculate_weighted_points(medals, [self.event_weights(event_id) for event_id in event_ids])
+        categories = np.array([self.categories[event_id] for event_id in event_ids])
+        for category in CATEGORIES:
+            self._totals[category] = medals[categories == category].sum(axis=0)
+            self._points[category] = points[categories == category].sum(axis=0)
+        for position, event_id in enumerate(event_ids):
+            self._medals[event_id] = medals[position]
+            self._snapshots[event_id] = [list(row) for row in raw_by_event[event_id]]
+
+    def _update_event(self, event_id, raw_data):
+        new = self._event_medals(raw_data)
+        old = self._aligned(self._medals.get(event_id))
+        category = self.categories[event_id]
+        self._totals[category] = self._totals[category] + new - old
+        self._points[category] = self._points[category] + (new - old) @ self.event_weights(event_id)
+        self._medals[event_id] = new
+        self._snapshots[event_id] = [list(row) for row in raw_data]
+
+    def standings(self, table, ranking='competition'):
+        """
+        Ranked leaderboard
+
+        Args:
+            table: 'overall', 'sports' or 'cultural'
+            ranking: 'competition' or 'dense'
+
+        Returns:
+            List of standings dictionaries, best first; overall points are
+            the sum of each event's points under its own weights
+        """
+        with self._lock:
+            key = (table, ranking)
+            if key not in self._tables:
+                categories = CATEGORIES if table == 'overall' else (table,)
+                medals = sum(self._totals[category] for category in categories)
+                points = sum(self._points[category] for category in categories)
+                self._tables[key] = build_standings(self.divisions, medals, points, ranking)
+            return self._tables[key]
+
+    def contributions(self, division=None):
+        """
+        Per-event medals and points behind the leaderboard
+
+        Args:
+            division: Optional division to restrict to
+
+        Returns:
+            List of {'eventId', 'category', 'division', 'gold', 'silver', 'bronze', 'points'}
+            for every division that won a medal in an event
+        """
+        with self._lock:
+            event_ids = list(self._medals)
+            if not event_ids:
+                return []
+            medals = np.stack([self._aligned(self._medals[event_id]) for event_id in event_ids])
+            points = calculate_weighted_points(medals, [self.event_weights(event_id) for event_id in event_ids])
+
+            rows = []
+            for event_position, division_position in zip(*np.nonzero(medals.any(axis=2))):
+                name = self.divisions[division_position]
+                if division is not None and name != division:
+                    continue
+                gold, silver, bronze = medals[event_position, division_position].tolist()
+                event_id = event_ids[event_position]
+                rows.append({
+                    'eventId': event_id,
+                    'category': self.categories[event_id],
+                    'division': name,
+                    'gold': gold,
+                    'silver': silver,
+                    'bronze': bronze,
+                    'points': int(points[event_position, division_position])
+                })
+            return rows
@@ -0,0 +1,101 @@
+"""
+Server-Sent Events fan-out for live standings and fixtures
+"""
+
+import json
+import queue
+import threading
+
+GLOBAL_CHANNEL = 'global'
+
+
+def event_channel(event_id):
+    return f'event:{event_id}'
+
+
+class Broadcaster:
+    """
+    Publishes messages to every subscriber of a channel.
+
+    Each subscriber owns a bounded queue; a subscriber that falls
+    `max_queue` messages behind is disconnected rather than slowing the
+    writers down. `publish_diff` remembers the last table published per
+    channel and topic and only sends rows that changed.
+    """
+
+    def __init__(self, max_queue=100):
+        self.max_queue = max_queue
+        self._subscribers = {}  # channel -> set of queues
+        self._snapshots = {}    # (channel, topic) -> {key: row}
+        self._lock = threading.Lock()
+
+    def subscribe(self, channels):
+        """Register a subscriber; returns the queue its messages arrive on"""
+        subscriber = queue.Queue(self.max_queue)
+        with self._lock:
+            for channel in channels:
+                self._subscribers.setdefault(channel, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            for subscribers in self._subscribers.values():
+                subscribers.discard(subscriber)
+
+    def has_subscribers(self, channel):
+        with self._lock:
+            return bool(self._subscribers.get(channel))
+
+    def publish(self, channel, topic, data):
+        """Send one message to every subscriber of a channel"""
+        message = f'event: {topic}\ndata: {json.dumps(data)}\n\n'
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # Too slow: drop it and make room to tell its stream to close
+                self.unsubscribe(subscriber)
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    pass
+                subscriber.put_nowait(None)
+
+    def publish_diff(self, channel, topic, rows, key):
+        """
+        Publish only the rows of a table that changed since the last publish
+
+        Args:
+            channel: Channel name
+            topic: SSE event name, e.g. 'standings'
+            rows: Full current table (list of dicts)
+            key: Field identifying a row, e.g. 'division'
+        """
+        current = {row[key]: row for row in rows}
+        with self._lock:
+            previous = self._snapshots.get((channel, topic), {})
+            self._snapshots[(channel, topic)] = current
+
+        changed = [row for row_key, row in current.items() if previous.get(row_key) != row]
+        removed = [row_key for row_key in previous if row_key not in current]
+        if changed or removed:
+            self.publish(channel, topic, {'changed': changed, 'removed': removed})
+
+    def stream(self, channels, heartbeat=15):
+        """Generator of SSE frames for a subscriber, with keep-alive comments"""
+        subscriber = self.subscribe(channels)
+        try:
+            yield 'retry: 3000\n\n'
+            while True:
+                try:
+                    message = subscriber.get(timeout=heartbeat)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                if message is None:
+                    return
+                yield message
+        finally:
+            self.unsubscribe(subscriber)
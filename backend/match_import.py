@@ -0,0 +1,150 @@
+"""
+Streaming parsers and validation for bulk match imports (CSV or JSON array)
+"""
+
+import codecs
+import csv
+import io
+import json
+
+CHUNK_SIZE = 64 * 1024
+
+NUMERIC_FIELDS = {'match_points': float, 'game_points': float, 'round': int}
+REQUIRED_FIELDS = ('eventId', 'team1', 'team2', 'result')
+
+
+def iter_json_array(stream, chunk_size=CHUNK_SIZE):
+    """
+    Yield the elements of a JSON array read incrementally from a binary stream
+
+    Only one chunk plus the element being decoded is held in memory.
+
+    Raises:
+        ValueError: If the body is not a JSON array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    state = {'buffer': '', 'position': 0, 'eof': False}
+
+    def read_more():
+        chunk = stream.read(chunk_size)
+        state['eof'] = not chunk
+        state['buffer'] = state['buffer'][state['position']:] + text_decoder.decode(chunk, final=state['eof'])
+        state['position'] = 0
+
+    def peek():
+        """Next non-whitespace character, or '' at the end of the body"""
+        while True:
+            buffer, position = state['buffer'], state['position']
+            while position < len(buffer) and buffer[position] in ' \t\r\n':
+                position += 1
+            state['position'] = position
+            if position < len(buffer):
+                return buffer[position]
+            if state['eof']:
+                return ''
+            read_more()
+
+    if peek() != '[':
+        raise ValueError("Expected a JSON array")
+    state['position'] += 1
+    if peek() == ']':
+        return
+
+    while True:
+        peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(state['buffer'], state['position'])
+                # A number ending exactly at the chunk boundary may continue in the next chunk
+                if end < len(state['buffer']) or state['eof']:
+                    break
+            except json.JSONDecodeError:
+                if state['eof']:
+                    raise ValueError("Invalid JSON array")
+            read_more()
+        state['position'] = end
+        yield value
+
+        separator = peek()
+        if separator == ']':
+            return
+        if separator != ',':
+            raise ValueError("Invalid JSON array")
+        state['position'] += 1
+
+
+def iter_csv_rows(stream):
+    """
+    Yield one dictionary per CSV line
+
+    The header row names the fields of /api/match/add: eventId, team1,
+    team2, result, match_points, game_points, date, round.
+
+    Empty cells are dropped, so a blank column means "not given" as in
+    the JSON bodies /api/match/add accepts.
+    """
+    text = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+    for row in csv.DictReader(text):
+        match = {}
+        for field, value in row.items():
+            if field is None or value is None:
+                continue
+            value = value.strip()
+            if value != '':
+                match[field.strip()] = value
+        yield match
+
+
+def validate_matches(rows, events, defaults=None):
+    """
+    Validate every row in one pass
+
+    Args:
+        rows: Iterable of match dictionaries
+        events: EventRegistry; rows are checked by their event's validate_match hook
+        defaults: Fields applied to rows that omit them (e.g. {'eventId': 'chess'})
+
+    Returns:
+        (matches, errors) with errors as [{'row': 1-based number, 'error': message}]
+    """
+    matches = []
+    errors = []
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append({'row': number, 'error': 'Expected an object'})
+            continue
+        match = {**(defaults or {}), **row}
+        error = _row_error(match, events)
+        if error:
+            errors.append({'row': number, 'error': error})
+        else:
+            matches.append(match)
+    return matches, errors
+
+
+def _row_error(match, events):
+    for field in REQUIRED_FIELDS:
+        if not match.get(field):
+            return f"Missing required field: {field}"
+    for field, value in match.items():
+        # Sheets rejects nested values when the write is flushed, long after the request returned
+        if value is not None and not isinstance(value, (str, int, float, bool)):
+            return f"{field} must be a string or number"
+    if match['eventId'] not in events:
+        return f"Unknown event: {match['eventId']}"
+    if match['team1'] == match['team2']:
+        return "team1 and team2 must be different"
+    for field, convert in NUMERIC_FIELDS.items():
+        if field in match:
+            try:
+                match[field] = convert(match[field])
+            except (TypeError, ValueError):
+                return f"{field} must be a number"
+
+    handlers = events.get(match['eventId'])
+    if handlers.validate_match:
+        is_valid, error = handlers.validate_match(match)
+        if not is_valid:
+            return error
+    return None
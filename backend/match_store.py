@@ -0,0 +1,102 @@
+"""
+In-process index over the Matches sheet
+"""
+
+import threading
+
+# Column order of the Matches sheet (A:H)
+MATCH_FIELDS = ('eventId', 'team', 'opponent', 'result', 'match_points', 'game_points', 'date', 'round')
+
+
+def parse_match_row(row):
+    """Convert a raw Matches sheet row into a match dictionary"""
+    return {
+        'eventId': row[0] if len(row) > 0 else '',
+        'team': row[1] if len(row) > 1 else '',
+        'opponent': row[2] if len(row) > 2 else '',
+        'result': row[3] if len(row) > 3 else '',
+        'match_points': float(row[4]) if len(row) > 4 and row[4] else 0,
+        'game_points': float(row[5]) if len(row) > 5 and row[5] else 0,
+        'date': row[6] if len(row) > 6 else '',
+        'round': int(row[7]) if len(row) > 7 and row[7] else 0
+    }
+
+
+class MatchStore:
+    """
+    Matches bucketed by event id, and by team within each event.
+
+    The store is rebuilt only when the underlying sheet values change
+    (`load`), and new results are appended to their buckets (`add`), so
+    per-event reads never scan other events' rows. `generation` is bumped
+    when a reload finds different matches, so consumers holding derived
+    state can tell a rebuild apart from appends; re-reading unchanged
+    rows (e.g. after a cache expiry) keeps the store and its generation.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._source = None
+        self._by_event = {}  # event_id -> [match, ...] in sheet order
+        self._by_team = {}   # event_id -> {team: [match, ...]}
+        self._lock = threading.Lock()
+
+    def is_loaded_from(self, rows):
+        """Whether the index was built from this exact list of sheet rows"""
+        return self._source is rows
+
+    def load(self, rows):
+        """Rebuild the index from raw Matches sheet rows"""
+        by_event = {}
+        by_team = {}
+        for row in rows:
+            if len(row) == 0 or not row[0]:
+                continue
+            match = parse_match_row(row)
+            by_event.setdefault(match['eventId'], []).append(match)
+            by_team.setdefault(match['eventId'], {}).setdefault(match['team'], []).append(match)
+
+        with self._lock:
+            self._source = rows
+            if by_event == self._by_event:
+                return
+            self._by_event = by_event
+            self._by_team = by_team
+            self.generation += 1
+
+    def add(self, matches):
+        """Append already-parsed matches to their event and team buckets"""
+        with self._lock:
+            for match in matches:
+                event_id = match['eventId']
+                self._by_event.setdefault(event_id, []).append(match)
+                self._by_team.setdefault(event_id, {}).setdefault(match['team'], []).append(match)
+
+    def event_matches(self, event_id):
+        """All matches for an event, in the order they were recorded"""
+        with self._lock:
+            return list(self._by_event.get(event_id, []))
+
+    def event_matches_since(self, event_id, generation, start):
+        """
+        Matches recorded for an event after a known position
+
+        Args:
+            event_id: Event to read
+            generation: Store generation the caller last read from
+            start: Number of the event's matches the caller has already seen
+
+        Returns:
+            (current_generation, matches). If the store was rebuilt since
+            `generation`, all of the event's matches are returned.
+        """
+        with self._lock:
+            matches = self._by_event.get(event_id, [])
+            if generation != self.generation:
+                return self.generation, list(matches)
+            return self.generation, matches[start:]
+
+    def team_matches(self, event_id):
+        """Matches for an event grouped by team: {team: [match, ...]}"""
+        with self._lock:
+            return {team: list(matches) for team, matches in self._by_team.get(event_id, {}).items()}
@@ -0,0 +1,197 @@
+"""
+In-memory spreadsheet backend for local development and load testing
+"""
+
+import collections
+import os
+import random
+import threading
+import time
+
+from sheets_connector import SheetsConnector
+from sheet_ranges import column_letter, parse_range, trim_rows
+
+# Header rows of the sheets every spreadsheet has, so data starts on row 2 as in the real sheet
+HEADERS = {
+    'Fixtures': ['EventId', 'Div1', 'Div2', 'Date', 'Time', 'Venue', 'Status', 'Winner', 'Score', 'FixtureId'],
+    'Matches': ['Event', 'Team', 'Opponent', 'Result', 'MatchPoints', 'GamePoints', 'Date', 'RoundNumber'],
+}
+STANDINGS_HEADER = ['Division', 'Gold', 'Silver', 'Bronze', 'Points']
+
+RESULTS = ('win', 'loss', 'draw')
+OPPOSITE = {'win': 'loss', 'loss': 'win', 'draw': 'draw'}
+MATCH_POINTS = {'win': 2, 'draw': 1, 'loss': 0}
+
+
+class QuotaExceededError(Exception):
+    """Raised when a simulated per-minute request quota is used up (HTTP 429 in Sheets)"""
+    status_code = 429
+
+
+class RangeNotFoundError(Exception):
+    """Raised for a range on a sheet that does not exist (HTTP 400 "Unable to parse range" in Sheets)"""
+    status_code = 400
+
+
+def _cell(value):
+    """Store cells the way Sheets returns them (formatted strings)"""
+    return '' if value is None else str(value)
+
+
+class MemoryConnector(SheetsConnector):
+    """
+    SheetsConnector whose spreadsheet lives in process memory.
+
+    Only the I/O primitives are replaced: each sheet is a list of rows
+    addressed by row number, and reads, appends and range updates behave
+    like the Sheets API (formatted string cells, trailing blanks trimmed,
+    appends after the last row). Everything above them - cache, row
+    indexes, match store, revisions - is the production code path.
+
+    The spreadsheet starts with the Fixtures and Matches sheets; event
+    sheets exist once `add_event_sheets` or `seed_tournament` creates
+    them, and any other sheet name fails as it does in Sheets. Latency and
+    per-minute read/write quotas can be simulated, and `seed_tournament`
+    fills the sheets with a synthetic tournament.
+
+    Environment:
+        MEMORY_LATENCY_MS: Delay added to every read/write call
+        MEMORY_READ_QUOTA_PER_MINUTE / MEMORY_WRITE_QUOTA_PER_MINUTE: 0 = unlimited
+    """
+
+    use_write_queue = False
+
+    def _connect(self):
+        print("Running in MOCK mode with an in-memory spreadsheet")
+        self._tables = {sheet: [list(header)] for sheet, header in HEADERS.items()}  # sheet -> [row, ...], index 0 is row 1
+        self._tables_lock = threading.Lock()
+        self.latency = float(os.getenv('MEMORY_LATENCY_MS', 0)) / 1000
+        self.quotas = {
+            'read': int(os.getenv('MEMORY_READ_QUOTA_PER_MINUTE', 0)),
+            'write': int(os.getenv('MEMORY_WRITE_QUOTA_PER_MINUTE', 0)),
+        }
+        self.calls = collections.Counter()  # 'read' / 'write' -> API calls made
+        self._recent_calls = {kind: collections.deque() for kind in self.quotas}
+
+    def _reconnect(self):
+        """Nothing to reconnect; a forked worker keeps its own copy of the spreadsheet"""
+
+    def _request(self, kind):
+        """Account for one simulated API call"""
+        quota = self.quotas[kind]
+        with self._tables_lock:
+            if quota:
+                now = time.monotonic()
+                recent = self._recent_calls[kind]
+                while recent and recent[0] <= now - 60:
+                    recent.popleft()
+                if len(recent) >= quota:
+                    raise QuotaExceededError(f"Quota exceeded: {quota} {kind} requests per minute")
+                recent.append(now)
+            self.calls[kind] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _table(self, sheet):
+        table = self._tables.get(sheet)
+        if table is None:
+            raise RangeNotFoundError(f"Unable to parse range: {sheet}")
+        return table
+
+    def add_event_sheets(self, event_ids):
+        """Create an empty medal sheet for each event that does not have one yet"""
+        with self._tables_lock:
+            for event_id in event_ids:
+                self._tables.setdefault(event_id.replace('-', '_').title(), [list(STANDINGS_HEADER)])
+
+    # In-memory I/O primitives
+
+    def _read(self, range_name):
+        sheet, first_col, first_row, last_col, last_row = parse_range(range_name)
+        table = self._table(sheet)
+        rows = table[first_row - 1:last_row]
+        return trim_rows(row[first_col:last_col + 1] for row in rows)
+
+    def _execute_get(self, range_name):
+        self._request('read')
+        with self._tables_lock:
+            return self._read(range_name)
+
+    def _execute_batch_get(self, ranges):
+        self._request('read')
+        with self._tables_lock:
+            return [self._read(range_name) for range_name in ranges]
+
+    def _execute_append(self, range_name, rows):
+        self._request('write')
+        sheet = parse_range(range_name)[0]
+        with self._tables_lock:
+            table = self._table(sheet)
+            while len(table) > 1 and not any(table[-1]):
+                table.pop()
+            table.extend([_cell(value) for value in row] for row in rows)
+
+    def _execute_batch_update(self, data):
+        self._request('write')
+        with self._tables_lock:
+            for range_name, values in data:
+                sheet, first_col, first_row, _, _ = parse_range(range_name)
+                table = self._table(sheet)
+                for offset, cells in enumerate(values):
+                    row_number = first_row + offset
+                    while len(table) < row_number:
+                        table.append([])
+                    row = table[row_number - 1]
+                    row.extend([''] * (first_col + len(cells) - len(row)))
+                    row[first_col:first_col + len(cells)] = [_cell(value) for value in cells]
+
+    # Synthetic data
+
+    def seed_tournament(self, event_ids, divisions=5, matches_per_event=20, fixtures_per_event=10, seed=None):
+        """
+        Replace the spreadsheet with a random tournament
+
+        Args:
+            event_ids: Events to fill (one medal sheet each)
+            divisions: Number of divisions, named A, B, C, ...
+            matches_per_event: Results per event (each written as two mirrored Matches rows)
+            fixtures_per_event: Fixtures per event
+            seed: Random seed, for reproducible data
+        """
+        rng = random.Random(seed)
+        names = [column_letter(index) for index in range(divisions)]
+        tables = {sheet: [list(header)] for sheet, header in HEADERS.items()}
+
+        for event_id in event_ids:
+            standings = tables[event_id.replace('-', '_').title()] = [list(STANDINGS_HEADER)]
+            for name in names:
+                standings.append([name] + [str(rng.randint(0, 3)) for _ in range(3)] + ['0'])
+
+            for number in range(matches_per_event):
+                team, opponent = rng.sample(names, 2)
+                result = rng.choice(RESULTS)
+                game_points = rng.randint(0, 5)
+                date = f'2024-01-{number % 28 + 1:02d}'
+                round_num = str(number // max(divisions // 2, 1) + 1)
+                tables['Matches'].append([event_id, team, opponent, result, str(MATCH_POINTS[result]), str(game_points), date, round_num])
+                tables['Matches'].append([
+                    event_id, opponent, team, OPPOSITE[result], str(MATCH_POINTS[OPPOSITE[result]]),
+                    str(rng.randint(0, 5)), date, round_num
+                ])
+
+            for number in range(fixtures_per_event):
+                team, opponent = rng.sample(names, 2)
+                tables['Fixtures'].append([
+                    event_id, team, opponent, f'2024-02-{number % 28 + 1:02d}',
+                    f'{9 + number % 8}:00', f'Venue {number % 4 + 1}', 'scheduled', '', '',
+                    f'{event_id}-{rng.getrandbits(32):08x}'
+                ])
+
+        with self._tables_lock:
+            replaced = set(self._tables) | set(tables)
+            self._tables = tables
+        with self._row_index_lock:
+            self._row_indexes.clear()
+        self.cache.clear()
+        for sheet in replaced:
+            self._bump_revision(sheet)
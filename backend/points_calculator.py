@@ -1,65 +1,142 @@
-def calculate_standings(raw_data, calc_func=None):
+import numpy as np
+
+# Points per Gold, Silver, Bronze
+MEDAL_WEIGHTS = {
+    'sports': np.array([3, 2, 1]),
+    'cultural': np.array([5, 3, 2]),
+}
+DEFAULT_WEIGHTS = MEDAL_WEIGHTS['sports']
+
+
+def load_medal_table(raw_data):
+    """
+    Load Division/Gold/Silver/Bronze rows into columnar form
+
+    Args:
+        raw_data: List of lists from Google Sheets [Division, Gold, Silver, Bronze, Points]
+
+    Returns:
+        (divisions, medals) where medals is an int array of shape (divisions, 3)
+    """
+    rows = [row for row in raw_data if len(row) >= 4]
+    divisions = [row[0] for row in rows]
+    medals = np.array(
+        [(row[1] or 0, row[2] or 0, row[3] or 0) for row in rows],
+        dtype=np.int64
+    ).reshape(len(rows), 3)
+    return divisions, medals
+
+
+def rank_points(points, method='competition'):
+    """
+    Rank a points vector, highest first
+
+    Args:
+        points: 1-D array of points
+        method: 'competition' (1, 2, 2, 4) or 'dense' (1, 2, 2, 3)
+
+    Returns:
+        (order, ranks) - indices sorted best first, and the rank of each sorted entry
+    """
+    order = np.argsort(-points, kind='stable')
+    sorted_points = points[order]
+    if len(sorted_points) == 0:
+        return order, sorted_points.astype(np.int64)
+
+    new_score = np.concatenate(([True], sorted_points[1:] != sorted_points[:-1]))
+    if method == 'dense':
+        ranks = np.cumsum(new_score)
+    else:
+        positions = np.arange(1, len(sorted_points) + 1)
+        ranks = np.maximum.accumulate(np.where(new_score, positions, 0))
+    return order, ranks
+
+
+def calculate_standings(raw_data, calc_func=None, weights=None, ranking='competition'):
     """
     Calculate standings with points based on medals
-    
+
     Args:
         raw_data: List of lists from Google Sheets [Division, Gold, Silver, Bronze, Points]
         calc_func: Optional function to calculate points for a specific event
-    
+        weights: Optional (gold, silver, bronze) weights, e.g. MEDAL_WEIGHTS['cultural']
+        ranking: 'competition' or 'dense'
+
+    Returns:
+        List of standings dictionaries, best first, each with a 'rank'
+    """
+    divisions, medals = load_medal_table(raw_data)
+
+    if calc_func:
+        # Use custom calculation logic from the sport module
+        points = np.array([
+            calc_func({'gold': int(gold), 'silver': int(silver), 'bronze': int(bronze)})
+            for gold, silver, bronze in medals
+        ])
+    else:
+        # Default: one dot product over the whole table (Gold=3pts, Silver=2pts, Bronze=1pt)
+        points = medals @ (DEFAULT_WEIGHTS if weights is None else np.asarray(weights))
+
+    return build_standings(divisions, medals, points, ranking)
+
+
+def build_standings(divisions, medals, points, ranking='competition'):
+    """
+    Rank a columnar medal table into standings rows
+
+    Args:
+        divisions: Division names
+        medals: Int array of shape (divisions, 3)
+        points: Points array, one entry per division
+        ranking: 'competition' or 'dense'
+
     Returns:
-        List of standings dictionaries
+        List of standings dictionaries, best first, each with a 'rank'
     """
-    standings = []
-    
-    for row in raw_data:
-        if len(row) < 4:
-            continue
-        
-        division = row[0]
-        gold = int(row[1]) if len(row) > 1 and row[1] else 0
-        silver = int(row[2]) if len(row) > 2 and row[2] else 0
-        bronze = int(row[3]) if len(row) > 3 and row[3] else 0
-        
-        if calc_func:
-            # Use custom calculation logic from the sport module
-            performance_data = {
-                'gold': gold,
-                'silver': silver,
-                'bronze': bronze
-            }
-            points = calc_func(performance_data)
-        else:
-            # Default fallback logic
-            # Gold=3pts, Silver=2pts, Bronze=1pt
-            points = (gold * 3) + (silver * 2) + (bronze * 1)
-        
-        standings.append({
-            'division': division,
-            'gold': gold,
-            'silver': silver,
-            'bronze': bronze,
-            'points': points
-        })
-    
-    return standings
+    order, ranks = rank_points(np.asarray(points), ranking)
+    medals = np.asarray(medals).tolist()
+    points = np.asarray(points).tolist()
+
+    return [
+        {
+            'division': divisions[index],
+            'gold': medals[index][0],
+            'silver': medals[index][1],
+            'bronze': medals[index][2],
+            'points': points[index],
+            'rank': rank
+        }
+        for index, rank in zip(order.tolist(), ranks.tolist())
+    ]
 
 
 def calculate_event_points(event_type, gold, silver, bronze):
     """
     Calculate points for specific event type
-    
+
     Args:
         event_type: 'sports' or 'cultural'
         gold, silver, bronze: Medal counts
-    
+
     Returns:
         Calculated points
     """
-    # TODO: Implement different point systems for sports vs cultural
-    # Placeholder logic
-    if event_type == 'sports':
-        return (gold * 3) + (silver * 2) + (bronze * 1)
-    elif event_type == 'cultural':
-        return (gold * 5) + (silver * 3) + (bronze * 2)
-    
-    return 0
+    weights = MEDAL_WEIGHTS.get(event_type)
+    if weights is None:
+        return 0
+    return int(np.dot(weights, [gold, silver, bronze]))
+
+
+def calculate_weighted_points(medals, weights):
+    """
+    Points for many events at once, each under its own weights
+
+    Args:
+        medals: Int array of shape (events, divisions, 3) with Gold/Silver/Bronze counts
+        weights: (gold, silver, bronze) weights, one per event
+
+    Returns:
+        Array of shape (events, divisions) with each event's points per division
+    """
+    weights = np.array(weights).reshape(len(weights), 3)
+    return np.einsum('edm,em->ed', np.asarray(medals), weights)
@@ -0,0 +1,53 @@
+"""
+Key -> row number index for a Google Sheet
+"""
+
+
+class RowIndex:
+    """
+    Maps a key column (e.g. division name) to sheet row numbers.
+
+    Built once from the key column, then kept in step with appends via
+    `reserve`, so targeted writes need no read-before-write scan. `conflicts`
+    checks the index against freshly read sheet data to detect rows that
+    were inserted, moved or deleted outside the app.
+
+    Args:
+        keys: Key column values, in sheet order, starting at `first_row`
+        first_row: Sheet row number of the first key (2 skips the header)
+    """
+
+    def __init__(self, keys, first_row=2):
+        self.first_row = first_row
+        self.rows = {}
+        for offset, key in enumerate(keys):
+            if key and key not in self.rows:
+                self.rows[key] = first_row + offset
+        self.next_row = first_row + len(keys)
+
+    def get(self, key):
+        """Row number for a key, or None"""
+        return self.rows.get(key)
+
+    def reserve(self, key):
+        """Record that `key` is being appended and return its row number"""
+        row = self.rows[key] = self.next_row
+        self.next_row += 1
+        return row
+
+    def conflicts(self, keys):
+        """
+        Whether fresh sheet data disagrees with the index
+
+        Keys reserved by appends that have not reached the sheet yet are
+        not treated as conflicts.
+        """
+        if self.first_row + len(keys) > self.next_row:
+            return True
+        seen = set()
+        for offset, key in enumerate(keys):
+            if key and key not in seen:
+                seen.add(key)
+                if self.rows.get(key) != self.first_row + offset:
+                    return True
+        return False
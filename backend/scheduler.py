@@ -0,0 +1,269 @@
+"""
+Round-robin and knockout fixture generation with venue/time scheduling
+"""
+
+FORMATS = ('round-robin', 'knockout')
+
+# Stand-in opponent for the division sitting out a round-robin round
+REST = None
+
+# Slot placements schedule() may try, backtracking included, before giving up
+MAX_SEARCH_STEPS = 20000
+
+
+def round_robin(divisions):
+    """
+    Every division plays every other once (circle method)
+
+    With an odd number of divisions one sits out each round. Home and away
+    (division1/division2) alternate so no division is always listed first.
+
+    Returns:
+        List of {'round', 'match', 'division1', 'division2', 'after'} in round order
+    """
+    field = list(divisions) + ([REST] if len(divisions) % 2 else [])
+    count = len(field)
+    matches = []
+    for round_index in range(count - 1):
+        number = 0
+        for i in range(count // 2):
+            home, away = field[i], field[count - 1 - i]
+            if home is REST or away is REST:
+                continue
+            if (round_index + i) % 2:
+                home, away = away, home
+            number += 1
+            matches.append({'round': round_index + 1, 'match': number, 'division1': home, 'division2': away, 'after': []})
+        # Keep the first division fixed and rotate the rest one place
+        field = [field[0], field[-1]] + field[1:-1]
+    return matches
+
+
+def seed_order(size):
+    """Bracket positions of seeds 1..size so the top seeds meet as late as possible, e.g. [1, 4, 2, 3]"""
+    order = [1]
+    while len(order) < size:
+        total = len(order) * 2 + 1
+        order = [seed for position in order for seed in (position, total - position)]
+    return order
+
+
+def knockout(divisions):
+    """
+    Single-elimination bracket seeded in list order
+
+    The field is padded to a power of two with byes, which go to the top
+    seeds; later rounds name their entrants 'Winner R<round>M<match>' and
+    list the feeding matches under 'after'.
+
+    Returns:
+        List of {'round', 'match', 'division1', 'division2', 'after'} in round order
+    """
+    if len(divisions) < 2:
+        return []
+    size = 1 << (len(divisions) - 1).bit_length()
+    # Entrant: (name, (round, match) it comes from, or None), None for a bye
+    entrants = [(divisions[seed - 1], None) if seed <= len(divisions) else None for seed in seed_order(size)]
+
+    matches = []
+    round_num = 1
+    while len(entrants) > 1:
+        next_entrants = []
+        number = 0
+        for first, second in zip(entrants[::2], entrants[1::2]):
+            if first is None or second is None:
+                next_entrants.append(first or second)
+                continue
+            number += 1
+            matches.append({
+                'round': round_num,
+                'match': number,
+                'division1': first[0],
+                'division2': second[0],
+                'after': [key for key in (first[1], second[1]) if key],
+            })
+            next_entrants.append((f'Winner R{round_num}M{number}', (round_num, number)))
+        entrants = next_entrants
+        round_num += 1
+    return matches
+
+
+def generate(format_name, divisions):
+    """Matches for an event in the given format ('round-robin' or 'knockout')"""
+    if format_name == 'round-robin':
+        return round_robin(divisions)
+    if format_name == 'knockout':
+        return knockout(divisions)
+    raise ValueError(f"Unknown format: {format_name}; choose from {list(FORMATS)}")
+
+
+def parse_time(value):
+    """'9:00' / '09:00' -> minutes after midnight"""
+    hours, minutes = str(value).strip().split(':')[:2]
+    return int(hours) * 60 + int(minutes)
+
+
+def format_time(minutes):
+    return f'{minutes // 60:02d}:{minutes % 60:02d}'
+
+
+class Timetable:
+    """
+    Slots on a set of dates and venues, with what is already booked in them.
+
+    A slot is a start time on a date; every match lasts `slot_minutes`.
+    Divisions are booked as (start, end) intervals per date, so existing
+    fixtures of other events (or at odd times) are respected too.
+
+    Args:
+        dates: Dates to schedule on, in order
+        start, end: Daily window, 'HH:MM'; the last match must finish by `end`
+        slot_minutes: Match length
+        venues: Shared venues
+        capacity: Concurrent matches per venue
+        rest_minutes: Minimum gap between two matches of one division
+    """
+
+    def __init__(self, dates, start, end, slot_minutes, venues, capacity=1, rest_minutes=0):
+        if slot_minutes <= 0 or capacity <= 0 or rest_minutes < 0:
+            raise ValueError("slot_minutes and capacity must be positive and rest_minutes not negative")
+        if not dates or not venues:
+            raise ValueError("At least one date and one venue are required")
+        self.dates = list(dates)
+        self.venues = list(venues)
+        self.slot_minutes = slot_minutes
+        self.capacity = capacity
+        self.rest_minutes = rest_minutes
+        first, last = parse_time(start), parse_time(end)
+        self.minutes = list(range(first, last - slot_minutes + 1, slot_minutes))
+        self.slots = [(day, minute) for day in range(len(self.dates)) for minute in self.minutes]
+        self._day = {date: day for day, date in enumerate(self.dates)}
+        self._venue_load = {}  # (day, minute, venue) -> matches booked
+        self._busy = {}        # (division, day) -> [(start, end), ...]
+
+    def book(self, day, minute, venue, divisions):
+        """Record a match; `minute` need not be on the slot grid"""
+        end = minute + self.slot_minutes
+        for slot_minute in self.minutes:
+            if slot_minute < end and minute < slot_minute + self.slot_minutes:
+                key = (day, slot_minute, venue)
+                self._venue_load[key] = self._venue_load.get(key, 0) + 1
+        for division in divisions:
+            self._busy.setdefault((division, day), []).append((minute, end))
+
+    def unbook(self, day, minute, venue, divisions):
+        """Undo a `book` with the same arguments"""
+        end = minute + self.slot_minutes
+        for slot_minute in self.minutes:
+            if slot_minute < end and minute < slot_minute + self.slot_minutes:
+                self._venue_load[(day, slot_minute, venue)] -= 1
+        for division in divisions:
+            self._busy[(division, day)].remove((minute, end))
+
+    def book_fixtures(self, fixtures, divisions=None):
+        """
+        Book existing fixtures that fall on the timetable's dates
+
+        Args:
+            fixtures: Fixture dictionaries (any event)
+            divisions: Only these divisions are marked busy (skips other events' placeholders)
+        """
+        for fixture in fixtures:
+            day = self._day.get(fixture.get('date'))
+            if day is None:
+                continue
+            try:
+                minute = parse_time(fixture.get('time'))
+            except ValueError:
+                continue
+            playing = [fixture.get('division1'), fixture.get('division2')]
+            if divisions is not None:
+                playing = [division for division in playing if division in divisions]
+            self.book(day, minute, fixture.get('venue'), playing)
+
+    def is_free(self, division, day, minute):
+        end = minute + self.slot_minutes
+        for busy_start, busy_end in self._busy.get((division, day), ()):
+            if minute < busy_end + self.rest_minutes and busy_start < end + self.rest_minutes:
+                return False
+        return True
+
+    def free_venue(self, day, minute):
+        """Least-loaded venue with room at this slot, or None"""
+        loads = [(self._venue_load.get((day, minute, venue), 0), index) for index, venue in enumerate(self.venues)]
+        load, index = min(loads)
+        return self.venues[index] if load < self.capacity else None
+
+
+def schedule(matches, timetable):
+    """
+    Assign every match the earliest slot and venue that satisfies the constraints
+
+    Matches are placed in order (earliest-fit list scheduling): a match goes
+    in the first slot where a venue has room, neither division is playing
+    within `rest_minutes`, and every match it depends on ('after') has
+    finished at least `rest_minutes` earlier. Knockout placeholders such as
+    'Winner R1M1' are tracked like divisions. When a match has no slot left,
+    the matches before it are moved to their next slots (backtracking), so
+    a schedule is found whenever one exists within MAX_SEARCH_STEPS
+    placements; if the greedy placement works, it is the one returned.
+
+    Args:
+        matches: From round_robin / knockout
+        timetable: Timetable, with existing fixtures already booked
+
+    Returns:
+        The matches with 'date', 'time' and 'venue' added
+
+    Raises:
+        ValueError: If the timetable runs out of slots
+    """
+    finished = {}                       # (round, match) -> (day, end minute)
+    candidates = [None] * len(matches)  # match position -> generator of its remaining slots
+    placed = [None] * len(matches)      # match position -> (day, minute, venue)
+    position = most_placed = steps = 0
+    while 0 <= position < len(matches) and steps < MAX_SEARCH_STEPS:
+        match = matches[position]
+        divisions = (match['division1'], match['division2'])
+        if placed[position]:
+            timetable.unbook(*placed[position], divisions)
+            placed[position] = None
+        if candidates[position] is None:
+            candidates[position] = _free_slots(match, timetable, finished)
+        slot = next(candidates[position], None)
+        steps += 1
+        if slot is None:
+            candidates[position] = None
+            position -= 1
+            continue
+        timetable.book(*slot, divisions)
+        placed[position] = slot
+        finished[(match['round'], match['match'])] = (slot[0], slot[1] + timetable.slot_minutes)
+        position += 1
+        most_placed = max(most_placed, position)
+
+    if position != len(matches):
+        for slot, match in zip(placed, matches):
+            if slot:
+                timetable.unbook(*slot, (match['division1'], match['division2']))
+        raise ValueError(
+            f"Not enough slots: scheduled {most_placed} of {len(matches)} matches; "
+            "add dates, venues or capacity, or shorten the rest gap"
+        )
+    return [
+        {**match, 'date': timetable.dates[day], 'time': format_time(minute), 'venue': venue}
+        for match, (day, minute, venue) in zip(matches, placed)
+    ]
+
+
+def _free_slots(match, timetable, finished):
+    """Slots, earliest first, where a match fits the timetable as currently booked: (day, minute, venue)"""
+    ready = max((finished[key] for key in match['after']), default=(0, None))
+    for day, minute in timetable.slots:
+        if day < ready[0] or (day == ready[0] and ready[1] is not None and minute < ready[1] + timetable.rest_minutes):
+            continue
+        if not (timetable.is_free(match['division1'], day, minute) and timetable.is_free(match['division2'], day, minute)):
+            continue
+        venue = timetable.free_venue(day, minute)
+        if venue is not None:
+            yield day, minute, venue
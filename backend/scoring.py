@@ -0,0 +1,167 @@
+"""
+Declarative event scoring
+
+An event module describes its scoring as data in a `SCORING` dict, which
+EventHandlers compiles once when the module is imported. Modules scored
+like most events (DEFAULT_SCORING) leave SCORING out; the others declare
+only what they need:
+
+    SCORING = {
+        # Per result: the counter column it increments and the points it awards
+        'results': {
+            'win': {'count': 'won', 'points': {'match_points': 3}},
+            'draw': {'count': 'drawn', 'points': {'match_points': 1}},
+            'loss': {'count': 'lost', 'points': {'match_points': 0}},
+        },
+        # Summed from every match row (value used when the row lacks the field);
+        # a result may override these with its own 'match_fields'
+        'match_fields': {'game_points': 0},
+        # Extra points when a match field reaches a threshold
+        'bonuses': [{'field': 'game_points', 'min': 5, 'points': {'bonus_points': 1}}],
+        # Event points per Gold, Silver, Bronze (defaults to the category weights)
+        'medals': {'gold': 3, 'silver': 2, 'bronze': 1},
+        # Stat that ranks the table and that calculate_match_points reports
+        'ranking': 'match_points',
+        # Optional standings columns; derived from the stats when omitted
+        'columns': [{'key': 'division', 'label': 'Division', 'type': 'text'}, ...],
+    }
+
+Hooks a module defines by hand (e.g. calculate_division_points) are used
+instead of the compiled ones.
+"""
+
+import numpy as np
+
+SPEC_KEYS = {'results', 'match_fields', 'bonuses', 'medals', 'ranking', 'columns'}
+RESULT_KEYS = {'count', 'points', 'match_fields'}
+BONUS_KEYS = {'field', 'min', 'points', 'result'}
+
+# Win/draw/loss with 2/1/0 match points and game points summed from the match rows
+DEFAULT_RESULTS = {
+    'win': {'count': 'won', 'points': {'match_points': 2}},
+    'draw': {'count': 'drawn', 'points': {'match_points': 1}},
+    'loss': {'count': 'lost', 'points': {'match_points': 0}},
+}
+DEFAULT_MATCH_FIELDS = {'game_points': 0}
+DEFAULT_SCORING = {'results': DEFAULT_RESULTS, 'match_fields': DEFAULT_MATCH_FIELDS}
+
+
+def _check_keys(name, data, allowed):
+    unknown = set(data) - allowed
+    if unknown:
+        raise ValueError(f"Unknown {name} keys: {sorted(unknown)}")
+
+
+class CompiledScoring:
+    """
+    Scoring functions specialised for one event.
+
+    Every result is reduced to flat tuples of (stat, increment) and
+    (field, default) pairs when the spec is compiled, so applying a match
+    is one dict lookup followed by straight-line additions.
+
+    Args:
+        spec: SCORING dictionary (see module docstring)
+    """
+
+    def __init__(self, spec):
+        _check_keys('scoring', spec, SPEC_KEYS)
+        results = spec.get('results', DEFAULT_RESULTS)
+        match_fields = spec.get('match_fields', DEFAULT_MATCH_FIELDS)
+        bonuses = spec.get('bonuses', [])
+        self.ranking = spec.get('ranking', 'match_points')
+
+        stats = ['played']
+        for result in results.values():
+            _check_keys('result', result, RESULT_KEYS)
+            if result.get('count'):
+                stats.append(result['count'])
+        for result in results.values():
+            stats.extend(result.get('points', {}))
+        stats.extend(match_fields)
+        for result in results.values():
+            stats.extend(result.get('match_fields', {}))
+        for bonus in bonuses:
+            _check_keys('bonus', bonus, BONUS_KEYS)
+            stats.extend(bonus['points'])
+        self.stats = list(dict.fromkeys(stats))
+        self._empty = dict.fromkeys(self.stats, 0)
+
+        self._plans = {}
+        self._match_points = {}
+        for name, result in results.items():
+            points = result.get('points', {})
+            increments = [(result['count'], 1)] if result.get('count') else []
+            increments.extend(points.items())
+            fields = {**match_fields, **result.get('match_fields', {})}
+            result_bonuses = tuple(
+                (bonus['field'], bonus['min'], tuple(bonus['points'].items()))
+                for bonus in bonuses if bonus.get('result') in (None, name)
+            )
+            self._plans[name] = (tuple(increments), tuple(fields.items()), result_bonuses)
+            self._match_points[name] = points.get(self.ranking, 0)
+
+        medals = spec.get('medals')
+        self.medal_weights = None if medals is None else np.array(
+            [medals.get('gold', 0), medals.get('silver', 0), medals.get('bronze', 0)]
+        )
+
+        self.columns = spec.get('columns') or [{'key': 'division', 'label': 'Division', 'type': 'text'}] + [
+            {'key': stat, 'label': stat.replace('_', ' ').title(), 'type': 'number'}
+            for stat in self.stats
+        ]
+
+    def apply_match(self, stats, match):
+        """
+        Add a single match result to a division's running stats
+
+        Args:
+            stats: Dictionary returned by calculate_division_points, updated in place
+            match: Match dictionary with result and the spec's match fields
+        """
+        stats['played'] += 1
+        plan = self._plans.get(match.get('result', '').lower())
+        if plan is None:
+            return
+        increments, fields, bonuses = plan
+        for stat, value in increments:
+            stats[stat] += value
+        for field, default in fields:
+            stats[field] += match.get(field, default)
+        for field, minimum, points in bonuses:
+            if (match.get(field) or 0) >= minimum:
+                for stat, value in points:
+                    stats[stat] += value
+
+    def calculate_division_points(self, performance_data):
+        """
+        Calculate a division's stats from its match results
+
+        Args:
+            performance_data: Dictionary with 'matches' list containing match results
+
+        Returns:
+            Dictionary with one entry per stat of the spec
+        """
+        stats = dict(self._empty)
+        for match in performance_data.get('matches', []):
+            self.apply_match(stats, match)
+        return stats
+
+    def calculate_match_points(self, result):
+        """Ranking points awarded for a result"""
+        return self._match_points.get(result, 0)
+
+    def get_table_structure(self):
+        """
+        Define the standings table structure
+
+        Returns:
+            List of column definitions
+        """
+        return self.columns
+
+
+def compile_scoring(spec):
+    """Compile a SCORING dictionary into its CompiledScoring"""
+    return CompiledScoring(spec)
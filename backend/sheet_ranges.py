@@ -0,0 +1,95 @@
+"""
+A1 range helpers
+"""
+
+import re
+
+_A1_RE = re.compile(r'^([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$')
+
+
+def column_index(letters):
+    """'A' -> 0, 'Z' -> 25, 'AA' -> 26"""
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - ord('A') + 1
+    return index - 1
+
+
+def column_letter(index):
+    """0 -> 'A', 26 -> 'AA'"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord('A') + remainder) + letters
+    return letters
+
+
+def parse_range(range_name):
+    """
+    Split an A1 range such as 'Matches!A2:H' or 'Chess!B5:D5'
+
+    Returns:
+        (sheet, first_col, first_row, last_col, last_row) with 0-based
+        columns and 1-based rows; last_row is None for open-ended ranges
+    """
+    sheet, _, cells = range_name.partition('!')
+    match = _A1_RE.match(cells)
+    if not match:
+        raise ValueError(f"Unsupported range: {range_name}")
+    first_col, first_row, last_col, last_row = match.groups()
+    last_col = last_col or first_col
+    if last_row is None:
+        last_row = first_row
+    return (
+        sheet,
+        column_index(first_col),
+        int(first_row) if first_row else 1,
+        column_index(last_col),
+        int(last_row) if last_row else None
+    )
+
+
+def trim_rows(rows):
+    """Drop trailing empty cells and rows, as the Sheets API does"""
+    trimmed = []
+    for row in rows:
+        row = list(row)
+        while row and row[-1] in ('', None):
+            row.pop()
+        trimmed.append(row)
+    while trimmed and not trimmed[-1]:
+        trimmed.pop()
+    return trimmed
+
+
+def apply_writes(range_name, rows, writes):
+    """
+    Rows of a range as they will read once queued writes reach the sheet
+
+    Args:
+        range_name: Range the rows were read from, e.g. 'Matches!A2:H'
+        rows: Values read from that range
+        writes: [{'op': 'append' | 'update', 'range': ..., 'values': [...]}], oldest first
+
+    Returns:
+        New list of rows; appends land after the last row read
+    """
+    _, first_col, first_row, last_col, last_row = parse_range(range_name)
+    rows = [list(row) for row in rows]
+    for write in writes:
+        _, write_col, write_row, _, _ = parse_range(write['range'])
+        if write['op'] == 'append':
+            write_row = first_row + len(rows)
+        for offset, values in enumerate(write['values']):
+            index = write_row + offset - first_row
+            if index < 0 or (last_row is not None and write_row + offset > last_row):
+                continue
+            while len(rows) <= index:
+                rows.append([])
+            row = rows[index]
+            for column, value in enumerate(values, start=write_col):
+                if first_col <= column <= last_col:
+                    row.extend([''] * (column - first_col + 1 - len(row)))
+                    row[column - first_col] = value
+    return trim_rows(rows)
@@ -0,0 +1,104 @@
+"""
+Read-through cache for Google Sheets ranges
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class SheetsCache:
+    """
+    In-memory TTL cache keyed by sheet range (e.g. 'Matches!A2:H').
+
+    Entries expire after `ttl` seconds and the least recently used entry is
+    evicted once `max_entries` is reached. Writes invalidate by sheet name so
+    only the ranges a write touches are dropped.
+    """
+
+    def __init__(self, ttl=None, max_entries=None):
+        self.ttl = float(ttl if ttl is not None else os.getenv('SHEETS_CACHE_TTL', 30))
+        self.max_entries = int(max_entries if max_entries is not None else os.getenv('SHEETS_CACHE_SIZE', 256))
+        self._entries = OrderedDict()  # range -> (expires_at, values)
+        self._lock = threading.Lock()
+
+    def get(self, range_name):
+        """Return cached values for a range, or None if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(range_name)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if expires_at < time.monotonic():
+                del self._entries[range_name]
+                return None
+            self._entries.move_to_end(range_name)
+            return values
+
+    def set(self, range_name, values):
+        """Store values for a range, evicting the least recently used entry if full"""
+        if self.ttl <= 0 or self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[range_name] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(range_name)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, range_name, loader):
+        """
+        Read-through lookup
+
+        Args:
+            range_name: A1 range used as the cache key
+            loader: Zero-argument callable fetching the values on a miss
+
+        Returns:
+            Cached or freshly loaded values
+        """
+        values = self.get(range_name)
+        if values is None:
+            values = loader()
+            self.set(range_name, values)
+        return values
+
+    def extend(self, range_name, rows):
+        """
+        Append rows to a cached range in place (write-through for appends)
+
+        Returns:
+            The updated cached list, or None if the range was not cached
+        """
+        with self._lock:
+            entry = self._entries.get(range_name)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            entry[1].extend(rows)
+            return entry[1]
+
+    def set_row(self, range_name, index, row):
+        """
+        Replace one row of a cached range in place (write-through for updates)
+
+        Returns:
+            The updated cached list, or None if the range was not cached or is shorter than `index`
+        """
+        with self._lock:
+            entry = self._entries.get(range_name)
+            if entry is None or entry[0] < time.monotonic() or index >= len(entry[1]):
+                return None
+            entry[1][index] = row
+            return entry[1]
+
+    def invalidate(self, *sheet_names):
+        """Drop every cached range belonging to the given sheets"""
+        prefixes = tuple(f'{name}!' for name in sheet_names)
+        with self._lock:
+            for key in [k for k in self._entries if k.startswith(prefixes)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached ranges"""
+        with self._lock:
+            self._entries.clear()
@@ -1,249 +1,503 @@
+import atexit
+import itertools
 import os
+import queue
+import threading
+import uuid
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from google_auth_httplib2 import AuthorizedHttp
 from dotenv import load_dotenv
 
+from sheets_cache import SheetsCache
+from match_store import MatchStore, parse_match_row
+from fixture_store import FixtureNotFoundError, FixtureStore, RESULT_COLUMNS, RESULT_FIELDS, fixture_row, new_fixture_id
+from write_queue import WriteQueue
+from row_index import RowIndex
+from sheet_ranges import apply_writes
+
 load_dotenv()
 
 class SheetsConnector:
-    def __init__(self):
+    # Subclasses whose writes are already local and durable can opt out
+    use_write_queue = True
+    # Methods that make a Sheets API call -> (quota bucket, call name), counted by instrumentation
+    api_calls = {
+        '_execute_get': ('read', 'execute_get'),
+        '_execute_batch_get': ('read', 'execute_batch_get'),
+        '_execute_append': ('write', 'execute_append'),
+        '_execute_batch_update': ('write', 'execute_batch_update'),
+    }
+    
+    def __init__(self, cache=None):
         self.SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
-        self.is_mock = self.SPREADSHEET_ID == 'dummy_spreadsheet_id'
+        self.cache = cache if cache is not None else SheetsCache()
+        self.match_store = MatchStore()
+        self.fixture_store = FixtureStore()
+        self._match_lock = threading.Lock()  # keeps the Matches index in step with appends
+        self._fixture_lock = threading.RLock()  # keeps the Fixtures index and row numbers in step with appends
+        self.write_queue = None
+        self._row_indexes = {}  # event sheet -> RowIndex of divisions
+        self._sheet_locks = {}  # event sheet -> lock serializing its score writes
+        self._row_index_lock = threading.Lock()  # guards the two dicts above, never held during I/O
+        self._revisions = {}  # sheet -> revision number, bumped whenever its content changes
+        self._revision_counter = itertools.count(1)
+        self._fingerprints = {}  # range -> hash of the last values fetched from Sheets
+        self._revision_epoch = uuid.uuid4().hex[:8]  # distinguishes counters across processes/restarts
+        self._overlaid = set()  # sheets cached with queued writes applied on top of a fetch
         
-        if not self.is_mock:
-            self.SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-            self.credentials = Credentials.from_service_account_file(
-                os.getenv('GOOGLE_CREDENTIALS_FILE'),
-                scopes=self.SCOPES
+        self._connect()
+        self._start_write_queue()
+    
+    def _start_write_queue(self):
+        """Write-behind queue; SHEETS_FLUSH_INTERVAL_MS=0 writes synchronously"""
+        flush_interval_ms = int(os.getenv('SHEETS_FLUSH_INTERVAL_MS', 500))
+        if flush_interval_ms > 0 and self.use_write_queue:
+            self.write_queue = WriteQueue(
+                self._execute_append,
+                self._execute_batch_update,
+                flush_interval_ms,
+                os.getenv('SHEETS_JOURNAL_DIR', 'sheets_journal'),
+                on_sent=self._writes_sent
             )
-            self.service = build('sheets', 'v4', credentials=self.credentials)
-            self.sheet = self.service.spreadsheets()
+            self.write_queue.start()
+            atexit.register(self.write_queue.flush)
+    
+    def after_fork(self):
+        """
+        Re-create per-process state in a worker forked from a preloaded master
+        
+        Threads and sockets do not survive fork(), so each worker opens its
+        own API client and write queue (with its own journal). Revisions get
+        a new epoch, since workers count them independently. Cached ranges
+        and indexes loaded by the master are kept.
+        """
+        self._revision_epoch = uuid.uuid4().hex[:8]
+        self._reconnect()
+        if self.write_queue:
+            # The master's queue, journal and atexit flush stay the master's
+            atexit.unregister(self.write_queue.flush)
+            self.write_queue.release_inherited()
+            self.write_queue = None
+            self._start_write_queue()
+    
+    def _load_credentials(self):
+        """Load the service account credentials"""
+        self.SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+        self.credentials = Credentials.from_service_account_file(
+            os.getenv('GOOGLE_CREDENTIALS_FILE'),
+            scopes=self.SCOPES
+        )
+    
+    def _connect(self):
+        """Create the Google Sheets API client"""
+        self._load_credentials()
+        self._reconnect()
+    
+    def _reconnect(self):
+        """(Re)build the API client from the loaded credentials"""
+        self.service = build('sheets', 'v4', credentials=self.credentials)
+        self.sheet = self.service.spreadsheets()
+        self._http_pool = queue.LifoQueue()  # idle AuthorizedHttp connections
+    
+    def _execute(self, request):
+        """
+        Run an API request on a connection no other thread is using
+        
+        httplib2 connections must not be shared between concurrent
+        requests, and the one built into `self.sheet` would be used by
+        every request thread (or greenlet) and the write queue at once.
+        Each call borrows a connection from a pool instead, opening a new
+        one when all are busy.
+        """
+        try:
+            http = self._http_pool.get_nowait()
+        except queue.Empty:
+            http = AuthorizedHttp(self.credentials, http=build_http())
+        try:
+            return request.execute(http=http)
+        finally:
+            self._http_pool.put(http)
+    
+    def _flush_pending(self, ranges):
+        """
+        Flush queued writes before reading any sheet they touch (read-your-writes)
+
+        A failed or backed-off flush leaves the writes queued and the read
+        goes ahead without them rather than failing.
+        """
+        if self.write_queue and any(self.write_queue.has_pending(r.split('!')[0]) for r in ranges):
+            self.write_queue.flush()
+    
+    def _with_pending(self, range_name, rows):
+        """
+        Fetched rows with the writes still queued for their sheet applied on top
+        
+        While flushes are backed off, a read must not drop writes that were
+        already acknowledged. The sheet's cached ranges are dropped once
+        those writes have been sent (see _writes_sent).
+        """
+        if not self.write_queue:
+            return rows
+        sheet_name = range_name.split('!')[0]
+        pending = self.write_queue.pending_writes(sheet_name)
+        if not pending:
+            return rows
+        self._overlaid.add(sheet_name)
+        return apply_writes(range_name, rows, pending)
+    
+    def _writes_sent(self, sheet_names):
+        """Re-read sheets cached with queued writes on top once nothing is queued for them"""
+        stale = [name for name in sheet_names if name in self._overlaid and not self.write_queue.has_pending(name)]
+        if stale:
+            self._overlaid.difference_update(stale)
+            self.cache.invalidate(*stale)
+    
+    def _get_values(self, range_name):
+        """Read a range through the cache, hitting Google Sheets only on a miss"""
+        return self.cache.get_or_load(range_name, lambda: self._fetch_values(range_name))
+    
+    def _fetch_values(self, range_name):
+        """Read a range from Google Sheets"""
+        self._flush_pending([range_name])
+        rows = self._execute_get(range_name)
+        self._record_fetch(range_name, rows)
+        return self._with_pending(range_name, rows)
+    
+    def _batch_get_values(self, ranges):
+        """Read several ranges, fetching all cache misses in a single batchGet call"""
+        values = {range_name: self.cache.get(range_name) for range_name in ranges}
+        missing = [range_name for range_name, rows in values.items() if rows is None]
+        
+        if missing:
+            self._flush_pending(missing)
+            for range_name, rows in zip(missing, self._execute_batch_get(missing)):
+                self._record_fetch(range_name, rows)
+                rows = self._with_pending(range_name, rows)
+                self.cache.set(range_name, rows)
+                values[range_name] = rows
+        
+        return [values[range_name] for range_name in ranges]
+    
+    def _record_fetch(self, range_name, rows):
+        """Bump the sheet's revision if a fetch shows it changed outside the app"""
+        fingerprint = hash(repr(rows))
+        previous = self._fingerprints.get(range_name)
+        self._fingerprints[range_name] = fingerprint
+        if previous is not None and previous != fingerprint:
+            self._bump_revision(range_name.split('!')[0])
+    
+    def _bump_revision(self, sheet_name):
+        self._revisions[sheet_name] = next(self._revision_counter)
+    
+    def get_revision(self, range_name):
+        """
+        Current content revision of the sheet a range belongs to
+        
+        The range is read through the cache first, so an expired entry is
+        refreshed (and external edits detected) before the revision is
+        reported; within the cache TTL this costs no Sheets call.
+        
+        Returns:
+            Opaque revision string, e.g. '3f9a1c2e:7'
+        """
+        self._get_values(range_name)
+        sheet_name = range_name.split('!')[0]
+        return f'{self._revision_epoch}:{self._revisions.get(sheet_name, 0)}'
+    
+    def _append(self, range_name, rows):
+        """Append rows, through the write-behind queue when enabled"""
+        if self.write_queue:
+            self.write_queue.append(range_name, rows)
         else:
-            print("Running in MOCK mode with dummy credentials")
-            self.mock_data = {
-                'Overall': [],
-                'Sports': [],
-                'Cultural': [],
-                'Fixtures': [],
-                'Chess': [],
-                'Matches': [] # Store match-by-match data
-            }
+            self._execute_append(range_name, rows)
     
-    def get_overall_standings(self):
-        """Get overall standings from 'Overall' sheet"""
-        if self.is_mock:
-            return self.mock_data.get('Overall', [])
-            
-        result = self.sheet.values().get(
+    def _update(self, range_name, values):
+        """Overwrite a range, through the write-behind queue when enabled"""
+        if self.write_queue:
+            self.write_queue.update(range_name, values)
+        else:
+            self._execute_batch_update([(range_name, values)])
+    
+    def _execute_get(self, range_name):
+        return self._execute(self.sheet.values().get(
             spreadsheetId=self.SPREADSHEET_ID,
-            range='Overall!A2:E'  # Assuming: Division, Gold, Silver, Bronze, Points
-        ).execute()
-        return result.get('values', [])
-    
-    def get_sports_standings(self):
-        """Get sports standings from 'Sports' sheet"""
-        if self.is_mock:
-            return self.mock_data.get('Sports', [])
-
-        result = self.sheet.values().get(
+            range=range_name
+        )).get('values', [])
+    
+    def _execute_batch_get(self, ranges):
+        result = self._execute(self.sheet.values().batchGet(
             spreadsheetId=self.SPREADSHEET_ID,
-            range='Sports!A2:E'
-        ).execute()
-        return result.get('values', [])
-    
-    def get_cultural_standings(self):
-        """Get cultural standings from 'Cultural' sheet"""
-        if self.is_mock:
-            return self.mock_data.get('Cultural', [])
-
-        result = self.sheet.values().get(
+            ranges=ranges
+        ))
+        return [value_range.get('values', []) for value_range in result.get('valueRanges', [])]
+    
+    def _execute_append(self, range_name, rows):
+        self._execute(self.sheet.values().append(
             spreadsheetId=self.SPREADSHEET_ID,
-            range='Cultural!A2:E'
-        ).execute()
-        return result.get('values', [])
+            range=range_name,
+            valueInputOption='RAW',
+            body={'values': rows}
+        ))
+    
+    def _execute_batch_update(self, data):
+        if len(data) == 1:
+            range_name, values = data[0]
+            self._execute(self.sheet.values().update(
+                spreadsheetId=self.SPREADSHEET_ID,
+                range=range_name,
+                valueInputOption='RAW',
+                body={'values': values}
+            ))
+            return
+        
+        self._execute(self.sheet.values().batchUpdate(
+            spreadsheetId=self.SPREADSHEET_ID,
+            body={
+                'valueInputOption': 'RAW',
+                'data': [{'range': range_name, 'values': values} for range_name, values in data]
+            }
+        ))
     
     def get_event_standings(self, event_id):
         """Get standings for a specific event"""
         sheet_name = event_id.replace('-', '_').title()
-        if self.is_mock:
-            return self.mock_data.get(sheet_name, [])
-
-        result = self.sheet.values().get(
-            spreadsheetId=self.SPREADSHEET_ID,
-            range=f'{sheet_name}!A2:E'
-        ).execute()
-        return result.get('values', [])
+        rows = self._get_values(f'{sheet_name}!A2:E')
+        self._verify_row_index(sheet_name, rows)
+        return rows
     
-    def get_event_fixtures(self, event_id):
-        """Get fixtures for a specific event from Fixtures sheet"""
-        if self.is_mock:
-            rows = self.mock_data.get('Fixtures', [])
-        else:
-            result = self.sheet.values().get(
-                spreadsheetId=self.SPREADSHEET_ID,
-                range='Fixtures!A2:I'  # Event, Div1, Div2, Date, Time, Venue, Status, Winner, Score
-            ).execute()
-            rows = result.get('values', [])
-        fixtures = []
+    def get_all_event_standings(self, event_ids):
+        """
+        Get standings for many events in one round-trip
         
-        for idx, row in enumerate(rows):
-            if len(row) > 0 and row[0] == event_id:
-                fixtures.append({
-                    'id': f'{event_id}-{idx}',
-                    'eventId': row[0] if len(row) > 0 else '',
-                    'division1': row[1] if len(row) > 1 else '',
-                    'division2': row[2] if len(row) > 2 else '',
-                    'date': row[3] if len(row) > 3 else '',
-                    'time': row[4] if len(row) > 4 else '',
-                    'venue': row[5] if len(row) > 5 else '',
-                    'status': row[6] if len(row) > 6 else 'scheduled',
-                    'winner': row[7] if len(row) > 7 else None,
-                    'score': row[8] if len(row) > 8 else None,
-                })
+        Args:
+            event_ids: Event ids (e.g. ['chess', 'group-dance'])
         
-        return fixtures
+        Returns:
+            {event_id: rows} with rows as returned by get_event_standings
+        """
+        sheet_names = [event_id.replace('-', '_').title() for event_id in event_ids]
+        values = self._batch_get_values([f'{sheet_name}!A2:E' for sheet_name in sheet_names])
+        for sheet_name, rows in zip(sheet_names, values):
+            self._verify_row_index(sheet_name, rows)
+        return dict(zip(event_ids, values))
+    
+    def get_fixture_store(self):
+        """Return the Fixtures index, rebuilding it only when the sheet data changed"""
+        rows = self._get_values('Fixtures!A2:J')  # Event, Div1, Div2, Date, Time, Venue, Status, Winner, Score, FixtureId
+        # add_fixtures extends this same list; it must not grow while it is being indexed
+        with self._fixture_lock:
+            if not self.fixture_store.is_loaded_from(rows):
+                self.fixture_store.load(rows)
+        return self.fixture_store
+    
+    def get_event_fixtures(self, event_id):
+        """Get fixtures for a specific event from Fixtures sheet"""
+        return self.get_fixture_store().event_fixtures(event_id)
+    
+    def get_event_fixtures_revision(self, event_id):
+        """Revision of one event's fixtures, unaffected by other events' changes"""
+        return f'{self._revision_epoch}:{self.get_fixture_store().event_version(event_id)}'
     
     def update_event_score(self, event_id, division, gold, silver, bronze):
         """Update score for a specific event and division"""
         sheet_name = event_id.replace('-', '_').title()
+        self._get_row_index(sheet_name)  # a cold index is read before taking the sheet's lock
         
-        if self.is_mock:
-            # Mock update logic
-            print(f"MOCK UPDATE: {sheet_name} - {division}: G{gold} S{silver} B{bronze}")
-            # Simple mock implementation: append or update in list
-            if sheet_name not in self.mock_data:
-                self.mock_data[sheet_name] = []
+        with self._sheet_lock(sheet_name):
+            # Normally a dict hit; re-read only if a failed write dropped the index meanwhile
+            index = self._get_row_index(sheet_name)
+            row_index = index.get(division)
             
-            found = False
-            for row in self.mock_data[sheet_name]:
-                if row[0] == division:
-                    row[1] = gold
-                    row[2] = silver
-                    row[3] = bronze
-                    found = True
-                    break
-            if not found:
-                self.mock_data[sheet_name].append([division, gold, silver, bronze, 0])
-            return True
-
-        # Find the row for the division
-        result = self.sheet.values().get(
-            spreadsheetId=self.SPREADSHEET_ID,
-            range=f'{sheet_name}!A2:A'
-        ).execute()
-        
-        rows = result.get('values', [])
-        row_index = None
-        
-        for idx, row in enumerate(rows):
-            if len(row) > 0 and row[0] == division:
-                row_index = idx + 2  # +2 because of header row and 0-indexing
-                break
-        
-        if row_index is None:
-            # Division not found, append new row
-            self.sheet.values().append(
-                spreadsheetId=self.SPREADSHEET_ID,
-                range=f'{sheet_name}!A:E',
-                valueInputOption='RAW',
-                body={'values': [[division, gold, silver, bronze, 0]]}  # Points calculated separately
-            ).execute()
-        else:
-            # Update existing row
-            self.sheet.values().update(
-                spreadsheetId=self.SPREADSHEET_ID,
-                range=f'{sheet_name}!B{row_index}:D{row_index}',
-                valueInputOption='RAW',
-                body={'values': [[gold, silver, bronze]]}
-            ).execute()
+            try:
+                if row_index is None:
+                    # Division not found, append new row
+                    index.reserve(division)
+                    self._append(f'{sheet_name}!A:E', [[division, gold, silver, bronze, 0]])  # Points calculated separately
+                else:
+                    # Update existing row
+                    self._update(f'{sheet_name}!B{row_index}:D{row_index}', [[gold, silver, bronze]])
+            except Exception:
+                # The sheet may not look like we think; rebuild the index on next use
+                with self._row_index_lock:
+                    self._row_indexes.pop(sheet_name, None)
+                raise
+            
+            self._write_through_score(sheet_name, index.get(division), [division, gold, silver, bronze])
         
+        self._bump_revision(sheet_name)
         return True
     
+    def _write_through_score(self, sheet_name, row_number, cells):
+        """
+        Apply a medal update to the cached standings range in place, so the
+        next read (e.g. the leaderboard refresh it triggers) needs no flush or
+        fetch. Falls back to invalidating the sheet if the cache disagrees.
+        """
+        range_name = f'{sheet_name}!A2:E'
+        cached = self.cache.get(range_name)
+        offset = row_number - 2
+        written = None
+        if cached is None:
+            pass
+        elif offset == len(cached):
+            keys = self.cache.get(f'{sheet_name}!A2:A')
+            if keys is None or len(keys) == offset:
+                written = self.cache.extend(range_name, [cells + [0]])
+                self.cache.extend(f'{sheet_name}!A2:A', [cells[:1]])
+        elif offset < len(cached) and cached[offset][:1] == cells[:1]:
+            row = list(cached[offset]) + [''] * (len(cells) - len(cached[offset]))
+            row[:len(cells)] = cells
+            written = self.cache.set_row(range_name, offset, row)
+        if written is None:
+            self.cache.invalidate(sheet_name)
+    
+    def _sheet_lock(self, sheet_name):
+        """The lock serializing score writes (and index rebuilds) for one event sheet"""
+        with self._row_index_lock:
+            return self._sheet_locks.setdefault(sheet_name, threading.Lock())
+    
+    def _get_row_index(self, sheet_name):
+        """Division -> row number index for an event sheet, built on first use"""
+        index = self._row_indexes.get(sheet_name)
+        if index is None:
+            # The standings range has the same key column; reuse it when it is cached
+            rows = self.cache.get(f'{sheet_name}!A2:E') or self._get_values(f'{sheet_name}!A2:A')
+            built = RowIndex([row[0] if row else '' for row in rows])
+            with self._row_index_lock:
+                # Concurrent cold reads race to build it; the first one wins
+                index = self._row_indexes.setdefault(sheet_name, built)
+        return index
+    
+    def _verify_row_index(self, sheet_name, rows):
+        """Rebuild a division index from freshly read rows if they disagree with it"""
+        keys = [row[0] if row else '' for row in rows]
+        index = self._row_indexes.get(sheet_name)
+        if index is None or not index.conflicts(keys):
+            return
+        with self._sheet_lock(sheet_name):
+            # Re-check: a write may have reserved a row since
+            index = self._row_indexes.get(sheet_name)
+            if index is not None and index.conflicts(keys):
+                with self._row_index_lock:
+                    self._row_indexes[sheet_name] = RowIndex(keys)
+    
     def add_fixture(self, data):
         """Add a new fixture"""
-        if self.is_mock:
-            if 'Fixtures' not in self.mock_data:
-                self.mock_data['Fixtures'] = []
-            self.mock_data['Fixtures'].append([
-                data['eventId'],
-                data['division1'],
-                data['division2'],
-                data['date'],
-                data['time'],
-                data['venue'],
-                'scheduled',
-                '',
-                ''
-            ])
-            return data
-
-        self.sheet.values().append(
-            spreadsheetId=self.SPREADSHEET_ID,
-            range='Fixtures!A:I',
-            valueInputOption='RAW',
-            body={'values': [[
-                data['eventId'],
-                data['division1'],
-                data['division2'],
-                data['date'],
-                data['time'],
-                data['venue'],
-                'scheduled',
-                '',
-                ''
-            ]]}
-        ).execute()
-        return data
+        return self.add_fixtures([data])[0]
+    
+    def add_fixtures(self, fixtures):
+        """Add several fixtures with a single append, assigning each a stable id"""
+        fixtures = [{
+            **data,
+            'id': data.get('id') or new_fixture_id(data['eventId']),
+            'status': data.get('status') or 'scheduled',
+            'winner': data.get('winner') or None,
+            'score': data.get('score') or None,
+        } for data in fixtures]
+        rows = [fixture_row(data) for data in fixtures]
+        
+        with self._fixture_lock:
+            self._append('Fixtures!A:J', rows)
+            # Write through to the cached range and the index instead of re-reading the sheet
+            cached = self.cache.extend('Fixtures!A2:J', rows)
+            if cached is not None and self.fixture_store.is_loaded_from(cached):
+                self.fixture_store.add(fixtures)
+        self._bump_revision('Fixtures')
+        return fixtures
     
     def update_fixture(self, data):
-        """Update fixture status and results"""
-        if self.is_mock:
-            # Mock update logic
-            return data
-
-        # Find the fixture row
-        result = self.sheet.values().get(
-            spreadsheetId=self.SPREADSHEET_ID,
-            range='Fixtures!A2:A'
-        ).execute()
+        """
+        Update fixture status and results
+        
+        Args:
+            data: {'id': fixture id, 'status', 'winner', 'score'}; omitted fields keep their value
         
-        rows = result.get('values', [])
-        # Implementation to find and update specific fixture
-        # This is a simplified version - you'd need fixture ID logic
+        Returns:
+            The updated fixture
         
-        return data
+        Raises:
+            FixtureNotFoundError: If no fixture has this id
+        """
+        fixture_id = data.get('id')
+        with self._fixture_lock:
+            fixture, row_number = self.get_fixture_store().get(fixture_id)
+            if fixture is None:
+                raise FixtureNotFoundError(f"Fixture not found: {fixture_id}")
+            
+            updated = {**fixture, **{field: data[field] for field in ('status', 'winner', 'score') if field in data}}
+            cells = [updated[field] or '' for field in RESULT_FIELDS]
+            self._update(f'Fixtures!{RESULT_COLUMNS.format(row=row_number)}', [cells])
+            
+            cached = self.cache.set_row('Fixtures!A2:J', row_number - 2, fixture_row(updated))
+            if cached is not None and self.fixture_store.is_loaded_from(cached):
+                self.fixture_store.update(updated)
+            else:
+                self.cache.invalidate('Fixtures')
+        self._bump_revision('Fixtures')
+        return updated
+    
+    def get_match_store(self):
+        """Return the Matches index, rebuilding it only when the sheet data changed"""
+        rows = self._get_values('Matches!A2:H')  # Event, Team, Opponent, Result, MatchPoints, GamePoints, Date, RoundNumber
+        # add_matches extends this same list; it must not grow while it is being indexed
+        with self._match_lock:
+            if not self.match_store.is_loaded_from(rows):
+                self.match_store.load(rows)
+        return self.match_store
     
     def get_event_matches(self, event_id):
         """Get all matches for a specific event"""
-        if self.is_mock:
-            matches = [m for m in self.mock_data.get('Matches', []) if m.get('eventId') == event_id]
-            return matches
+        return self.get_match_store().event_matches(event_id)
+    
+    def add_match(self, match_data):
+        """Add a new match result"""
+        return self.add_matches([match_data])[0]
+    
+    def add_matches(self, matches):
+        """
+        Add several match results with a single append
         
-        result = self.sheet.values().get(
-            spreadsheetId=self.SPREADSHEET_ID,
-            range='Matches!A2:H'  # Event, Team, Opponent, Result, MatchPoints, GamePoints, Date, RoundNumber
-        ).execute()
+        Args:
+            matches: Match dictionaries as accepted by add_match
         
-        rows = result.get('values', [])
-        matches = []
+        Returns:
+            The matches
+        """
+        rows = []
+        for match_data in matches:
+            rows.extend(self._match_rows(match_data))
+        self._append_match_rows(rows)
+        return matches
+    
+    def add_bye(self, match_data):
+        """
+        Record a bye as a result for the division sitting out
         
-        for row in rows:
-            if len(row) > 0 and row[0] == event_id:
-                matches.append({
-                    'eventId': row[0] if len(row) > 0 else '',
-                    'team': row[1] if len(row) > 1 else '',
-                    'opponent': row[2] if len(row) > 2 else '',
-                    'result': row[3] if len(row) > 3 else '',
-                    'match_points': float(row[4]) if len(row) > 4 and row[4] else 0,
-                    'game_points': float(row[5]) if len(row) > 5 and row[5] else 0,
-                    'date': row[6] if len(row) > 6 else '',
-                    'round': int(row[7]) if len(row) > 7 and row[7] else 0
-                })
+        Only the division's own row is written: the bye has no standings
+        row to mirror it into.
         
-        return matches
+        Args:
+            match_data: As for add_match, with team2 naming the bye (e.g. 'BYE')
+        """
+        self._append_match_rows(self._match_rows(match_data)[:1])
+        return match_data
     
-    def add_match(self, match_data):
-        """Add a new match result"""
+    def _append_match_rows(self, rows):
+        """Append Matches rows and write them through to the cache and index"""
+        with self._match_lock:
+            # Add all entries to Matches sheet
+            self._append('Matches!A:H', rows)
+            
+            # Write through to the cached range and the index instead of re-reading the sheet
+            cached = self.cache.extend('Matches!A2:H', rows)
+            if cached is not None and self.match_store.is_loaded_from(cached):
+                self.match_store.add([parse_match_row(row) for row in rows])
+        self._bump_revision('Matches')
+    
+    def _match_rows(self, match_data):
+        """Matches sheet rows for one result: one row per team, the second with the opposite result"""
         event_id = match_data.get('eventId')
         team1 = match_data.get('team1')
         team2 = match_data.get('team2')
@@ -253,51 +507,10 @@ class SheetsConnector:
         date = match_data.get('date', '')
         round_num = match_data.get('round', 1)
         
-        if self.is_mock:
-            if 'Matches' not in self.mock_data:
-                self.mock_data['Matches'] = []
-            
-            # Add for team1
-            self.mock_data['Matches'].append({
-                'eventId': event_id,
-                'team': team1,
-                'opponent': team2,
-                'result': result,
-                'match_points': match_points,
-                'game_points': game_points,
-                'date': date,
-                'round': round_num
-            })
-            
-            # Add opposite result for team2
-            opposite_result = 'loss' if result == 'win' else ('win' if result == 'loss' else 'draw')
-            opposite_match_points = 0 if result == 'win' else (2 if result == 'loss' else 1)
-            opposite_game_points = 1 - game_points if result != 'draw' else game_points
-            
-            self.mock_data['Matches'].append({
-                'eventId': event_id,
-                'team': team2,
-                'opponent': team1,
-                'result': opposite_result,
-                'match_points': opposite_match_points,
-                'game_points': opposite_game_points,
-                'date': date,
-                'round': round_num
-            })
-            
-            return match_data
-        
-        # Add both entries to Matches sheet
-        self.sheet.values().append(
-            spreadsheetId=self.SPREADSHEET_ID,
-            range='Matches!A:H',
-            valueInputOption='RAW',
-            body={'values': [
-                [event_id, team1, team2, result, match_points, game_points, date, round_num],
-                [event_id, team2, team1, 'loss' if result == 'win' else ('win' if result == 'loss' else 'draw'),
-                 0 if result == 'win' else (2 if result == 'loss' else 1),
-                 1 - game_points if result != 'draw' else game_points, date, round_num]
-            ]}
-        ).execute()
-        
-        return match_data
+        opposite_result = 'loss' if result == 'win' else ('win' if result == 'loss' else 'draw')
+        opposite_match_points = 0 if result == 'win' else (2 if result == 'loss' else 1)
+        opposite_game_points = 1 - game_points if result != 'draw' else game_points
+        return [
+            [event_id, team1, team2, result, match_points, game_points, date, round_num],
+            [event_id, team2, team1, opposite_result, opposite_match_points, opposite_game_points, date, round_num]
+        ]
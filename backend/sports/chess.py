@@ -2,6 +2,14 @@
 Chess Event Logic - Swiss System Tournament
 """
 
+# Rounds are generated by swiss.pair_round via /api/event/chess/pairings;
+# in fixtures, division1 plays white
+PAIRING_SYSTEM = 'swiss'
+
+# Standings are ranked by match points, then by these tie-breaks in order
+RANKING_KEY = 'match_points'
+TIE_BREAKS = ['direct_encounter', 'buchholz', 'median_buchholz', 'sonneborn_berger', 'game_points']
+
 def validate_match(match_data):
     """
     Validate Chess match data before updating
@@ -24,16 +32,6 @@ def validate_match(match_data):
     return True, None
 
 
-def calculate_match_points(result):
-    """Calculate match points based on result"""
-    points_map = {
-        'win': 2,
-        'draw': 1,
-        'loss': 0
-    }
-    return points_map.get(result, 0)
-
-
 def validate_score(division, gold, silver, bronze):
     """Legacy validation - kept for compatibility"""
     if gold < 0 or silver < 0 or bronze < 0:
@@ -68,60 +66,28 @@ This section will be updated with complete rules.
 """
 
 
-def calculate_division_points(performance_data):
-    """
-    Calculate points for a division in Chess based on match results
-    
-    Args:
-        performance_data: Dictionary with 'matches' list containing match results
-    
-    Returns:
-        Dictionary with played, won, lost, match_points, game_points
-    """
-    matches = performance_data.get('matches', [])
-    
-    stats = {
-        'played': len(matches),
-        'won': 0,
-        'lost': 0,
-        'drawn': 0,
-        'match_points': 0,
-        'game_points': 0
-    }
-    
-    for match in matches:
-        result = match.get('result', '').lower()
-        if result == 'win':
-            stats['won'] += 1
-            stats['match_points'] += 2
-            stats['game_points'] += match.get('game_points', 1)
-        elif result == 'draw':
-            stats['drawn'] += 1
-            stats['match_points'] += 1
-            stats['game_points'] += match.get('game_points', 0.5)
-        elif result == 'loss':
-            stats['lost'] += 1
-            stats['game_points'] += match.get('game_points', 0)
-    
-    return stats
-
-
-def get_table_structure():
-    """
-    Define the standings table structure for Chess
-    
-    Returns:
-        List of column definitions
-    """
-    return [
+# Scoring rules as data, compiled by EventHandlers when the module is imported (see scoring.py)
+SCORING = {
+    'results': {
+        'win': {'count': 'won', 'points': {'match_points': 2}, 'match_fields': {'game_points': 1}},
+        'loss': {'count': 'lost', 'points': {'match_points': 0}, 'match_fields': {'game_points': 0}},
+        'draw': {'count': 'drawn', 'points': {'match_points': 1}, 'match_fields': {'game_points': 0.5}},
+    },
+    'match_fields': {},
+    'ranking': RANKING_KEY,
+    'columns': [
         {'key': 'division', 'label': 'Division', 'type': 'text'},
         {'key': 'played', 'label': 'Played', 'type': 'number'},
         {'key': 'won', 'label': 'Won', 'type': 'number'},
         {'key': 'lost', 'label': 'Lost', 'type': 'number'},
         {'key': 'drawn', 'label': 'Drawn', 'type': 'number'},
         {'key': 'match_points', 'label': 'Match Points', 'type': 'number'},
-        {'key': 'game_points', 'label': 'Game Points', 'type': 'number'}
-    ]
+        {'key': 'game_points', 'label': 'Game Points', 'type': 'number'},
+        {'key': 'buchholz', 'label': 'Buchholz', 'type': 'number'},
+        {'key': 'median_buchholz', 'label': 'Median Buchholz', 'type': 'number'},
+        {'key': 'sonneborn_berger', 'label': 'Sonneborn-Berger', 'type': 'number'}
+    ],
+}
 
 
 def get_player_requirements():
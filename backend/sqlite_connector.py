@@ -0,0 +1,292 @@
+"""
+Local SQLite mirror of the Google Sheet
+"""
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from sheets_connector import SheetsConnector
+from sheet_ranges import parse_range, trim_rows
+from write_queue import is_permanent_error
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sheet_rows (
+    sheet TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (sheet, row)
+);
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    op TEXT NOT NULL,
+    range TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS mirrored_sheets (
+    sheet TEXT PRIMARY KEY,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS dead_letter (
+    id INTEGER PRIMARY KEY,
+    op TEXT NOT NULL,
+    range TEXT NOT NULL,
+    data TEXT NOT NULL,
+    error TEXT NOT NULL,
+    failed_at REAL NOT NULL
+);
+"""
+
+
+def _cell(value):
+    """Store cells the way Sheets returns them (formatted strings)"""
+    return '' if value is None else str(value)
+
+
+class SQLiteMirrorConnector(SheetsConnector):
+    """
+    SheetsConnector that reads and writes a local SQLite mirror.
+
+    Every sheet the app touches (Fixtures, Matches and the event sheets)
+    is mirrored row by row into SQLite, and all reads are served from it.
+    Writes are applied locally and recorded in an outbox in the same
+    transaction. A background loop pushes the outbox to Google Sheets and
+    then pulls every mirrored sheet in one batchGet, updating only rows
+    that changed, so the site keeps serving (possibly slightly stale) data
+    while Sheets is slow or unavailable. Writes Sheets rejects outright
+    are set aside in the dead_letter table.
+    """
+
+    use_write_queue = False
+    MIRRORED_SHEETS = ('Fixtures', 'Matches')
+    # Mirrored by earlier versions; the leaderboard is now derived from the event sheets
+    UNUSED_SHEETS = ('Overall', 'Sports', 'Cultural')
+    PULL_COLUMNS = 'A2:Z'
+    # The _execute_* primitives are local; only the sync loop calls Sheets
+    api_calls = {
+        '_remote_batch_get': ('read', 'execute_batch_get'),
+        '_remote_append': ('write', 'execute_append'),
+        '_remote_batch_update': ('write', 'execute_batch_update'),
+    }
+
+    def _connect(self):
+        super()._connect()  # upstream googleapiclient service used by sync
+
+        self.sync_interval = float(os.getenv('SQLITE_SYNC_INTERVAL', 15))
+        self._open_mirror()
+        with self._db_lock, self._db:
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.executescript(SCHEMA)
+            self._db.executemany(
+                'INSERT OR IGNORE INTO mirrored_sheets (sheet, synced_at) VALUES (?, NULL)',
+                [(sheet,) for sheet in self.MIRRORED_SHEETS]
+            )
+            self._db.executemany('DELETE FROM mirrored_sheets WHERE sheet = ?', [(sheet,) for sheet in self.UNUSED_SHEETS])
+            self._db.executemany('DELETE FROM sheet_rows WHERE sheet = ?', [(sheet,) for sheet in self.UNUSED_SHEETS])
+
+        try:
+            self.sync()
+        except Exception as e:
+            print(f"Initial Sheets sync failed, serving local mirror: {e}")
+
+        threading.Thread(target=self._run_sync, name='sqlite-mirror-sync', daemon=True).start()
+        atexit.register(self._push)
+
+    def _open_mirror(self):
+        self._db = sqlite3.connect(os.getenv('SQLITE_MIRROR_PATH', 'mirror.db'), check_same_thread=False)
+        self._db_lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+
+    def after_fork(self):
+        """
+        Reopen the mirror in a forked worker (SQLite connections must not cross fork())
+
+        The sync loop keeps running in the preloaded master only, so the
+        outbox is pushed by exactly one process however many workers write to it.
+        """
+        super().after_fork()
+        atexit.unregister(self._push)
+        self._open_mirror()
+
+    # Local I/O primitives
+
+    def _execute_get(self, range_name):
+        sheet, first_col, first_row, last_col, last_row = parse_range(range_name)
+        self._ensure_mirrored(sheet)
+
+        query = 'SELECT row, data FROM sheet_rows WHERE sheet = ? AND row >= ?'
+        params = [sheet, first_row]
+        if last_row is not None:
+            query += ' AND row <= ?'
+            params.append(last_row)
+        with self._db_lock:
+            found = self._db.execute(query + ' ORDER BY row', params).fetchall()
+
+        rows = []
+        for row_number, data in found:
+            while first_row + len(rows) < row_number:
+                rows.append([])
+            rows.append(json.loads(data)[first_col:last_col + 1])
+        return trim_rows(rows)
+
+    def _execute_batch_get(self, ranges):
+        return [self._execute_get(range_name) for range_name in ranges]
+
+    def _execute_append(self, range_name, rows):
+        sheet = parse_range(range_name)[0]
+        self._ensure_mirrored(sheet)
+        rows = [[_cell(value) for value in row] for row in rows]
+
+        with self._db_lock, self._db:
+            last_row = self._db.execute('SELECT MAX(row) FROM sheet_rows WHERE sheet = ?', (sheet,)).fetchone()[0]
+            next_row = (last_row or 1) + 1
+            self._db.executemany(
+                'INSERT INTO sheet_rows (sheet, row, data) VALUES (?, ?, ?)',
+                [(sheet, next_row + offset, json.dumps(row)) for offset, row in enumerate(rows)]
+            )
+            self._db.execute(
+                'INSERT INTO outbox (op, range, data) VALUES (?, ?, ?)',
+                ('append', range_name, json.dumps(rows))
+            )
+
+    def _execute_batch_update(self, data):
+        data = [(range_name, [[_cell(value) for value in row] for row in values]) for range_name, values in data]
+
+        with self._db_lock, self._db:
+            for range_name, values in data:
+                sheet, first_col, first_row, _, _ = parse_range(range_name)
+                for offset, cells in enumerate(values):
+                    row_number = first_row + offset
+                    found = self._db.execute(
+                        'SELECT data FROM sheet_rows WHERE sheet = ? AND row = ?', (sheet, row_number)
+                    ).fetchone()
+                    row = json.loads(found[0]) if found else []
+                    row.extend([''] * (first_col + len(cells) - len(row)))
+                    row[first_col:first_col + len(cells)] = cells
+                    self._db.execute(
+                        'INSERT OR REPLACE INTO sheet_rows (sheet, row, data) VALUES (?, ?, ?)',
+                        (sheet, row_number, json.dumps(row))
+                    )
+            self._db.execute(
+                'INSERT INTO outbox (op, range, data) VALUES (?, ?, ?)',
+                ('update', ','.join(range_name for range_name, _ in data), json.dumps(data))
+            )
+
+    # Synchronisation with Google Sheets
+
+    def sync(self):
+        """
+        Push local writes to Google Sheets, then pull remote changes
+
+        The pull runs even when the push fails; sheets with writes still in
+        the outbox are left alone by it.
+        """
+        with self._sync_lock:
+            try:
+                self._push()
+            finally:
+                self._pull()
+
+    def _push(self):
+        """
+        Send the outbox in order
+
+        Writes Sheets rejects for good (a 4xx other than 408/429) are moved
+        to the dead_letter table so they cannot hold up the rest; any other
+        error stops the push until the next sync.
+        """
+        with self._db_lock:
+            pending = self._db.execute('SELECT id, op, range, data FROM outbox ORDER BY id').fetchall()
+
+        for write_id, op, range_name, data in pending:
+            try:
+                if op == 'append':
+                    self._remote_append(range_name, json.loads(data))
+                else:
+                    self._remote_batch_update([tuple(item) for item in json.loads(data)])
+            except Exception as e:
+                if not is_permanent_error(e):
+                    raise
+                print(f"Sheets rejected a write to {range_name}, moved to dead_letter: {e}")
+                with self._db_lock, self._db:
+                    self._db.execute(
+                        'INSERT INTO dead_letter (id, op, range, data, error, failed_at) VALUES (?, ?, ?, ?, ?, ?)',
+                        (write_id, op, range_name, data, str(e), time.time())
+                    )
+                    self._db.execute('DELETE FROM outbox WHERE id = ?', (write_id,))
+                continue
+            with self._db_lock, self._db:
+                self._db.execute('DELETE FROM outbox WHERE id = ?', (write_id,))
+
+    # Google Sheets calls made by the sync loop
+
+    def _remote_batch_get(self, ranges):
+        return SheetsConnector._execute_batch_get(self, ranges)
+
+    def _remote_append(self, range_name, rows):
+        SheetsConnector._execute_append(self, range_name, rows)
+
+    def _remote_batch_update(self, data):
+        SheetsConnector._execute_batch_update(self, data)
+
+    def _pull(self, sheets=None):
+        if sheets is None:
+            with self._db_lock:
+                sheets = [sheet for (sheet,) in self._db.execute('SELECT sheet FROM mirrored_sheets')]
+
+        remote = self._remote_batch_get([f'{sheet}!{self.PULL_COLUMNS}' for sheet in sheets])
+
+        for sheet, rows in zip(sheets, remote):
+            changed = False
+            with self._db_lock, self._db:
+                # Leave sheets with unpushed local writes alone until the next round
+                if self._db.execute('SELECT 1 FROM outbox WHERE range LIKE ?', (f'{sheet}!%',)).fetchone():
+                    continue
+
+                local = dict(self._db.execute('SELECT row, data FROM sheet_rows WHERE sheet = ?', (sheet,)))
+                for offset, row in enumerate(rows):
+                    row_number = offset + 2
+                    data = json.dumps([_cell(value) for value in row])
+                    if local.pop(row_number, None) != data:
+                        self._db.execute(
+                            'INSERT OR REPLACE INTO sheet_rows (sheet, row, data) VALUES (?, ?, ?)',
+                            (sheet, row_number, data)
+                        )
+                        changed = True
+                if local:
+                    self._db.executemany(
+                        'DELETE FROM sheet_rows WHERE sheet = ? AND row = ?',
+                        [(sheet, row_number) for row_number in local]
+                    )
+                    changed = True
+                self._db.execute(
+                    'INSERT OR REPLACE INTO mirrored_sheets (sheet, synced_at) VALUES (?, ?)',
+                    (sheet, time.time())
+                )
+
+            if changed:
+                self.cache.invalidate(sheet)
+
+    def _ensure_mirrored(self, sheet):
+        """Start mirroring a sheet the first time it is used, pulling it once"""
+        with self._db_lock:
+            known = self._db.execute('SELECT 1 FROM mirrored_sheets WHERE sheet = ?', (sheet,)).fetchone()
+            if not known:
+                self._db.execute('INSERT INTO mirrored_sheets (sheet, synced_at) VALUES (?, NULL)', (sheet,))
+                self._db.commit()
+        if not known:
+            try:
+                self._pull([sheet])
+            except Exception as e:
+                print(f"Could not pull {sheet} from Sheets: {e}")
+
+    def _run_sync(self):
+        while True:
+            time.sleep(self.sync_interval)
+            try:
+                self.sync()
+            except Exception as e:
+                print(f"Sheets sync failed, will retry: {e}")
@@ -0,0 +1,81 @@
+"""
+Incremental per-event standings aggregation
+"""
+
+import threading
+
+from tiebreaks import TieBreakTable, rank_standings
+
+
+class StandingsEngine:
+    """
+    Running per-event, per-division aggregates built from the match index.
+
+    Each read applies only the matches recorded since the previous read
+    (via the event's `apply_match` hook), so serving event standings
+    costs O(divisions) plus the new results. A rebuild of the match index
+    (e.g. after the Sheets cache refreshed) resets the event's aggregates.
+    Events without `apply_match` are recomputed from their matches.
+
+    Events declaring `TIE_BREAKS` (a list of tie-break keys in priority
+    order) also get an incrementally maintained TieBreakTable, and their
+    standings are returned fully ranked with the tie-break values.
+    """
+
+    def __init__(self):
+        self._events = {}  # event_id -> {'generation', 'consumed', 'divisions', 'tiebreaks'}
+        self._lock = threading.Lock()
+
+    def get_standings(self, event_id, handlers, store):
+        """
+        Get standings rows for an event
+
+        Args:
+            event_id: Event id (e.g. 'chess')
+            handlers: EventHandlers providing calculate_division_points / apply_match
+            store: MatchStore holding the event's matches
+
+        Returns:
+            List of {'division': ..., **stats} dictionaries
+        """
+        if handlers.apply_match is None:
+            return [
+                {'division': division, **handlers.calculate_division_points({'matches': matches})}
+                for division, matches in store.team_matches(event_id).items()
+            ]
+
+        with self._lock:
+            state = self._events.get(event_id)
+            generation = state['generation'] if state else None
+            consumed = state['consumed'] if state else 0
+
+            current_generation, new_matches = store.event_matches_since(event_id, generation, consumed)
+            if state is None or current_generation != generation:
+                state = {'generation': current_generation, 'consumed': 0, 'divisions': {}, 'tiebreaks': None}
+                if handlers.tie_breaks:
+                    state['tiebreaks'] = TieBreakTable(handlers.calculate_match_points)
+                self._events[event_id] = state
+
+            divisions = state['divisions']
+            tiebreaks = state['tiebreaks']
+            for match in new_matches:
+                stats = divisions.get(match['team'])
+                if stats is None:
+                    stats = divisions[match['team']] = handlers.calculate_division_points({'matches': []})
+                handlers.apply_match(stats, match)
+                if tiebreaks:
+                    tiebreaks.add(match)
+            state['consumed'] += len(new_matches)
+
+            standings = [{'division': division, **stats} for division, stats in divisions.items()]
+            if tiebreaks:
+                standings = rank_standings(standings, tiebreaks, handlers.ranking_key, handlers.tie_breaks)
+            return standings
+
+    def reset(self, event_id=None):
+        """Drop aggregates for one event, or for all events"""
+        with self._lock:
+            if event_id is None:
+                self._events.clear()
+            else:
+                self._events.pop(event_id, None)
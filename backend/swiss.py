@@ -0,0 +1,244 @@
+"""
+Swiss-system round pairing
+"""
+
+BYE = 'BYE'
+
+# Assignment costs; a rematch is only ever chosen when nothing else is possible
+REMATCH_COST = 1000000
+ABSOLUTE_COLOUR_COST = 1000
+COLOUR_COST = 10
+
+
+def hungarian(cost):
+    """
+    Minimum-cost assignment for a square cost matrix in O(n^3)
+
+    Args:
+        cost: n x n list of lists
+
+    Returns:
+        List where result[row] is the column assigned to that row
+    """
+    n = len(cost)
+    inf = float('inf')
+    u = [0] * (n + 1)
+    v = [0] * (n + 1)
+    match = [0] * (n + 1)  # match[column] = row, 1-based
+    way = [0] * (n + 1)
+
+    for row in range(1, n + 1):
+        match[0] = row
+        column = 0
+        min_to = [inf] * (n + 1)
+        used = [False] * (n + 1)
+        while True:
+            used[column] = True
+            current_row = match[column]
+            delta = inf
+            next_column = 0
+            for j in range(1, n + 1):
+                if not used[j]:
+                    reduced = cost[current_row - 1][j - 1] - u[current_row] - v[j]
+                    if reduced < min_to[j]:
+                        min_to[j] = reduced
+                        way[j] = column
+                    if min_to[j] < delta:
+                        delta = min_to[j]
+                        next_column = j
+            for j in range(n + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_to[j] -= delta
+            column = next_column
+            if match[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            match[column] = match[previous]
+            column = previous
+
+    result = [0] * n
+    for column in range(1, n + 1):
+        result[match[column] - 1] = column - 1
+    return result
+
+
+class Player:
+    def __init__(self, name, score):
+        self.name = name
+        self.score = score
+        self.opponents = set()
+        self.colours = ''  # 'W'/'B' per played round, oldest first
+        self.had_bye = False
+
+    @property
+    def colour_difference(self):
+        return self.colours.count('W') - self.colours.count('B')
+
+    def colour_preference(self):
+        """
+        Returns:
+            ('W' | 'B' | None, absolute) - absolute when the colour
+            difference is beyond +/-1 or the last two colours were the same
+        """
+        difference = self.colour_difference
+        repeated = len(self.colours) >= 2 and self.colours[-1] == self.colours[-2]
+        if difference < 0 or (difference == 0 and self.colours[-1:] == 'B'):
+            return 'W', difference <= -2 or (repeated and self.colours[-1] == 'B')
+        if difference > 0 or (difference == 0 and self.colours[-1:] == 'W'):
+            return 'B', difference >= 2 or (repeated and self.colours[-1] == 'W')
+        return None, False
+
+
+def build_players(divisions, matches, fixtures, scores=None):
+    """
+    Collect scores, previous opponents, colours and byes
+
+    Args:
+        divisions: Division names taking part
+        matches: Event matches (one row per team, as from get_event_matches); opponent 'BYE' marks a bye
+        fixtures: Event fixtures; division1 plays white, division2 'BYE' marks a bye
+        scores: Optional {division: score}; defaults to summing match_points
+
+    Returns:
+        {name: Player}
+    """
+    players = {name: Player(name, (scores or {}).get(name, 0)) for name in divisions}
+    for match in matches:
+        player = players.get(match['team'])
+        if player:
+            if scores is None:
+                player.score += float(match.get('match_points') or 0)
+            if match['opponent'] == BYE:
+                player.had_bye = True
+            else:
+                player.opponents.add(match['opponent'])
+    for fixture in fixtures:
+        white, black = fixture['division1'], fixture['division2']
+        if black == BYE:
+            if white in players:
+                players[white].had_bye = True
+            continue
+        if white in players:
+            players[white].colours += 'W'
+            players[white].opponents.add(black)
+        if black in players:
+            players[black].colours += 'B'
+            players[black].opponents.add(white)
+    return players
+
+
+def _pair_cost(top, bottom, ideal_distance):
+    cost = ideal_distance
+    if bottom.name in top.opponents:
+        cost += REMATCH_COST
+    top_colour, top_absolute = top.colour_preference()
+    bottom_colour, bottom_absolute = bottom.colour_preference()
+    if top_colour and top_colour == bottom_colour:
+        cost += ABSOLUTE_COLOUR_COST if (top_absolute and bottom_absolute) else COLOUR_COST
+    return cost
+
+
+def _pair_bracket(bracket):
+    """
+    Pair a score bracket top half against bottom half (S1[i] vs S2[i] is ideal),
+    choosing the assignment that avoids rematches and colour clashes with
+    the least deviation from the ideal pairing.
+
+    Returns:
+        (pairs, cost) where pairs is a list of (higher, lower) players
+    """
+    half = len(bracket) // 2
+    top, bottom = bracket[:half], bracket[half:]
+    cost = [[_pair_cost(t, b, abs(i - j)) for j, b in enumerate(bottom)] for i, t in enumerate(top)]
+    assignment = hungarian(cost)
+    pairs = [(top[i], bottom[j]) for i, j in enumerate(assignment)]
+    return pairs, sum(cost[i][j] for i, j in enumerate(assignment))
+
+
+def _allocate_colours(higher, lower, board):
+    """Return (white, black) honouring the stronger colour preference"""
+    higher_colour, higher_absolute = higher.colour_preference()
+    lower_colour, lower_absolute = lower.colour_preference()
+    if higher_colour and (higher_colour != lower_colour or higher_absolute or not lower_absolute):
+        return (higher, lower) if higher_colour == 'W' else (lower, higher)
+    if lower_colour:
+        return (lower, higher) if lower_colour == 'W' else (higher, lower)
+    return (higher, lower) if board % 2 == 1 else (lower, higher)
+
+
+def pair_round(players):
+    """
+    Generate the next round's pairings
+
+    Players are ranked by score; the lowest-ranked player without a bye
+    sits out when the field is odd. Score brackets are paired from the top
+    down with a minimum-cost assignment; players who cannot be paired
+    inside their bracket without a rematch float down into the next one.
+    If the last bracket still cannot be paired cleanly it is merged with
+    the brackets above it until it can (or the whole field is used).
+
+    Args:
+        players: {name: Player} from build_players
+
+    Returns:
+        {'pairings': [{'board', 'white', 'black'}, ...], 'bye': name or None}
+    """
+    ranked = sorted(players.values(), key=lambda p: (-p.score, p.name))
+
+    bye = None
+    if len(ranked) % 2:
+        candidates = [p for p in reversed(ranked) if not p.had_bye] or list(reversed(ranked))
+        bye = candidates[0]
+        ranked.remove(bye)
+
+    brackets = []
+    for player in ranked:
+        if brackets and brackets[-1][0].score == player.score:
+            brackets[-1].append(player)
+        else:
+            brackets.append([player])
+
+    pairs = _pair_brackets(brackets)
+
+    rank = {player.name: position for position, player in enumerate(ranked)}
+    pairings = []
+    for board, (higher, lower) in enumerate(sorted(pairs, key=lambda pair: rank[pair[0].name]), start=1):
+        white, black = _allocate_colours(higher, lower, board)
+        pairings.append({'board': board, 'white': white.name, 'black': black.name})
+
+    return {'pairings': pairings, 'bye': bye.name if bye else None}
+
+
+def _pair_brackets(brackets):
+    settled = []  # clean pairs per bracket, kept so the tail can be re-paired when merging
+    floaters = []
+
+    for index, bracket in enumerate(brackets):
+        pool = sorted(floaters, key=lambda p: (-p.score, p.name)) + bracket
+        floaters = []
+
+        if index == len(brackets) - 1:
+            settled.append(_pair_bracket(pool)[0] if pool else [])
+            break
+
+        if len(pool) % 2:
+            floaters.append(pool.pop())
+        clean = []
+        for higher, lower in (_pair_bracket(pool)[0] if pool else []):
+            if lower.name in higher.opponents:
+                floaters.extend([higher, lower])
+            else:
+                clean.append((higher, lower))
+        settled.append(clean)
+
+    # Merge the tail upwards while it can only be paired with rematches
+    tail = settled.pop() if settled else []
+    while settled and any(lower.name in higher.opponents for higher, lower in tail):
+        pool = [player for pair in settled.pop() + tail for player in pair]
+        tail = _pair_bracket(sorted(pool, key=lambda p: (-p.score, p.name)))[0]
+
+    return [pair for bracket_pairs in settled for pair in bracket_pairs] + tail
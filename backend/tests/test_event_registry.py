@@ -0,0 +1,29 @@
+import types
+
+from event_registry import EventHandlers, EventRegistry
+
+
+def test_modules_without_scoring_use_the_default_spec():
+    handlers = EventRegistry().get('carrom')
+    stats = handlers.calculate_division_points({'matches': [{'result': 'win', 'game_points': 3}, {'result': 'draw'}]})
+    assert stats == {'played': 2, 'won': 1, 'drawn': 1, 'lost': 0, 'match_points': 3, 'game_points': 3}
+    assert handlers.calculate_match_points('win') == 2
+    assert handlers.apply_match is not None
+    assert handlers.medal_weights is None  # scored with the category weights
+    assert [column['key'] for column in handlers.table_structure][:2] == ['division', 'played']
+
+
+def test_a_module_spec_replaces_the_default():
+    handlers = EventRegistry().get('chess')
+    stats = handlers.calculate_division_points({'matches': [{'result': 'draw'}, {'result': 'win'}]})
+    assert stats['game_points'] == 1.5 and stats['match_points'] == 3
+    assert 'sonneborn_berger' in [column['key'] for column in handlers.table_structure]
+
+
+def test_hand_written_hooks_are_not_mixed_with_compiled_ones():
+    module = types.ModuleType('archery')
+    module.calculate_division_points = lambda performance_data: {'played': len(performance_data['matches'])}
+    handlers = EventHandlers('archery', 'sports', module)
+    assert handlers.scoring is None
+    assert handlers.apply_match is None and handlers.calculate_match_points is None
+    assert handlers.table_structure is None
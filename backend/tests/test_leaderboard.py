@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from leaderboard import Leaderboard
+
+CATEGORIES = {'chess': 'sports', 'carrom': 'sports', 'quiz': 'cultural', 'group-dance': 'cultural'}
+CUSTOM_WEIGHTS = {'carrom': (10, 0, 1)}
+
+
+def new_leaderboard():
+    return Leaderboard(CATEGORIES, weights=CUSTOM_WEIGHTS.get)
+
+
+def random_sheet(rng, divisions):
+    rows = [[division, rng.randint(0, 3), rng.randint(0, 3), rng.randint(0, 3), 0] for division in divisions]
+    return [[str(cell) for cell in row] if rng.random() < 0.5 else row for row in rows]
+
+
+def change(rng, rows):
+    """One edit to an event sheet: new medals, a new or removed division, or padding rows"""
+    rows = [list(row) for row in rows]
+    edit = rng.choice(['medals', 'add', 'remove', 'pad'])
+    if edit == 'medals' and rows:
+        row = rng.choice(rows)
+        row[1:4] = [rng.randint(0, 5), rng.randint(0, 5), '']
+    elif edit == 'add':
+        rows.append([f'New {rng.randint(1, 3)}', rng.randint(0, 2), rng.randint(0, 2), rng.randint(0, 2), 0])
+    elif edit == 'remove' and rows:
+        rows.pop(rng.randrange(len(rows)))
+    else:
+        rows.extend(rng.choice([[], [''], ['X', '1']]) for _ in range(rng.randint(1, 2)))
+    return rows
+
+
+def summary(board, divisions):
+    """Ranked rows per table, keyed by division, for the given divisions"""
+    return {
+        (table, ranking): {
+            row['division']: row for row in board.standings(table, ranking) if row['division'] in divisions
+        }
+        for table in ('overall', 'sports', 'cultural') for ranking in ('competition', 'dense')
+    }
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_incremental_refresh_matches_a_fresh_load(seed):
+    rng = random.Random(seed)
+    sheets = {event_id: random_sheet(rng, rng.sample('ABCDE', rng.randint(0, 5))) for event_id in CATEGORIES}
+    board = new_leaderboard()
+    board.refresh(sheets)
+
+    for _ in range(15):
+        event_id = rng.choice(list(CATEGORIES))
+        sheets[event_id] = change(rng, sheets[event_id])
+        revision = board.revision
+        assert board.refresh({event_id: sheets[event_id]}) in ([event_id], [])
+
+        fresh = new_leaderboard()
+        fresh.refresh(sheets)
+        # Divisions that have left every sheet stay on the incremental board with no medals
+        assert summary(board, fresh.divisions) == summary(fresh, fresh.divisions)
+        assert sorted(board.contributions(), key=repr) == sorted(fresh.contributions(), key=repr)
+        assert all(not any(row[key] for key in ('gold', 'silver', 'bronze', 'points'))
+                   for row in board.standings('overall') if row['division'] not in fresh.divisions)
+        assert board.revision != revision or board.refresh(sheets) == []
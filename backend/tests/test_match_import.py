@@ -0,0 +1,82 @@
+import io
+import json
+import os
+
+import pytest
+
+os.environ.setdefault('SPREADSHEET_ID', 'dummy_spreadsheet_id')
+
+from event_registry import EventRegistry
+from match_import import iter_csv_rows, iter_json_array, validate_matches
+
+BODY = json.dumps([
+    {'eventId': 'chess', 'team1': 'Équipe 🏆', 'team2': 'B', 'result': 'win', 'match_points': 12345, 'game_points': -1.5e3},
+    {'eventId': 'quiz', 'team1': 'A', 'team2': '東京', 'result': 'draw', 'round': 7},
+    [1, 2.25, {'nested': ['x']}],
+    'plain string',
+    0,
+], ensure_ascii=False, indent=1).encode('utf-8')
+
+
+@pytest.mark.parametrize('chunk_size', range(1, 40))
+def test_json_values_split_across_chunks(chunk_size):
+    assert list(iter_json_array(io.BytesIO(BODY), chunk_size)) == json.loads(BODY)
+
+
+def test_json_empty_array_and_whitespace():
+    assert list(iter_json_array(io.BytesIO(b'  [ \n ]  '), 1)) == []
+
+
+@pytest.mark.parametrize('body', [b'', b'{"eventId": "chess"}', b'[', b'[1', b'[1,', b'[1 2]', b'[1,]', b'[{"a": }]', b'["open'])
+def test_malformed_json_arrays_are_rejected(body):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.BytesIO(body), 2))
+
+
+def test_invalid_utf8_is_rejected():
+    with pytest.raises(UnicodeDecodeError):
+        list(iter_json_array(io.BytesIO(b'["\xff"]'), 2))
+
+
+def test_csv_skips_the_bom_and_drops_empty_cells():
+    body = '\ufeffeventId,team1 ,team2,result,game_points,date\r\nchess,A,"B, the second",win,,\r\nquiz, C ,D,loss,2,2024-03-01\r\n'
+    rows = list(iter_csv_rows(io.BytesIO(body.encode('utf-8'))))
+    assert rows == [
+        {'eventId': 'chess', 'team1': 'A', 'team2': 'B, the second', 'result': 'win'},
+        {'eventId': 'quiz', 'team1': 'C', 'team2': 'D', 'result': 'loss', 'game_points': '2', 'date': '2024-03-01'},
+    ]
+
+
+def test_validation_reports_every_bad_row():
+    rows = [
+        {'team1': 'A', 'team2': 'B', 'result': 'win', 'game_points': '2'},
+        {'eventId': 'chess', 'team1': 'A', 'team2': 'A', 'result': 'win'},
+        {'eventId': 'nope', 'team1': 'A', 'team2': 'B', 'result': 'win'},
+        {'eventId': 'quiz', 'team1': 'A', 'team2': 'B', 'result': 'win', 'round': 'two'},
+        {'eventId': 'quiz', 'team1': ['A'], 'team2': 'B', 'result': 'win'},
+        'not an object',
+    ]
+    matches, errors = validate_matches(rows, EventRegistry(), defaults={'eventId': 'quiz'})
+    assert matches == [{'eventId': 'quiz', 'team1': 'A', 'team2': 'B', 'result': 'win', 'game_points': 2.0}]
+    assert [error['row'] for error in errors] == [2, 3, 4, 5, 6]
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv('SHEETS_BACKEND', 'memory')
+    import app
+    monkeypatch.setattr(app, 'BULK_MATCH_MAX_ROWS', 2)
+    return app.app.test_client()
+
+
+def test_bulk_import_over_the_row_limit_is_rejected(client):
+    rows = [{'eventId': 'quiz', 'team1': 'A', 'team2': 'B', 'result': 'win'}] * 3
+    response = client.post('/api/match/bulk', json=rows)
+    assert response.status_code == 413
+
+    response = client.post('/api/match/bulk', json=rows[:2])
+    assert response.status_code == 200 and response.json['imported'] == 2
+
+    csv_body = 'team1,team2,result\nA,B,win\nC,D,loss\nE,F,draw\n'
+    response = client.post('/api/match/bulk?eventId=quiz', data=csv_body, content_type='text/csv')
+    assert response.status_code == 413
@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+os.environ.setdefault('SPREADSHEET_ID', 'dummy_spreadsheet_id')
+
+from memory_connector import MemoryConnector, RangeNotFoundError
+from write_queue import is_permanent_error
+
+
+@pytest.fixture
+def sheets():
+    return MemoryConnector()
+
+
+def test_starts_with_fixtures_and_matches_only(sheets):
+    assert sheets._execute_get('Matches!A1:H1') == [['Event', 'Team', 'Opponent', 'Result', 'MatchPoints', 'GamePoints', 'Date', 'RoundNumber']]
+    assert sheets._execute_get('Fixtures!A2:J') == []
+    with pytest.raises(RangeNotFoundError):
+        sheets._execute_get('Chess!A2:E')
+
+
+def test_unknown_sheets_are_not_created_by_writes(sheets):
+    with pytest.raises(RangeNotFoundError) as error:
+        sheets._execute_append('Chess!A:E', [['A', 1, 0, 0, 0]])
+    assert is_permanent_error(error.value)
+    with pytest.raises(RangeNotFoundError):
+        sheets._execute_batch_update([('Chess!B2:D2', [[1, 0, 0]])])
+    with pytest.raises(RangeNotFoundError):
+        sheets._execute_get('Chess!A2:E')
+
+
+def test_batch_get_fails_if_any_sheet_is_missing(sheets):
+    sheets.add_event_sheets(['chess'])
+    assert sheets._execute_batch_get(['Chess!A2:E']) == [[]]
+    with pytest.raises(RangeNotFoundError):
+        sheets._execute_batch_get(['Chess!A2:E', 'Group_Skit!A2:E'])
+
+
+def test_add_event_sheets_keeps_existing_rows(sheets):
+    sheets.add_event_sheets(['chess'])
+    sheets._execute_append('Chess!A:E', [['A', 1, 0, 0, 0]])
+    sheets.add_event_sheets(['chess', 'group-skit'])
+    assert sheets._execute_get('Chess!A2:E') == [['A', '1', '0', '0', '0']]
+    assert sheets._execute_get('Group_Skit!A1:E1') == [['Division', 'Gold', 'Silver', 'Bronze', 'Points']]
@@ -0,0 +1,101 @@
+import os
+
+import pytest
+
+os.environ.setdefault('SPREADSHEET_ID', 'dummy_spreadsheet_id')
+
+from memory_connector import MemoryConnector, QuotaExceededError
+from sheet_ranges import apply_writes
+
+
+class QueuedMemoryConnector(MemoryConnector):
+    """In-memory spreadsheet behind the write queue, with writes that can be made to fail"""
+
+    use_write_queue = True
+    throttled = False
+
+    def _execute_append(self, range_name, rows):
+        if self.throttled:
+            raise QuotaExceededError('Quota exceeded')
+        super()._execute_append(range_name, rows)
+
+    def _execute_batch_update(self, data):
+        if self.throttled:
+            raise QuotaExceededError('Quota exceeded')
+        super()._execute_batch_update(data)
+
+
+@pytest.fixture
+def sheets(tmp_path, monkeypatch):
+    # Long interval: flushes happen only when the test (or a read) asks for one
+    monkeypatch.setenv('SHEETS_FLUSH_INTERVAL_MS', '60000')
+    monkeypatch.setenv('SHEETS_JOURNAL_DIR', str(tmp_path))
+    connector = QueuedMemoryConnector()
+    connector.seed_tournament(['chess'], divisions=4, matches_per_event=1, fixtures_per_event=1, seed=1)
+    return connector
+
+
+def test_reads_keep_queued_writes_during_backoff(sheets):
+    assert len(sheets.get_event_matches('chess')) == 2
+
+    sheets.throttled = True
+    sheets.add_match({'eventId': 'chess', 'team1': 'A', 'team2': 'B', 'result': 'win', 'match_points': 2, 'game_points': 1})
+    assert not sheets.write_queue.flush()
+
+    sheets.cache.clear()  # TTL expiry while the queue is backed off
+    assert len(sheets.get_event_matches('chess')) == 4
+    assert len(sheets._execute_get('Matches!A2:H')) == 2
+
+    sheets.throttled = False
+    sheets.write_queue.retry_at = 0
+    assert sheets.write_queue.flush()
+    assert 'Matches!A2:H' not in sheets.cache._entries
+    assert len(sheets.get_event_matches('chess')) == 4
+    assert len(sheets._execute_get('Matches!A2:H')) == 4
+
+
+def test_batch_reads_keep_queued_updates_during_backoff(sheets):
+    sheets.get_event_standings('chess')
+    sheets.throttled = True
+    sheets.update_event_score('chess', 'B', 7, 0, 0)
+    assert not sheets.write_queue.flush()
+
+    sheets.cache.clear()
+    rows = sheets.get_all_event_standings(['chess'])['chess']
+    assert [row[:2] for row in rows if row[0] == 'B'] == [['B', 7]]
+
+
+def test_score_updates_write_through_to_cached_standings(sheets):
+    sheets.get_all_event_standings(['chess'])
+    flushes = []
+    sheets.write_queue.flush = lambda: flushes.append(1) or True
+    sheets._execute_batch_get = sheets._execute_get = None  # any fetch would fail
+
+    sheets.update_event_score('chess', 'B', 7, 1, 0)
+    sheets.update_event_score('chess', 'New Division', 0, 0, 2)
+    rows = sheets.get_all_event_standings(['chess'])['chess']
+    assert [row[:4] for row in rows if row[0] in ('B', 'New Division')] == [['B', 7, 1, 0], ['New Division', 0, 0, 2]]
+    assert sheets.get_event_standings('chess') is rows
+    assert not flushes
+
+    del sheets.write_queue.flush, sheets._execute_batch_get, sheets._execute_get
+    assert sheets.write_queue.flush()
+    sheets.cache.clear()
+    fetched = sheets.get_all_event_standings(['chess'])['chess']
+    assert [row[:4] for row in fetched] == [[str(cell) for cell in row[:4]] for row in rows]
+
+
+def test_apply_writes_appends_after_last_row_and_overwrites_cells():
+    rows = [['chess', 'A', 'B'], ['chess', 'C', 'D', 'scheduled']]
+    writes = [
+        {'op': 'append', 'range': 'Fixtures!A:J', 'values': [['chess', 'E', 'F']]},
+        {'op': 'update', 'range': 'Fixtures!G3:J3', 'values': [['completed', 'C', '', 'f2']]},
+        {'op': 'update', 'range': 'Fixtures!B4:B4', 'values': [['G']]},
+    ]
+    assert apply_writes('Fixtures!A2:J', rows, writes) == [
+        ['chess', 'A', 'B'],
+        ['chess', 'C', 'D', 'scheduled', '', '', 'completed', 'C', '', 'f2'],
+        ['chess', 'G', 'F'],
+    ]
+    # Columns and rows outside the range read are left out
+    assert apply_writes('Fixtures!B2:C3', [['A', 'B']], writes) == [['A', 'B'], ['E', 'F']]
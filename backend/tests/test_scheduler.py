@@ -0,0 +1,88 @@
+import itertools
+
+import pytest
+
+import scheduler
+from scheduler import Timetable, knockout, parse_time, round_robin, schedule
+
+
+def timetable(**options):
+    settings = {'dates': ['2024-03-01', '2024-03-02'], 'start': '09:00', 'end': '13:00', 'slot_minutes': 60, 'venues': ['Hall']}
+    settings.update(options)
+    return Timetable(settings.pop('dates'), settings.pop('start'), settings.pop('end'), settings.pop('slot_minutes'), settings.pop('venues'), **settings)
+
+
+def match(number, division1, division2, after=()):
+    return {'round': 1, 'match': number, 'division1': division1, 'division2': division2, 'after': list(after)}
+
+
+def test_round_robin_pairs_every_division_once():
+    matches = round_robin(list('ABCDE'))
+    assert sorted(tuple(sorted((m['division1'], m['division2']))) for m in matches) == list(itertools.combinations('ABCDE', 2))
+    for _, games in itertools.groupby(matches, key=lambda m: m['round']):
+        playing = [division for m in games for division in (m['division1'], m['division2'])]
+        assert len(playing) == len(set(playing))
+
+
+def test_rest_gaps_and_venue_capacity_are_respected():
+    table = timetable(venues=['Hall', 'Court'], capacity=2, rest_minutes=60, end='17:00')
+    scheduled = schedule(round_robin(list('ABCDEF')), table)
+    assert len(scheduled) == 15
+
+    load = {}
+    for m in scheduled:
+        key = (m['date'], m['time'], m['venue'])
+        load[key] = load.get(key, 0) + 1
+    assert max(load.values()) <= 2
+
+    starts = {}
+    for m in scheduled:
+        for division in (m['division1'], m['division2']):
+            starts.setdefault((division, m['date']), []).append(parse_time(m['time']))
+    for times in starts.values():
+        times.sort()
+        assert all(later - earlier >= 60 + 60 for earlier, later in zip(times, times[1:]))
+
+
+def test_knockout_gives_byes_to_the_top_seeds():
+    matches = knockout(list('ABCDEF'))  # seeded A (1) to F (6), bracket of 8
+    assert [(m['round'], m['division1'], m['division2'], m['after']) for m in matches] == [
+        (1, 'D', 'E', []),
+        (1, 'C', 'F', []),
+        (2, 'A', 'Winner R1M1', [(1, 1)]),
+        (2, 'B', 'Winner R1M2', [(1, 2)]),
+        (3, 'Winner R2M1', 'Winner R2M2', [(2, 1), (2, 2)]),
+    ]
+    assert scheduler.seed_order(8) == [1, 8, 4, 5, 2, 7, 3, 6]
+
+
+def test_knockout_matches_start_after_their_feeders_and_the_rest_gap():
+    table = timetable(venues=['Hall', 'Court'], capacity=1, rest_minutes=30, end='18:00')
+    scheduled = schedule(knockout(list('ABCDEFGH')), table)
+    by_key = {(m['round'], m['match']): m for m in scheduled}
+    for m in scheduled:
+        for key in m['after']:
+            feeder = by_key[key]
+            assert (feeder['date'], parse_time(feeder['time']) + 60 + 30) <= (m['date'], parse_time(m['time']))
+
+
+def test_existing_fixtures_are_worked_around_by_backtracking():
+    # One venue, two slots, and A already plays at 10:00; greedy order would put B-C at 9:00
+    table = timetable(dates=['2024-03-01'], end='11:00')
+    table.book_fixtures([{'date': '2024-03-01', 'time': '10:00', 'venue': 'Elsewhere', 'division1': 'A', 'division2': 'X'}], {'A'})
+    scheduled = schedule([match(1, 'B', 'C'), match(2, 'A', 'D')], table)
+    assert [(m['division1'], m['time']) for m in scheduled] == [('B', '10:00'), ('A', '09:00')]
+
+
+def test_running_out_of_slots_is_an_error_and_books_nothing():
+    table = timetable(dates=['2024-03-01'], end='11:00')
+    with pytest.raises(ValueError, match='Not enough slots: scheduled 2 of 3 matches'):
+        schedule([match(1, 'A', 'B'), match(2, 'C', 'D'), match(3, 'E', 'F')], table)
+    assert schedule([match(1, 'A', 'B'), match(2, 'C', 'D')], table)
+
+
+def test_the_search_budget_bounds_infeasible_inputs(monkeypatch):
+    monkeypatch.setattr(scheduler, 'MAX_SEARCH_STEPS', 50)
+    # Six divisions, one venue and five slots cannot fit fifteen matches
+    with pytest.raises(ValueError, match='Not enough slots'):
+        schedule(round_robin(list('ABCDEF')), timetable(dates=['2024-03-01'], end='14:00'))
@@ -0,0 +1,40 @@
+import threading
+
+from google.auth.credentials import AnonymousCredentials
+
+from sheets_connector import SheetsConnector
+
+
+class FakeRequest:
+    """googleapiclient request stand-in; concurrent executes meet at the barrier"""
+
+    def __init__(self, barrier, used):
+        self.barrier = barrier
+        self.used = used
+
+    def execute(self, http=None):
+        self.used.append(http)
+        if self.barrier:
+            self.barrier.wait(5)
+        return {}
+
+
+def test_concurrent_requests_get_their_own_connection():
+    sheets = object.__new__(SheetsConnector)
+    sheets.credentials = AnonymousCredentials()
+    sheets._reconnect()
+
+    used = []
+    barrier = threading.Barrier(3)
+    threads = [threading.Thread(target=sheets._execute, args=(FakeRequest(barrier, used),)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(http) for http in used}) == 3
+    assert all(http is not None for http in used)
+
+    # Idle connections are reused afterwards
+    sheets._execute(FakeRequest(None, used))
+    assert used[-1] in used[:3]
@@ -0,0 +1,111 @@
+import atexit
+
+import pytest
+
+from sqlite_connector import SQLiteMirrorConnector
+
+
+class ApiError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+
+
+class FakeMirrorConnector(SQLiteMirrorConnector):
+    """SQLite mirror whose 'Google Sheets' is a dictionary of rows (from row 2)"""
+
+    remote = None
+    reject = None  # status code returned for every push, or None
+
+    def _load_credentials(self):
+        pass
+
+    def _reconnect(self):
+        pass
+
+    def _remote_batch_get(self, ranges):
+        return [[list(row) for row in self.remote.get(range_name.split('!')[0], [])] for range_name in ranges]
+
+    def _remote_append(self, range_name, rows):
+        if self.reject:
+            raise ApiError(self.reject)
+        self.remote.setdefault(range_name.split('!')[0], []).extend(rows)
+
+    def _remote_batch_update(self, data):
+        if self.reject:
+            raise ApiError(self.reject)
+
+
+@pytest.fixture
+def mirror(tmp_path, monkeypatch):
+    monkeypatch.setenv('SQLITE_MIRROR_PATH', str(tmp_path / 'mirror.db'))
+    monkeypatch.setenv('SQLITE_SYNC_INTERVAL', '3600')
+    FakeMirrorConnector.remote = {'Fixtures': [], 'Matches': []}
+    connector = FakeMirrorConnector()
+    yield connector
+    atexit.unregister(connector._push)
+
+
+def fixture_row(name):
+    return ['chess', name, 'B', '2024-03-01', '10:00', 'Hall', 'scheduled', '', '', f'chess-{name}']
+
+
+def outbox(connector):
+    return connector._db.execute('SELECT range FROM outbox').fetchall()
+
+
+def test_rejected_write_is_dead_lettered_and_the_pull_still_runs(mirror):
+    mirror.reject = 400
+    mirror.add_match({'eventId': 'chess', 'team1': 'A', 'team2': 'B', 'result': 'win'})
+    mirror.remote['Fixtures'].append(fixture_row('A'))
+
+    mirror.sync()
+    assert outbox(mirror) == []
+    assert mirror._db.execute('SELECT range, error FROM dead_letter').fetchall() == [('Matches!A:H', 'HTTP 400')]
+    assert mirror._execute_get('Fixtures!A2:J') == [fixture_row('A')]
+    # The rejected rows never reached Sheets, so the pull drops them locally too
+    assert mirror._execute_get('Matches!A2:H') == []
+
+    mirror.reject = None
+    mirror.add_match({'eventId': 'chess', 'team1': 'C', 'team2': 'D', 'result': 'draw'})
+    mirror.sync()
+    assert [row[1] for row in mirror.remote['Matches']] == ['C', 'D']
+
+
+def test_transient_error_keeps_the_outbox_and_still_pulls(mirror):
+    mirror.reject = 503
+    mirror.add_match({'eventId': 'chess', 'team1': 'A', 'team2': 'B', 'result': 'win'})
+    mirror.remote['Fixtures'].append(fixture_row('A'))
+
+    with pytest.raises(ApiError):
+        mirror.sync()
+    assert outbox(mirror) == [('Matches!A:H',)]
+    assert mirror._execute_get('Fixtures!A2:J') == [fixture_row('A')]
+    # Local rows waiting in the outbox are not overwritten by the pull
+    assert len(mirror._execute_get('Matches!A2:H')) == 2
+
+    mirror.reject = None
+    mirror.sync()
+    assert outbox(mirror) == []
+    assert len(mirror.remote['Matches']) == 2
+
+
+def test_only_the_sync_loop_counts_as_sheets_api_calls(tmp_path, monkeypatch):
+    import instrumentation
+
+    monkeypatch.setenv('SQLITE_MIRROR_PATH', str(tmp_path / 'mirror.db'))
+    monkeypatch.setenv('SQLITE_SYNC_INTERVAL', '3600')
+    monkeypatch.setattr(instrumentation, 'SHEETS_REQUESTS', instrumentation.Counter('test', '', ('quota', 'call')))
+    FakeMirrorConnector.remote = {'Fixtures': [], 'Matches': []}
+    connector = instrumentation.instrument_connector_class(FakeMirrorConnector)()
+    try:
+        connector.add_match({'eventId': 'chess', 'team1': 'A', 'team2': 'B', 'result': 'win'})
+        connector.get_event_matches('chess')
+        connector.sync()
+    finally:
+        atexit.unregister(connector._push)
+
+    assert instrumentation.SHEETS_REQUESTS._values == {
+        ('read', 'execute_batch_get'): 2,  # initial sync and this one
+        ('write', 'execute_append'): 1,
+    }
@@ -0,0 +1,108 @@
+import os
+import threading
+
+import pytest
+
+os.environ.setdefault('SPREADSHEET_ID', 'dummy_spreadsheet_id')
+
+from memory_connector import MemoryConnector
+
+
+@pytest.fixture
+def sheets():
+    connector = MemoryConnector()
+    connector.seed_tournament(['chess'], divisions=4, matches_per_event=3, fixtures_per_event=3, seed=1)
+    return connector
+
+
+def load_during_extend(connector, range_name, get_store):
+    """Make another thread try to index the range while an append is extending the cached list"""
+    original_extend = connector.cache.extend
+    readers = []
+
+    def extend(name, rows):
+        cached = original_extend(name, rows)
+        if name == range_name:
+            reader = threading.Thread(target=get_store)
+            reader.start()
+            reader.join(0.2)  # without the lock the reader indexes the extended list here
+            readers.append(reader)
+        return cached
+
+    connector.cache.extend = extend
+    return readers
+
+
+def test_fixture_index_is_not_rebuilt_during_an_append(sheets):
+    rows = sheets._get_values('Fixtures!A2:J')  # cached, not yet indexed
+    readers = load_during_extend(sheets, 'Fixtures!A2:J', sheets.get_fixture_store)
+
+    added = sheets.add_fixtures([{'eventId': 'chess', 'division1': 'A', 'division2': 'B'}])[0]
+    for reader in readers:
+        reader.join()
+
+    store = sheets.get_fixture_store()
+    assert [fixture['id'] for fixture in store.event_fixtures('chess')].count(added['id']) == 1
+    assert store.next_row == 2 + len(rows)
+
+    sheets.update_fixture({'id': added['id'], 'status': 'completed', 'winner': 'A'})
+    row = sheets._execute_get(f"Fixtures!A{store.get(added['id'])[1]}:J")[0]
+    assert row[6:] == ['completed', 'A', '', added['id']]
+
+
+def test_match_index_is_not_rebuilt_during_an_append(sheets):
+    sheets._get_values('Matches!A2:H')
+    readers = load_during_extend(sheets, 'Matches!A2:H', sheets.get_match_store)
+
+    sheets.add_match({'eventId': 'chess', 'team1': 'A', 'team2': 'B', 'result': 'win', 'match_points': 2, 'game_points': 1})
+    for reader in readers:
+        reader.join()
+
+    assert len(sheets.get_event_matches('chess')) == 3 * 2 + 2
+
+
+def test_match_store_survives_a_cache_expiry_with_unchanged_rows(sheets):
+    store = sheets.get_match_store()
+    sheets.add_match({'eventId': 'chess', 'team1': 'A', 'team2': 'B', 'result': 'win', 'match_points': 2, 'game_points': 1})
+    generation = store.generation
+    matches = store.event_matches('chess')
+
+    sheets.cache.clear()  # TTL expiry; the sheet now returns the appended rows as strings
+    assert sheets.get_match_store().generation == generation
+    assert store.event_matches('chess') == matches
+
+    sheets._execute_append('Matches!A:H', [['chess', 'C', 'D', 'draw', 1, 0, '', 1]])  # edited outside the app
+    sheets.cache.clear()
+    assert sheets.get_match_store().generation == generation + 1
+    assert len(store.event_matches('chess')) == len(matches) + 1
+
+
+def test_a_slow_score_write_only_holds_up_its_own_sheet():
+    connector = MemoryConnector()  # no write queue: score writes go straight to the sheet
+    connector.seed_tournament(['chess', 'carrom'], divisions=4, matches_per_event=1, fixtures_per_event=1, seed=1)
+    connector.get_all_event_standings(['chess', 'carrom'])
+
+    release = threading.Event()
+    original_update = connector._execute_batch_update
+
+    def slow_update(data):
+        if data[0][0].startswith('Chess!'):
+            release.wait(5)
+        original_update(data)
+
+    connector._execute_batch_update = slow_update
+    slow = threading.Thread(target=connector.update_event_score, args=('chess', 'A', 5, 0, 0))
+    slow.start()
+
+    other = threading.Thread(target=lambda: (
+        connector.update_event_score('carrom', 'A', 2, 0, 0),
+        connector.get_all_event_standings(['chess', 'carrom'])
+    ))
+    other.start()
+    other.join(2)
+    assert not other.is_alive()
+
+    release.set()
+    slow.join()
+    assert connector._execute_get('Chess!A2:D2') == [['A', '5', '0', '0']]
+    assert connector._execute_get('Carrom!A2:D2') == [['A', '2', '0', '0']]
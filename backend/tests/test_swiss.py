@@ -0,0 +1,102 @@
+import itertools
+
+import swiss
+
+
+def brute_force(cost):
+    n = len(cost)
+    return min(sum(cost[row][column] for row, column in enumerate(columns)) for columns in itertools.permutations(range(n)))
+
+
+def players_from(history, divisions):
+    """history: [(white, black, result for white), ...] -> {name: Player}"""
+    matches = []
+    fixtures = []
+    for white, black, result in history:
+        points = {'win': (2, 0), 'draw': (1, 1), 'loss': (0, 2)}[result]
+        matches.append({'team': white, 'opponent': black, 'match_points': points[0]})
+        matches.append({'team': black, 'opponent': white, 'match_points': points[1]})
+        fixtures.append({'division1': white, 'division2': black})
+    return swiss.build_players(divisions, matches, fixtures)
+
+
+def pairs(result):
+    return {frozenset((p['white'], p['black'])) for p in result['pairings']}
+
+
+def test_hungarian_finds_minimum_cost_assignment():
+    cost = [[4, 1, 3], [2, 0, 5], [3, 2, 2]]
+    assignment = swiss.hungarian(cost)
+    assert sorted(assignment) == [0, 1, 2]
+    assert sum(cost[row][column] for row, column in enumerate(assignment)) == brute_force(cost) == 5
+
+    cost = [[(row * 7 + column * 3) % 5 + (row == column) * 10 for column in range(5)] for row in range(5)]
+    assignment = swiss.hungarian(cost)
+    assert sum(cost[row][column] for row, column in enumerate(assignment)) == brute_force(cost)
+
+
+def test_first_round_pairs_top_half_against_bottom_half():
+    result = swiss.pair_round(swiss.build_players(['A', 'B', 'C', 'D'], [], []))
+    assert result['bye'] is None
+    assert pairs(result) == {frozenset('AC'), frozenset('BD')}
+    assert [p['board'] for p in result['pairings']] == [1, 2]
+
+
+def test_odd_field_gives_bye_to_lowest_ranked_without_one():
+    players = players_from([('A', 'B', 'win'), ('C', 'D', 'win')], ['A', 'B', 'C', 'D', 'E'])
+    players['E'].had_bye = True
+    result = swiss.pair_round(players)
+    # B and D are the lowest-ranked (0 points); E already had the bye
+    assert result['bye'] == 'D'
+    assert len(result['pairings']) == 2
+    assert 'D' not in {name for pair in pairs(result) for name in pair}
+
+
+def test_bye_recorded_in_matches_counts_as_had_bye():
+    matches = [{'team': 'C', 'opponent': swiss.BYE, 'match_points': 2}]
+    players = swiss.build_players(['A', 'B', 'C'], matches, [])
+    assert players['C'].had_bye
+    assert players['C'].score == 2
+    assert swiss.BYE not in players['C'].opponents
+    assert swiss.pair_round(players)['bye'] != 'C'
+
+
+def test_rematch_is_avoided_within_a_score_group():
+    # A and C both won and B and D both lost, but A has already played C
+    players = players_from([('A', 'B', 'win'), ('C', 'D', 'win'), ('A', 'C', 'draw'), ('B', 'D', 'draw')], ['A', 'B', 'C', 'D'])
+    result = swiss.pair_round(players)
+    assert frozenset('AC') not in pairs(result)
+    assert frozenset('BD') not in pairs(result)
+
+
+def test_forced_rematch_when_no_other_pairing_exists():
+    players = players_from([('A', 'B', 'win')], ['A', 'B'])
+    result = swiss.pair_round(players)
+    assert pairs(result) == {frozenset('AB')}
+    # B had black, so B gets white in the rematch
+    assert result['pairings'][0] == {'board': 1, 'white': 'B', 'black': 'A'}
+
+
+def test_colours_alternate_and_absolute_preferences_win():
+    # A: W W -> must have black; C: B B -> must have white
+    players = players_from([('A', 'B', 'win'), ('D', 'C', 'win'), ('A', 'D', 'win'), ('B', 'C', 'win')], ['A', 'B', 'C', 'D'])
+    assert players['A'].colour_preference() == ('B', True)
+    assert players['C'].colour_preference() == ('W', True)
+    result = swiss.pair_round(players)
+    by_division = {}
+    for pairing in result['pairings']:
+        by_division[pairing['white']] = 'W'
+        by_division[pairing['black']] = 'B'
+    assert by_division['A'] == 'B'
+    assert by_division['C'] == 'W'
+
+
+def test_unpairable_last_bracket_merges_upwards():
+    # D and E share the bottom score group but have already met; F has played only C
+    history = [('A', 'D', 'win'), ('B', 'E', 'win'), ('C', 'F', 'win'), ('D', 'E', 'draw'), ('A', 'B', 'draw'), ('C', 'F', 'win')]
+    players = players_from(history, ['A', 'B', 'C', 'D', 'E', 'F'])
+    result = swiss.pair_round(players)
+    assert len(result['pairings']) == 3
+    for pair in pairs(result):
+        first, second = sorted(pair)
+        assert second not in players[first].opponents
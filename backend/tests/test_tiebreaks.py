@@ -0,0 +1,51 @@
+import random
+
+import pytest
+
+from tiebreaks import RESULT_FACTOR, TieBreakTable
+
+MATCH_POINTS = {'win': 2, 'draw': 1, 'loss': 0}
+OPPOSITE = {'win': 'loss', 'draw': 'draw', 'loss': 'win'}
+
+
+def random_rows(rng, divisions, games):
+    """Both rows of each random game, plus a bye, in a random order"""
+    rows = []
+    for _ in range(games):
+        team, opponent = rng.sample(divisions, 2)
+        result = rng.choice(list(MATCH_POINTS))
+        rows.append({'team': team, 'opponent': opponent, 'result': result})
+        rows.append({'team': opponent, 'opponent': team, 'result': OPPOSITE[result]})
+    rows.append({'team': rng.choice(divisions), 'opponent': 'BYE', 'result': 'win'})
+    rng.shuffle(rows)
+    return rows
+
+
+def from_scratch(rows, division, tied_group):
+    """Tie-breaks computed directly from the final scores"""
+    scores = {}
+    for row in rows:
+        scores[row['team']] = scores.get(row['team'], 0) + MATCH_POINTS[row['result']]
+    own = [row for row in rows if row['team'] == division]
+    opponent_scores = sorted(scores.get(row['opponent'], 0) for row in own)
+    return {
+        'buchholz': sum(opponent_scores),
+        'median_buchholz': sum(opponent_scores[1:-1]) if len(opponent_scores) >= 3 else sum(opponent_scores),
+        'sonneborn_berger': sum(scores.get(row['opponent'], 0) * RESULT_FACTOR[row['result']] for row in own),
+        'direct_encounter': sum(MATCH_POINTS[row['result']] for row in own if row['opponent'] in tied_group and row['opponent'] != division),
+    }
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_incremental_tiebreaks_match_a_full_recomputation(seed):
+    rng = random.Random(seed)
+    divisions = ['A', 'B', 'C', 'D', 'E', 'F'][:rng.randint(3, 6)]
+    rows = random_rows(rng, divisions, rng.randint(1, 25))
+
+    table = TieBreakTable(MATCH_POINTS.get)
+    for row in rows:
+        table.add(row)
+
+    tied = rng.sample(divisions, 2)
+    for division in divisions + ['BYE']:
+        assert table.values(division, tied) == pytest.approx(from_scratch(rows, division, tied))
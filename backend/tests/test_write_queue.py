@@ -0,0 +1,178 @@
+import json
+import os
+
+import pytest
+
+from write_queue import WriteQueue, is_permanent_error
+
+
+class ApiError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f'HTTP {status_code}')
+        self.status_code = status_code
+
+
+class FakeSheets:
+    """Records calls; `fail` maps a predicate on the call to the error it raises"""
+
+    def __init__(self):
+        self.appends = []
+        self.batch_updates = []
+        self.fail = []
+
+    def _check(self, call):
+        for predicate, error in self.fail:
+            if predicate(call):
+                raise error
+
+    def append(self, range_name, rows):
+        self._check((range_name, rows))
+        self.appends.append((range_name, rows))
+
+    def batch_update(self, data):
+        self._check(data)
+        self.batch_updates.append(data)
+
+
+@pytest.fixture
+def sheets():
+    return FakeSheets()
+
+
+@pytest.fixture
+def make_queue(sheets, tmp_path):
+    def make():
+        return WriteQueue(sheets.append, sheets.batch_update, 10, str(tmp_path))
+    return make
+
+
+def read_lines(path):
+    with open(path) as journal:
+        return [json.loads(line) for line in journal if line.strip()]
+
+
+def test_coalesces_appends_per_range_and_merges_updates(sheets, make_queue):
+    queue = make_queue()
+    queue.append('Matches!A:H', [['chess', 'A']])
+    queue.update('Fixtures!G2:J2', [['completed', 'A', '', 'f1']])
+    queue.append('Fixtures!A:J', [['chess', 'A', 'B']])
+    queue.append('Matches!A:H', [['chess', 'B'], ['chess', 'C']])
+    queue.update('Fixtures!G2:J2', [['completed', 'B', '', 'f1']])
+
+    assert queue.flush()
+    assert sheets.appends == [
+        ('Matches!A:H', [['chess', 'A'], ['chess', 'B'], ['chess', 'C']]),
+        ('Fixtures!A:J', [['chess', 'A', 'B']]),
+    ]
+    assert sheets.batch_updates == [[('Fixtures!G2:J2', [['completed', 'B', '', 'f1']])]]
+    assert not queue.has_pending('Matches')
+    assert read_lines(queue.journal_path) == []
+
+
+def test_replays_own_journal(sheets, make_queue):
+    queue = make_queue()
+    queue.append('Matches!A:H', [['chess', 'A']])
+    # Simulate a restart with the same pid before the flush
+    queue._journal_lock.close()
+
+    restarted = make_queue()
+    assert restarted.has_pending('Matches')
+    assert restarted.flush()
+    assert sheets.appends == [('Matches!A:H', [['chess', 'A']])]
+
+
+def test_adopts_journal_of_exited_process(sheets, make_queue, tmp_path):
+    orphan = tmp_path / '999999.jsonl'
+    orphan.write_text(json.dumps({'op': 'append', 'range': 'Matches!A:H', 'values': [['chess', 'A']]}) + '\n{"torn')
+    (tmp_path / '999999.jsonl.lock').write_text('')
+
+    queue = make_queue()
+    assert not orphan.exists()
+    assert read_lines(queue.journal_path) == [{'op': 'append', 'range': 'Matches!A:H', 'values': [['chess', 'A']]}]
+    assert queue.flush()
+    assert sheets.appends == [('Matches!A:H', [['chess', 'A']])]
+
+
+def test_permanent_error_dead_letters_only_the_rejected_write(sheets, make_queue):
+    queue = make_queue()
+    sheets.fail.append((lambda call: call[0] == 'Matches!A:H' and any({'x': 1} in row for row in call[1]), ApiError(400)))
+    queue.append('Matches!A:H', [['chess', 'A']])
+    queue.append('Matches!A:H', [['chess', {'x': 1}]])
+    queue.append('Matches!A:H', [['chess', 'C']])
+    queue.append('Fixtures!A:J', [['chess', 'A', 'B']])
+
+    assert queue.flush()
+    assert sheets.appends == [
+        ('Matches!A:H', [['chess', 'A']]),
+        ('Matches!A:H', [['chess', 'C']]),
+        ('Fixtures!A:J', [['chess', 'A', 'B']]),
+    ]
+    dead = read_lines(queue.dead_letter_path)
+    assert [write['values'] for write in dead] == [[['chess', {'x': 1}]]]
+    assert dead[0]['error'] == 'HTTP 400'
+    assert not queue.has_pending('Matches')
+    assert read_lines(queue.journal_path) == []
+
+
+def test_transient_error_keeps_writes_and_backs_off(sheets, make_queue):
+    queue = make_queue()
+    sheets.fail.append((lambda call: True, ApiError(503)))
+    queue.append('Matches!A:H', [['chess', 'A']])
+    queue.update('Fixtures!G2:J2', [['completed']])
+
+    assert not queue.flush()
+    first_delay = queue.retry_at
+    assert queue.has_pending('Matches') and queue.has_pending('Fixtures')
+    assert len(read_lines(queue.journal_path)) == 2
+    assert not os.path.exists(queue.dead_letter_path)
+
+    # Inside the backoff window nothing is sent
+    sheets.fail.clear()
+    queue.append('Matches!A:H', [['chess', 'B']])
+    assert not queue.flush()
+    assert sheets.appends == []
+
+    queue.retry_at = 0
+    sheets.fail.append((lambda call: True, ApiError(429)))
+    assert not queue.flush()
+    assert queue._failures == 2
+    assert queue.retry_at - first_delay > 0
+
+    queue.retry_at = 0
+    sheets.fail.clear()
+    assert queue.flush()
+    # Retried writes keep their place ahead of newer ones
+    assert sheets.appends == [('Matches!A:H', [['chess', 'A'], ['chess', 'B']])]
+    assert sheets.batch_updates == [[('Fixtures!G2:J2', [['completed']])]]
+    assert queue._failures == 0
+
+
+def test_error_classification():
+    assert is_permanent_error(ApiError(400))
+    assert is_permanent_error(ApiError(404))
+    assert not is_permanent_error(ApiError(429))
+    assert not is_permanent_error(ApiError(408))
+    assert not is_permanent_error(ApiError(500))
+    assert not is_permanent_error(ConnectionError('reset'))
+
+
+class Crash(BaseException):
+    """Stands in for the process dying mid-flush"""
+
+
+def test_sent_groups_leave_the_journal_before_the_flush_ends(sheets, make_queue):
+    queue = make_queue()
+    sheets.fail.append((lambda call: call[0] == 'Fixtures!A:J', Crash()))
+    queue.append('Matches!A:H', [['chess', 'A']])
+    queue.append('Fixtures!A:J', [['chess', 'A', 'B']])
+
+    with pytest.raises(Crash):
+        queue.flush()
+    assert sheets.appends == [('Matches!A:H', [['chess', 'A']])]
+    assert read_lines(queue.journal_path) == [{'op': 'append', 'range': 'Fixtures!A:J', 'values': [['chess', 'A', 'B']]}]
+
+    # After a restart only the unsent append is replayed
+    queue._journal_lock.close()
+    sheets.fail.clear()
+    assert make_queue().flush()
+    assert sheets.appends == [('Matches!A:H', [['chess', 'A']]), ('Fixtures!A:J', [['chess', 'A', 'B']])]
@@ -0,0 +1,113 @@
+"""
+Tie-break computation (Buchholz, Median-Buchholz, Sonneborn-Berger, direct encounter)
+"""
+
+# Share of the opponent's score credited to Sonneborn-Berger per result
+RESULT_FACTOR = {'win': 1.0, 'draw': 0.5, 'loss': 0.0}
+
+
+class TieBreakTable:
+    """
+    Opponent adjacency for one event, kept up to date one match row at a time.
+
+    Buchholz (sum of opponents' scores) and Sonneborn-Berger (opponents'
+    scores weighted by the result against them) are maintained as running
+    sums: when a division's score changes, only the divisions that have
+    played it are adjusted. Median-Buchholz and direct encounter are
+    derived on read from a division's own games and the tied group, so no
+    request re-walks every opponent's history.
+
+    Args:
+        score_for_result: Callable(result) -> score gained, e.g. chess.calculate_match_points
+    """
+
+    def __init__(self, score_for_result):
+        self.score_for_result = score_for_result
+        self.scores = {}
+        self.games = {}      # division -> [(opponent, factor), ...]
+        self.against = {}    # division -> [(division that played it, that division's factor), ...]
+        self.buchholz = {}
+        self.sonneborn_berger = {}
+        self.head_to_head = {}  # (division, opponent) -> score gained in their games
+
+    def add(self, match):
+        """Apply one match row (from the perspective of match['team'])"""
+        team, opponent = match['team'], match['opponent']
+        result = match.get('result', '').lower()
+        factor = RESULT_FACTOR.get(result, 0.0)
+        gained = self.score_for_result(result)
+
+        for division in (team, opponent):
+            if division not in self.scores:
+                self.scores[division] = 0
+                self.games[division] = []
+                self.against[division] = []
+                self.buchholz[division] = 0
+                self.sonneborn_berger[division] = 0
+
+        # The new game credits the opponent's current score...
+        self.games[team].append((opponent, factor))
+        self.against[opponent].append((team, factor))
+        self.buchholz[team] += self.scores[opponent]
+        self.sonneborn_berger[team] += self.scores[opponent] * factor
+        self.head_to_head[(team, opponent)] = self.head_to_head.get((team, opponent), 0) + gained
+
+        # ...and the team's new score is credited to everyone who has played it
+        self.scores[team] += gained
+        for division, division_factor in self.against[team]:
+            self.buchholz[division] += gained
+            self.sonneborn_berger[division] += gained * division_factor
+
+    def median_buchholz(self, division):
+        """Buchholz without the highest and lowest opponent score (needs 3+ games)"""
+        opponent_scores = sorted(self.scores[opponent] for opponent, _ in self.games.get(division, []))
+        if len(opponent_scores) < 3:
+            return sum(opponent_scores)
+        return sum(opponent_scores[1:-1])
+
+    def direct_encounter(self, division, tied_group):
+        """Score gained against the other divisions of a tied group"""
+        return sum(self.head_to_head.get((division, other), 0) for other in tied_group if other != division)
+
+    def values(self, division, tied_group):
+        """All tie-break values for a division"""
+        return {
+            'buchholz': self.buchholz.get(division, 0),
+            'median_buchholz': self.median_buchholz(division),
+            'sonneborn_berger': self.sonneborn_berger.get(division, 0),
+            'direct_encounter': self.direct_encounter(division, tied_group),
+        }
+
+
+def rank_standings(standings, table, primary, order):
+    """
+    Sort standings by a primary key and then by tie-breaks
+
+    Args:
+        standings: List of standings rows ({'division': ..., primary: ...})
+        table: TieBreakTable for the event
+        primary: Key ranked first, e.g. 'match_points'
+        order: Tie-break keys in priority order; any standings key may be used
+
+    Returns:
+        New list of rows with tie-break values and a 'rank' (equal when
+        every criterion is equal), best first
+    """
+    groups = {}
+    for row in standings:
+        groups.setdefault(row[primary], []).append(row)
+
+    ranked = []
+    for score in sorted(groups, reverse=True):
+        group = groups[score]
+        tied = [row['division'] for row in group]
+        rows = [{**row, **table.values(row['division'], tied)} for row in group]
+        rows.sort(key=lambda row: (tuple(-row.get(key, 0) for key in order), row['division']))
+        ranked.extend(rows)
+
+    previous = None
+    for position, row in enumerate(ranked, start=1):
+        key = (row[primary],) + tuple(row.get(k, 0) for k in order)
+        row['rank'] = ranked[position - 2]['rank'] if key == previous else position
+        previous = key
+    return ranked
@@ -0,0 +1,301 @@
+"""
+Write-behind queue for Google Sheets writes
+"""
+
+import glob
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: journals are not shared between processes
+    fcntl = None
+
+# Writes the API rejected for good, kept for inspection (one JSON object per line)
+DEAD_LETTER_FILE = 'dead_letter.jsonl'
+
+# Longest wait between retries after transient errors, in seconds
+MAX_BACKOFF = 60.0
+
+
+def error_status(error):
+    """HTTP status of a googleapiclient HttpError, httpx HTTPStatusError or similar, else None"""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        response = getattr(error, 'resp', None) or getattr(error, 'response', None)
+        status = getattr(response, 'status', None) or getattr(response, 'status_code', None)
+    try:
+        return int(status)
+    except (TypeError, ValueError):
+        return None
+
+
+def is_permanent_error(error):
+    """Whether retrying can never succeed: a 4xx other than 408 (timeout) and 429 (quota)"""
+    status = error_status(error)
+    return status is not None and 400 <= status < 500 and status not in (408, 429)
+
+
+class WriteQueue:
+    """
+    Coalesces Sheets writes and flushes them every `interval_ms`.
+
+    Pending appends are grouped per range into one multi-row append and
+    pending updates are merged into a single values.batchUpdate (the last
+    write to a range wins). Writes the API rejects for good go to a
+    dead-letter journal instead of blocking the queue; transient failures
+    are retried with exponential backoff. Every queued write is journaled to disk before
+    it is acknowledged. Each process journals to its own locked file in
+    `journal_dir`; on startup, journals left behind by processes that are
+    no longer running are taken over and replayed, so writes survive a
+    restart that happens before the flush.
+
+    Args:
+        execute_append: Callable(range_name, rows) performing one append
+        execute_batch_update: Callable([(range_name, values), ...]) performing one batchUpdate
+        interval_ms: Flush interval in milliseconds
+        journal_dir: Directory holding the per-process journals
+        on_sent: Optional callable(sheet names) called after a flush wrote to those sheets
+    """
+
+    def __init__(self, execute_append, execute_batch_update, interval_ms, journal_dir, on_sent=None):
+        self.execute_append = execute_append
+        self.execute_batch_update = execute_batch_update
+        self.on_sent = on_sent
+        self.interval = interval_ms / 1000.0
+        self.journal_dir = journal_dir
+        self.journal_path = os.path.join(journal_dir, f'{os.getpid()}.jsonl')
+        self._pending = []  # [{'op': 'append'|'update', 'range': ..., 'values': [...]}]
+        self._in_flight = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.dead_letter_path = os.path.join(journal_dir, DEAD_LETTER_FILE)
+        self.retry_at = 0.0  # monotonic time before which flushes are skipped
+        self._failures = 0   # consecutive flushes that hit a transient error
+
+        os.makedirs(journal_dir, exist_ok=True)
+        self._journal_lock = open(f'{self.journal_path}.lock', 'w')
+        if fcntl:
+            fcntl.flock(self._journal_lock, fcntl.LOCK_EX)
+        self._replay_journals()
+
+    def start(self):
+        """Start the background flush thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='sheets-write-queue', daemon=True)
+            self._thread.start()
+        if self._pending:
+            self._wakeup.set()
+
+    def release_inherited(self):
+        """
+        Let go of a queue inherited across fork() without flushing or journaling it
+
+        The pending writes and the journal belong to the parent, which
+        flushes them; the child only closes its copy of the lock file.
+        """
+        self._journal_lock.close()
+
+    def append(self, range_name, rows):
+        """Queue rows to be appended to a range"""
+        self._enqueue({'op': 'append', 'range': range_name, 'values': rows})
+
+    def update(self, range_name, values):
+        """Queue an overwrite of a range"""
+        self._enqueue({'op': 'update', 'range': range_name, 'values': values})
+
+    def has_pending(self, sheet_name):
+        """Whether any unflushed (or currently flushing) write targets the given sheet"""
+        return bool(self.pending_writes(sheet_name))
+
+    def pending_writes(self, sheet_name):
+        """Unflushed (or currently flushing) writes to the given sheet, oldest first"""
+        prefix = f'{sheet_name}!'
+        with self._lock:
+            return [write for write in self._in_flight + self._pending if write['range'].startswith(prefix)]
+
+    def flush(self):
+        """
+        Send all pending writes to Google Sheets
+
+        Writes the API rejects for good (4xx other than 408/429) are moved to
+        the dead-letter journal and the rest are still sent. On a transient
+        error (429, 5xx, network) the unsent writes stay queued and further
+        flushes are skipped until `retry_at`, with the delay doubling on each
+        consecutive failure. Never raises.
+
+        Returns:
+            True if nothing is left pending, False if writes are waiting for a retry
+        """
+        with self._flush_lock:
+            if time.monotonic() < self.retry_at:
+                return False
+            with self._lock:
+                batch = self._in_flight = self._pending
+                self._pending = []
+            if not batch:
+                return True
+
+            appends = {}  # range -> [write, ...] in queue order
+            updates = {}  # range -> last write
+            for write in batch:
+                if write['op'] == 'append':
+                    appends.setdefault(write['range'], []).append(write)
+                else:
+                    updates[write['range']] = write
+
+            # Appends first: updates may target rows appended in the same batch.
+            # Each group: (writes to send, queued writes it settles, how to send them)
+            groups = [
+                (writes, writes, lambda writes, range_name=range_name: self.execute_append(
+                    range_name, [row for write in writes for row in write['values']]
+                ))
+                for range_name, writes in appends.items()
+            ]
+            if updates:
+                superseded = [write for write in batch if write['op'] == 'update']
+                groups.append((list(updates.values()), superseded, lambda writes: self.execute_batch_update(
+                    [(write['range'], write['values']) for write in writes]
+                )))
+
+            retry = []
+            for writes, settles, execute in groups:
+                if retry:
+                    # A transient error; don't spend more requests until the backoff passes
+                    retry.extend(writes)
+                    continue
+                retry = self._send(writes, execute)
+                # Drop what was sent from the journal right away, so a crash
+                # before the end of the flush cannot replay it
+                kept = {id(write) for write in retry}
+                done = {id(write) for write in settles if id(write) not in kept}
+                with self._lock:
+                    self._in_flight = [write for write in self._in_flight if id(write) not in done]
+                    self._write_journal()
+
+            with self._lock:
+                # Put back whatever was not written, ahead of newer writes
+                self._pending = retry + self._pending
+                self._in_flight = []
+                self._write_journal()
+
+            kept = {id(write) for write in retry}
+            sent = {write['range'].split('!')[0] for write in batch if id(write) not in kept}
+            if sent and self.on_sent:
+                self.on_sent(sent)
+
+            if retry:
+                self._failures += 1
+                self.retry_at = time.monotonic() + min(self.interval * 2 ** self._failures, MAX_BACKOFF)
+                return False
+            self._failures = 0
+            return True
+
+    def _send(self, writes, execute):
+        """
+        Send one coalesced group of writes
+
+        If the API rejects the group for good, its writes are sent one at a
+        time so only the offending ones are dead-lettered.
+
+        Returns:
+            Writes left to retry after a transient error ([] when done)
+        """
+        try:
+            execute(writes)
+            return []
+        except Exception as e:
+            if not is_permanent_error(e):
+                print(f"Sheets flush failed, will retry: {e}")
+                return writes
+            if len(writes) == 1:
+                self._dead_letter(writes[0], e)
+                return []
+
+        for index, write in enumerate(writes):
+            try:
+                execute([write])
+            except Exception as e:
+                if not is_permanent_error(e):
+                    print(f"Sheets flush failed, will retry: {e}")
+                    return writes[index:]
+                self._dead_letter(write, e)
+        return []
+
+    def _dead_letter(self, write, error):
+        """Set aside a write the API will never accept"""
+        print(f"Sheets rejected a write to {write['range']}, moved to {self.dead_letter_path}: {error}")
+        with open(self.dead_letter_path, 'a') as journal:
+            journal.write(json.dumps({**write, 'error': str(error), 'failed_at': time.strftime('%Y-%m-%dT%H:%M:%S')}) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def _enqueue(self, write):
+        with self._lock:
+            self._pending.append(write)
+            with open(self.journal_path, 'a') as journal:
+                journal.write(json.dumps(write) + '\n')
+                journal.flush()
+                os.fsync(journal.fileno())
+        self._wakeup.set()
+
+    def _write_journal(self):
+        """Rewrite the journal with the unsent writes (caller holds _lock)"""
+        tmp_path = f'{self.journal_path}.tmp'
+        with open(tmp_path, 'w') as journal:
+            for write in self._in_flight + self._pending:
+                journal.write(json.dumps(write) + '\n')
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(tmp_path, self.journal_path)
+
+    def _replay_journals(self):
+        """Adopt journals whose owning process has exited"""
+        # A previous process may have had our pid (e.g. pid 1 in a container)
+        if os.path.exists(self.journal_path):
+            self._pending.extend(self._read_journal(self.journal_path))
+
+        for lock_path in glob.glob(os.path.join(self.journal_dir, '*.jsonl.lock')):
+            path = lock_path[:-len('.lock')]
+            if path == self.journal_path:
+                continue
+            with open(lock_path, 'w') as lock:
+                if fcntl:
+                    try:
+                        fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except OSError:
+                        continue  # owner is still running
+                if os.path.exists(path):
+                    self._pending.extend(self._read_journal(path))
+                    os.remove(path)
+            os.remove(lock_path)
+
+        if self._pending:
+            print(f"Replaying {len(self._pending)} journaled Sheets writes")
+            with self._lock:
+                self._write_journal()
+
+    def _read_journal(self, path):
+        writes = []
+        with open(path) as journal:
+            for line in journal:
+                line = line.strip()
+                if line:
+                    try:
+                        writes.append(json.loads(line))
+                    except ValueError:
+                        # Torn last line from a crash mid-write; the write was never acknowledged
+                        break
+        return writes
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            time.sleep(max(self.interval, self.retry_at - time.monotonic()))  # coalesce, or back off
+            if not self.flush():
+                self._wakeup.set()
@@ -0,0 +1,26 @@
+"""
+WSGI entry point for production servers
+
+    gunicorn -c gunicorn.conf.py wsgi:application
+
+Importing this module builds the app and warms it up; with preload_app
+(the default in gunicorn.conf.py) that happens once in the master.
+"""
+
+import os
+
+from app import app, sheets, warm_up
+
+if os.getenv('WARM_UP', 'true').lower() == 'true':
+    try:
+        warm_up()
+    except Exception as e:
+        # Workers still start; they fill their caches on first use
+        print(f"Warm-up failed: {e}")
+
+application = app
+
+
+def after_fork():
+    """Called in each worker right after fork (gunicorn post_fork hook)"""
+    sheets.after_fork()